@@ -1095,8 +1095,10 @@ class MSDialect(default.DefaultDialect):
     ischema_names = ischema_names
 
     supports_native_boolean = False
+    supports_window_functions = True
     supports_unicode_binds = True
     postfetch_lastrowid = True
+    full_returning = True
 
     server_version_info = ()
 
@@ -31,6 +31,36 @@ been idle for eight hours or more.   To circumvent having this issue, use the
 
     engine = create_engine('mysql+mysqldb://...', pool_recycle=3600)
 
+.. _mysql_statement_timeouts:
+
+Statement Timeouts and Cancellation
+-----------------------------------
+
+The ``statement_timeout`` execution option is implemented for MySQL 5.7.8
+and above by adding a ``MAX_EXECUTION_TIME`` optimizer hint to each
+``SELECT`` statement executed::
+
+    result = conn.execution_options(statement_timeout=5).execute(stmt)
+
+    # emits:
+    # SELECT /*+ MAX_EXECUTION_TIME(5000) */ ...
+
+MySQL only applies this limit to read-only ``SELECT`` statements; other
+statements are executed unchanged.  For older versions of MySQL,
+``NotImplementedError`` is raised.
+
+MariaDB doesn't support the ``MAX_EXECUTION_TIME`` hint; for MariaDB 10.1.2
+and above, each statement is instead prefixed with
+``SET STATEMENT max_statement_time=<seconds> FOR``, which applies to
+statements of all kinds.  For older versions of MariaDB,
+``NotImplementedError`` is raised.
+
+:meth:`.Connection.cancel` emits ``KILL QUERY`` for the connection's
+thread id, using a second connection checked out from the same
+:class:`.Engine`.
+
+.. versionadded:: 0.9.0
+
 .. _mysql_storage_engines:
 
 Storage Engines
@@ -1283,6 +1313,9 @@ class MySQLCompiler(compiler.SQLCompiler):
     def visit_random_func(self, fn, **kw):
         return "rand%s" % self.function_argspec(fn)
 
+    def visit_empty_set_expr(self, type_):
+        return "SELECT 1 FROM DUAL WHERE 1!=1"
+
     def visit_utc_timestamp_func(self, fn, **kw):
         return "UTC_TIMESTAMP"
 
@@ -1898,6 +1931,7 @@ class MySQLDialect(default.DefaultDialect):
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
     supports_multivalues_insert = True
+    supports_row_value_comparison = True
 
     default_paramstyle = 'format'
     colspecs = colspecs
@@ -2015,6 +2049,57 @@ class MySQLDialect(default.DefaultDialect):
         else:
             return False
 
+    _select_re = re.compile(r'\s*SELECT\b', re.I | re.UNICODE)
+
+    @property
+    def _is_mariadb(self):
+        return self.server_version_info is not None and \
+                    'MariaDB' in self.server_version_info
+
+    @property
+    def _mariadb_normalized_version_info(self):
+        # some MariaDB versions report themselves as
+        # "5.5.5-10.1.2-MariaDB"; skip the compatibility prefix
+        if len(self.server_version_info) > 5:
+            return self.server_version_info[3:]
+        else:
+            return self.server_version_info
+
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        if self._is_mariadb:
+            if self._mariadb_normalized_version_info < (10, 1, 2):
+                raise NotImplementedError(
+                    "Statement timeouts require MariaDB 10.1.2 or greater")
+            return "SET STATEMENT max_statement_time=%s FOR %s" % (
+                        timeout, statement)
+        if self.server_version_info < (5, 7, 8):
+            raise NotImplementedError(
+                    "Statement timeouts require MySQL 5.7.8 or greater")
+        m = self._select_re.match(statement)
+        if m is None:
+            return statement
+        return "%s /*+ MAX_EXECUTION_TIME(%d) */%s" % (
+                    statement[:m.end()], timeout * 1000,
+                    statement[m.end():])
+
+    def reset_statement_timeout(self, cursor, context):
+        pass
+
+    def do_cancel(self, connection, dbapi_connection):
+        thread_id = self._connection_thread_id(dbapi_connection)
+        kill_conn = connection.engine.raw_connection()
+        try:
+            cursor = kill_conn.cursor()
+            try:
+                cursor.execute("KILL QUERY %d" % thread_id)
+            finally:
+                cursor.close()
+        finally:
+            kill_conn.close()
+
+    def _connection_thread_id(self, dbapi_connection):
+        return dbapi_connection.thread_id()
+
     def _compat_fetchall(self, rp, charset=None):
         """Proxy result rows to smooth over MySQL-Python driver
         inconsistencies."""
@@ -109,6 +109,9 @@ class MySQLDialect_mysqlconnector(MySQLDialect):
     def _extract_error_code(self, exception):
         return exception.errno
 
+    def _connection_thread_id(self, dbapi_connection):
+        return dbapi_connection.connection_id
+
     def is_disconnect(self, e, connection, cursor):
         errnos = (2006, 2013, 2014, 2045, 2055, 2048)
         exceptions = (self.dbapi.OperationalError, self.dbapi.InterfaceError)
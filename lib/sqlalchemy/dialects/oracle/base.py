@@ -733,6 +733,7 @@ class OracleDialect(default.DefaultDialect):
 
     supports_default_values = False
     supports_empty_insert = False
+    supports_window_functions = True
 
     statement_compiler = OracleCompiler
     ddl_compiler = OracleDDLCompiler
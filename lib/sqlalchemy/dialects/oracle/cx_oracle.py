@@ -201,6 +201,22 @@ a period "." as the decimal character.
 
 .. _OCI: http://www.oracle.com/technetwork/database/features/oci/index.html
 
+Statement Timeouts and Cancellation
+-----------------------------------
+
+The ``statement_timeout`` execution option sets the ``callTimeout``
+attribute of the cx_Oracle connection for the duration of the
+statement's execution, and resets it to zero (no timeout) afterwards.
+``callTimeout`` requires cx_Oracle 7.2 or greater; ``NotImplementedError``
+is raised for earlier versions.  Note that the timeout is applied by
+the client to each round trip to the database, rather than to the
+statement as a whole.
+
+:meth:`.Connection.cancel` makes use of the ``cancel()`` method of the
+cx_Oracle connection.
+
+.. versionadded:: 0.9.0
+
 """
 
 from __future__ import absolute_import
@@ -831,6 +847,19 @@ class OracleDialect_cx_oracle(OracleDialect):
         else:
             return False
 
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        if self.cx_oracle_ver < (7, 2):
+            raise NotImplementedError(
+                    "Statement timeouts require cx_Oracle 7.2 or greater")
+        cursor.connection.callTimeout = int(timeout * 1000)
+        return statement
+
+    def reset_statement_timeout(self, cursor, context):
+        cursor.connection.callTimeout = 0
+
+    def do_cancel(self, connection, dbapi_connection):
+        dbapi_connection.cancel()
+
     def create_xid(self):
         """create a two-phase transaction ID.
 
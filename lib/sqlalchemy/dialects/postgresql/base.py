@@ -1333,10 +1333,13 @@ class PGDialect(default.DefaultDialect):
     sequences_optional = True
     preexecute_autoincrement_sequences = True
     postfetch_lastrowid = False
+    full_returning = True
 
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_row_value_comparison = True
+    supports_window_functions = True
     default_paramstyle = 'pyformat'
     ischema_names = ischema_names
     colspecs = colspecs
@@ -72,6 +72,21 @@ The following DBAPI-specific options are respected when used with
   If ``None`` or not set, the ``server_side_cursors`` option of the
   :class:`.Engine` is used.
 
+* statement_timeout - Abort statements which run for longer than the given
+  number of seconds.  Postgresql's ``statement_timeout`` setting is
+  read with ``SHOW`` and then applied with ``SET`` on a separate cursor
+  before the statement is executed, and restored to its prior value
+  afterwards, so that a session-level timeout established by the
+  application is preserved; if the statement fails and leaves the
+  transaction in an aborted state, the setting is instead reverted by
+  the rollback which must follow.   A statement
+  which is aborted raises ``psycopg2.extensions.QueryCanceledError``.
+  The same error is raised for a statement aborted by
+  :meth:`.Connection.cancel`, which uses the ``cancel()`` method of
+  the psycopg2 connection.
+
+  .. versionadded:: 0.9.0
+
 Unicode
 -------
 
@@ -471,4 +486,39 @@ class PGDialect_psycopg2(PGDialect):
                     return True
         return False
 
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        context._prior_statement_timeout = self._set_pg_statement_timeout(
+                            cursor.connection, "%dms" % (timeout * 1000),
+                            return_prior=True)
+        return statement
+
+    def reset_statement_timeout(self, cursor, context):
+        dbapi_connection = cursor.connection
+        extensions = __import__('psycopg2.extensions').extensions
+        if dbapi_connection.get_transaction_status() != \
+                extensions.TRANSACTION_STATUS_INERROR:
+            self._set_pg_statement_timeout(
+                            dbapi_connection,
+                            context._prior_statement_timeout)
+
+    def _set_pg_statement_timeout(self, dbapi_connection, value,
+                                        return_prior=False):
+        # use a separate cursor, so that this works alongside
+        # named (server side) cursors and doesn't disturb
+        # the results of the statement itself
+        cursor = dbapi_connection.cursor()
+        try:
+            if return_prior:
+                cursor.execute("SHOW statement_timeout")
+                prior = cursor.fetchone()[0]
+            else:
+                prior = None
+            cursor.execute("SET statement_timeout TO %s", (value, ))
+            return prior
+        finally:
+            cursor.close()
+
+    def do_cancel(self, connection, dbapi_connection):
+        dbapi_connection.cancel()
+
 dialect = PGDialect_psycopg2
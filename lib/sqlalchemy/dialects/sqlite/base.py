@@ -580,6 +580,13 @@ class SQLiteExecutionContext(default.DefaultExecutionContext):
     def _preserve_raw_colnames(self):
         return self.execution_options.get("sqlite_raw_colnames", False)
 
+    def _result_metadata_key(self, description):
+        # the translation of column names below depends on
+        # the sqlite_raw_colnames option as well
+        return self._preserve_raw_colnames, \
+            super(SQLiteExecutionContext, self).\
+                _result_metadata_key(description)
+
     def _translate_colname(self, colname):
         # adjust for dotted column names.  SQLite
         # in the case of UNION may store col names as
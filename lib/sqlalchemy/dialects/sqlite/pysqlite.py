@@ -195,6 +195,29 @@ require unicode, however, so that non-``unicode`` values passed inadvertently
 will emit a warning.  Pysqlite will emit an error if a non-``unicode`` string
 is passed containing non-ASCII characters.
 
+.. _pysqlite_timeouts:
+
+Statement Timeouts and Cancellation
+-----------------------------------
+
+The ``statement_timeout`` execution option is implemented by installing
+a progress handler on the pysqlite connection for the duration of the
+``cursor.execute()`` call, which aborts the statement once the given
+number of seconds has passed; the statement fails with an
+``OperationalError`` reporting that it was interrupted.  The handler is
+consulted every 1000 virtual machine instructions.  Rows fetched after
+the ``execute()`` call has returned are not subject to the timeout.
+Note that this is unrelated to the ``timeout`` argument accepted by
+``sqlite3.connect()``, which controls how long to wait for a database
+lock::
+
+    result = conn.execution_options(statement_timeout=5).execute(stmt)
+
+:meth:`.Connection.cancel` calls the ``interrupt()`` method of the
+pysqlite connection, which may be invoked from another thread.
+
+.. versionadded:: 0.9.0
+
 .. _pysqlite_serializable:
 
 Serializable Transaction Isolation
@@ -228,6 +251,7 @@ from sqlalchemy import types as sqltypes
 from sqlalchemy import util
 
 import os
+import time
 
 
 class _SQLite_pysqliteTimeStamp(DATETIME):
@@ -332,4 +356,22 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
         return isinstance(e, self.dbapi.ProgrammingError) and \
                 "Cannot operate on a closed database." in str(e)
 
+    # number of SQLite virtual machine instructions between
+    # checks of the statement timeout
+    _progress_handler_interval = 1000
+
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        deadline = time.time() + timeout
+        cursor.connection.set_progress_handler(
+                            lambda: time.time() > deadline,
+                            self._progress_handler_interval)
+        return statement
+
+    def reset_statement_timeout(self, cursor, context):
+        cursor.connection.set_progress_handler(
+                            None, self._progress_handler_interval)
+
+    def do_cancel(self, connection, dbapi_connection):
+        dbapi_connection.interrupt()
+
 dialect = SQLiteDialect_pysqlite
@@ -201,6 +201,24 @@ class Connection(Connectable):
           of many DBAPIs.  The flag is currently understood only by the
           psycopg2 dialect.
 
+        :param statement_timeout: Available on: Connection, statement.
+          A number of seconds after which the database should abort
+          the statement, raising an error which is wrapped in the usual
+          :class:`.DBAPIError` subclass.  The timeout is set up
+          before each statement is executed and removed afterwards, so
+          that other statements run on the same DBAPI connection are
+          not affected.  The option is implemented by the
+          PostgreSQL (psycopg2), MySQL, SQLite and cx_Oracle dialects;
+          other dialects raise ``NotImplementedError``.  Each backend
+          applies it in its own way; see the dialect's documentation
+          for details.
+
+          .. versionadded:: 0.9.0
+
+          .. seealso::
+
+            :meth:`.Connection.cancel`
+
         """
         c = self._clone()
         c._execution_options = c._execution_options.union(opt)
@@ -585,6 +603,37 @@ class Connection(Connectable):
         self.__can_reconnect = False
         self.__transaction = None
 
+    def cancel(self):
+        """Cancel the statement currently being executed on this
+        :class:`.Connection`, if any.
+
+        This method is intended to be called from a thread other
+        than the one which is executing the statement; the statement
+        is aborted by the database, and the ``execute()`` call in
+        the executing thread raises the error reported by the DBAPI,
+        wrapped in the usual :class:`.DBAPIError` subclass.  If no
+        statement is in progress, the method has no effect.
+
+        The operation is implemented by the
+        PostgreSQL (psycopg2), MySQL, SQLite and cx_Oracle dialects;
+        other dialects raise ``NotImplementedError``.
+
+        .. versionadded:: 0.9.0
+
+        .. seealso::
+
+            :meth:`.ResultProxy.cancel`
+
+            The ``statement_timeout`` option of
+            :meth:`.Connection.execution_options`
+
+        """
+        try:
+            conn = self.__connection
+        except AttributeError:
+            return
+        self.dialect.do_cancel(self, conn.connection)
+
     def scalar(self, object, *multiparams, **params):
         """Executes and returns the first column of the first row.
 
@@ -837,34 +886,63 @@ class Connection(Connectable):
         if not context.executemany:
             parameters = parameters[0]
 
-        if self._has_events:
-            for fn in self.dispatch.before_cursor_execute:
-                statement, parameters = \
-                            fn(self, cursor, statement, parameters,
-                                        context, context.executemany)
+        # the timeout is established first, as the dialect may rewrite
+        # the statement; events and logging then see the statement
+        # which is actually executed
+        timeout = context.execution_options.get('statement_timeout')
+        if timeout is not None:
+            try:
+                statement = self.dialect.set_statement_timeout(
+                                    cursor,
+                                    statement,
+                                    timeout,
+                                    context)
+            except Exception as e:
+                self._handle_dbapi_exception(
+                                e,
+                                statement,
+                                parameters,
+                                cursor,
+                                context)
+
+        try:
+            if self._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = \
+                                fn(self, cursor, statement, parameters,
+                                            context, context.executemany)
+        except:
+            with util.safe_reraise():
+                if timeout is not None:
+                    self.dialect.reset_statement_timeout(cursor, context)
 
         if self._echo:
             self.engine.logger.info(statement)
             self.engine.logger.info("%r",
                     sql_util._repr_params(parameters, batches=10))
+
         try:
-            if context.executemany:
-                self.dialect.do_executemany(
-                                    cursor,
-                                    statement,
-                                    parameters,
-                                    context)
-            elif not parameters and context.no_parameters:
-                self.dialect.do_execute_no_params(
-                                    cursor,
-                                    statement,
-                                    context)
-            else:
-                self.dialect.do_execute(
-                                    cursor,
-                                    statement,
-                                    parameters,
-                                    context)
+            try:
+                if context.executemany:
+                    self.dialect.do_executemany(
+                                        cursor,
+                                        statement,
+                                        parameters,
+                                        context)
+                elif not parameters and context.no_parameters:
+                    self.dialect.do_execute_no_params(
+                                        cursor,
+                                        statement,
+                                        context)
+                else:
+                    self.dialect.do_execute(
+                                        cursor,
+                                        statement,
+                                        parameters,
+                                        context)
+            finally:
+                if timeout is not None:
+                    self.dialect.reset_statement_timeout(cursor, context)
         except Exception as e:
             self._handle_dbapi_exception(
                                 e,
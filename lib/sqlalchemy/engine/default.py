@@ -14,6 +14,7 @@ as the base class for their own corresponding classes.
 
 import re
 import random
+import operator
 from . import reflection, interfaces, result
 from ..sql import compiler, expression
 from .. import types as sqltypes
@@ -51,6 +52,7 @@ class DefaultDialect(interfaces.Dialect):
     preexecute_autoincrement_sequences = False
     postfetch_lastrowid = True
     implicit_returning = False
+    full_returning = False
 
     supports_right_nested_joins = True
 
@@ -96,6 +98,8 @@ class DefaultDialect(interfaces.Dialect):
     supports_default_values = False
     supports_empty_insert = True
     supports_multivalues_insert = False
+    supports_row_value_comparison = False
+    supports_window_functions = False
 
     server_version_info = None
 
@@ -359,6 +363,61 @@ class DefaultDialect(interfaces.Dialect):
 
         return "_sa_%032x" % random.randint(0, 2 ** 128)
 
+    def _parameter_converter(self, positiontup, processors):
+        """Return a callable which converts a dictionary of bind
+        parameter values, as produced by :meth:`.Compiled.construct_params`,
+        into the structure passed to the DBAPI's ``execute()`` method,
+        applying the given bind processors.
+
+        For a positional dialect, ``positiontup`` is the sequence of
+        parameter names in the order they appear in the statement.
+
+        """
+        if self.positional:
+            execute_sequence_format = self.execute_sequence_format
+            if not positiontup:
+                return lambda params: execute_sequence_format()
+            elif len(positiontup) == 1:
+                key, = positiontup
+                getter = lambda params: (params[key], )
+            else:
+                getter = operator.itemgetter(*positiontup)
+
+            procs = [processors.get(key) for key in positiontup]
+            if any(procs):
+                def convert(params):
+                    return execute_sequence_format([
+                                value if proc is None else proc(value)
+                                for proc, value in zip(procs, getter(params))
+                            ])
+                return convert
+            elif execute_sequence_format is tuple:
+                return getter
+            else:
+                return lambda params: execute_sequence_format(getter(params))
+        elif not self.supports_unicode_statements:
+            encoder = self._encoder
+
+            def convert(params):
+                return dict(
+                    (encoder(key)[0],
+                        processors[key](value) if key in processors
+                        else value)
+                    for key, value in params.items()
+                )
+            return convert
+        elif processors:
+            processors = list(processors.items())
+
+            def convert(params):
+                params = dict(params)
+                for key, proc in processors:
+                    params[key] = proc(params[key])
+                return params
+            return convert
+        else:
+            return dict
+
     def do_savepoint(self, connection, name):
         connection.execute(expression.SavepointClause(name))
 
@@ -380,6 +439,19 @@ class DefaultDialect(interfaces.Dialect):
     def is_disconnect(self, e, connection, cursor):
         return False
 
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        raise NotImplementedError(
+                "The %s dialect does not support statement timeouts" %
+                self.name)
+
+    def reset_statement_timeout(self, cursor, context):
+        pass
+
+    def do_cancel(self, connection, dbapi_connection):
+        raise NotImplementedError(
+                "The %s dialect does not support cancellation of "
+                "statements" % self.name)
+
     def reset_isolation_level(self, dbapi_conn):
         # default_isolation_level is read from the first connection
         # after the initial set of 'isolation_level', if any, so is
@@ -394,6 +466,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     isddl = False
     executemany = False
     result_map = None
+    _result_columns = None
+    _textual_ordered_columns = False
     compiled = None
     statement = None
     postfetch_cols = None
@@ -465,6 +539,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         # track collections used by ResultProxy to target and process results
 
         self.result_map = compiled.result_map
+        if compiled._ordered_columns:
+            self._result_columns = compiled._result_columns
+            self._textual_ordered_columns = \
+                                compiled._textual_ordered_columns
 
         self.unicode_statement = util.text_type(compiled)
         if not dialect.supports_unicode_statements:
@@ -498,43 +576,95 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             self.returning_cols = self.compiled.returning
             self.__process_defaults()
 
-        processors = compiled._bind_processors
+        if compiled.contains_expanding_parameters:
+            # copy processors for this case as they will be mutated
+            processors = dict(compiled._bind_processors)
+            positiontup = self._expand_in_parameters(compiled, processors)
+            convert = dialect._parameter_converter(positiontup, processors)
+        else:
+            convert = compiled._parameter_converter
 
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
-        parameters = []
-        if dialect.positional:
-            for compiled_params in self.compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
-                parameters.append(dialect.execute_sequence_format(param))
+        self.parameters = dialect.execute_sequence_format(
+                    [convert(compiled_params)
+                    for compiled_params in self.compiled_parameters])
+
+        return self
+
+    def _expand_in_parameters(self, compiled, processors):
+        """handle special 'expanding' parameters, IN tuples that are rendered
+        on a per-parameter basis for an otherwise fixed SQL statement string.
+
+        """
+        if self.executemany:
+            raise exc.InvalidRequestError(
+                "'expanding' parameters can't be used with "
+                "executemany()")
+
+        if compiled.positional and self.dialect.paramstyle == 'numeric':
+            raise NotImplementedError(
+                "'expanding' bind parameters not supported with "
+                "'numeric' paramstyle at this time.")
+
+        compiled_params = self.compiled_parameters[0]
+        if compiled.positional:
+            positiontup = []
         else:
-            encode = not dialect.supports_unicode_statements
-            for compiled_params in self.compiled_parameters:
-                param = {}
-                if encode:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[dialect._encoder(key)[0]] = \
-                                        processors[key](compiled_params[key])
-                        else:
-                            param[dialect._encoder(key)[0]] = \
-                                    compiled_params[key]
+            positiontup = None
+
+        replacement_expressions = {}
+        for name in (
+            compiled.positiontup if compiled.positional
+            else compiled.bind_names.values()
+        ):
+            parameter = compiled.binds[name]
+            if parameter.expanding:
+                if name in replacement_expressions:
+                    to_update = replacement_expressions[name][1]
                 else:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key] = processors[key](compiled_params[key])
-                        else:
-                            param[key] = compiled_params[key]
-                parameters.append(param)
-        self.parameters = dialect.execute_sequence_format(parameters)
+                    values = compiled_params.pop(name)
+                    to_update = [
+                        ("%s_%s" % (name, i), value)
+                        for i, value in enumerate(values, 1)
+                    ]
+                    if to_update:
+                        expr = ", ".join(
+                                    compiled.bindtemplate % {'name': key}
+                                    for key, value in to_update
+                                )
+                    else:
+                        expr = compiled.visit_empty_set_expr(parameter.type)
+                    replacement_expressions[name] = (expr, to_update)
+
+                    compiled_params.update(to_update)
+                    if name in processors:
+                        processor = processors.pop(name)
+                        processors.update(
+                            (key, processor)
+                            for key, value in to_update
+                        )
+                if compiled.positional:
+                    positiontup.extend(key for key, value in to_update)
+            elif compiled.positional:
+                positiontup.append(name)
+
+        def process_expanding(m):
+            return replacement_expressions[m.group(1)][0]
+
+        self.unicode_statement = re.sub(
+            r"\[EXPANDING_(\S+?)\]",
+            process_expanding,
+            self.unicode_statement
+        )
+        if not self.dialect.supports_unicode_statements:
+            self.statement = self.unicode_statement.encode(
+                                        self.dialect.encoding)
+        else:
+            self.statement = self.unicode_statement
 
-        return self
+        return positiontup
 
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
@@ -663,6 +793,15 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     def post_exec(self):
         pass
 
+    def _result_metadata_key(self, description):
+        """Return a value identifying the given cursor.description,
+        under which the :class:`.ResultMetaData` built from it may be
+        reused for subsequent executions of the same compiled
+        statement.
+
+        """
+        return tuple((rec[0], rec[1]) for rec in description)
+
     def get_result_processor(self, type_, colname, coltype):
         """Return a 'result processor' for a given type as present in
         cursor.description.
@@ -108,6 +108,13 @@ class Dialect(object):
       the "implicit" functionality is not used and inserted_primary_key
       will not be available.
 
+    full_returning
+      True if the dialect supports RETURNING or equivalent for
+      ``UPDATE`` and ``DELETE`` statements which affect any number of
+      rows.  The ORM uses this, when :attr:`.implicit_returning` is
+      also enabled, to locate the rows matched by a bulk update or
+      delete without a separate SELECT.
+
     dbapi_type_map
       A mapping of DB-API type objects present in this Dialect's
       DB-API implementation mapped to TypeEngine implementations used
@@ -148,6 +155,14 @@ class Dialect(object):
       This will prevent types.Boolean from generating a CHECK
       constraint when that type is used.
 
+    supports_row_value_comparison
+      Indicates if the dialect supports comparison of row values
+      using the ``<`` and ``>`` operators, e.g. ``(a, b) > (1, 2)``.
+
+    supports_window_functions
+      Indicates if the dialect supports window functions, i.e.
+      ``row_number() OVER (ORDER BY ...)``.
+
     """
 
     def create_connect_args(self, url):
@@ -611,6 +626,49 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def set_statement_timeout(self, cursor, statement, timeout, context):
+        """Arrange for the given statement to be aborted by the database
+        if it runs for longer than ``timeout`` seconds.
+
+        This is invoked just before the statement is executed on the
+        given cursor, when the ``timeout`` execution option is present.
+        The statement to be executed is returned, which the dialect
+        may modify, e.g. to include an optimizer hint.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def reset_statement_timeout(self, cursor, context):
+        """Revert the effects of :meth:`.Dialect.set_statement_timeout`
+        once the statement has been executed, whether or not it
+        succeeded.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def do_cancel(self, connection, dbapi_connection):
+        """Cancel the statement currently executing on the given
+        DBAPI connection, if any.
+
+        This is called by :meth:`.Connection.cancel`, typically from
+        a thread other than the one which is executing the statement.
+
+        :param connection: the :class:`.Connection` owning the
+         DBAPI connection.
+        :param dbapi_connection: the DBAPI connection.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
     def connect(self):
         """return a callable which sets up a newly created DBAPI connection.
 
@@ -185,6 +185,20 @@ class ResultMetaData(object):
         # high precedence key values.
         primary_keymap = {}
 
+        result_map = context.result_map
+        result_columns = context._result_columns
+
+        # when the columns rendered by the compiler line up one-to-one
+        # with those in cursor.description, and no two of them share
+        # a name, target them by position rather than by name.  each
+        # name is still checked against cursor.description, falling
+        # back to the name-based lookup on the first mismatch, unless
+        # the columns were given in order for a textual statement.
+        check_names = not context._textual_ordered_columns
+        by_position = bool(result_columns) and \
+                        len(result_columns) == len(metadata) and \
+                        len(result_columns) == len(result_map)
+
         for i, rec in enumerate(metadata):
             colname = rec[0]
             coltype = rec[1]
@@ -198,9 +212,16 @@ class ResultMetaData(object):
             if dialect.requires_name_normalize:
                 colname = dialect.normalize_name(colname)
 
-            if context.result_map:
+            if by_position and check_names and result_columns[i][0] != (
+                                colname if self.case_sensitive
+                                else colname.lower()):
+                by_position = False
+
+            if by_position:
+                name, obj, type_ = result_columns[i][1:]
+            elif result_map:
                 try:
-                    name, obj, type_ = context.result_map[colname
+                    name, obj, type_ = result_map[colname
                                                     if self.case_sensitive
                                                     else colname.lower()]
                 except KeyError:
@@ -251,10 +272,6 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
-        if parent._echo:
-            context.engine.logger.debug(
-                "Col %r", tuple(x[0] for x in metadata))
-
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                     "_translate_colname() now")
     def _set_keymap_synonym(self, name, origname):
@@ -324,6 +341,29 @@ class ResultMetaData(object):
         else:
             return self._key_fallback(key, False) is not None
 
+    def _position(self, key):
+        """Return the ``(index, processor)`` pair locating the given key
+        within the raw tuple of each row of this result, or ``None``
+        if it isn't present.
+
+        This allows a caller which fetches the same key from every row,
+        such as the ORM's column loaders, to resolve it once per result
+        rather than once per row.
+
+        """
+        try:
+            processor, obj, index = self._keymap[key]
+        except KeyError:
+            rec = self._key_fallback(key, False)
+            if rec is None:
+                return None
+            processor, obj, index = rec
+        if index is None:
+            raise exc.InvalidRequestError(
+                    "Ambiguous column name '%s' in result set! "
+                    "try 'use_labels' option on select statement." % key)
+        return index, processor
+
     def __getstate__(self):
         return {
             '_pickled_keymap': dict(
@@ -375,6 +415,10 @@ class ResultProxy(object):
     _can_close_connection = False
     _metadata = None
 
+    # whether the ResultMetaData may be shared with other results
+    # produced by the same Compiled object
+    _cache_metadata = True
+
     def __init__(self, context):
         self.context = context
         self.dialect = context.dialect
@@ -388,7 +432,21 @@ class ResultProxy(object):
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            self._metadata = ResultMetaData(self, metadata)
+            compiled = self.context.compiled
+            if compiled is not None and self._cache_metadata:
+                key = self.context._result_metadata_key(metadata)
+                cached = compiled._cached_metadata
+                if cached is not None and cached[0] == key:
+                    self._metadata = cached[1]
+                else:
+                    self._metadata = ResultMetaData(self, metadata)
+                    compiled._cached_metadata = (key, self._metadata)
+            else:
+                self._metadata = ResultMetaData(self, metadata)
+
+            if self._echo:
+                self.context.engine.logger.debug(
+                    "Col %r", tuple(x[0] for x in metadata))
 
     def keys(self):
         """Return the current set of string keys for rows."""
@@ -498,6 +556,18 @@ class ResultProxy(object):
 
         return self._saved_cursor.description
 
+    def cancel(self):
+        """Cancel the statement currently being executed on the
+        :class:`.Connection` which produced this :class:`.ResultProxy`.
+
+        This is a shortcut for :meth:`.Connection.cancel`; see that
+        method for details.
+
+        .. versionadded:: 0.9.0
+
+        """
+        self.connection.cancel()
+
     def close(self, _autoclose_connection=True):
         """Close this ResultProxy.
 
@@ -969,6 +1039,9 @@ class BufferedColumnResultProxy(ResultProxy):
 
     _process_row = BufferedColumnRow
 
+    # the metadata is modified below
+    _cache_metadata = False
+
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
         metadata = self._metadata
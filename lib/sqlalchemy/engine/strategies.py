@@ -16,7 +16,7 @@ New strategies can be added via new ``EngineStrategy`` classes.
 
 from operator import attrgetter
 
-from sqlalchemy.engine import base, threadlocal, url
+from sqlalchemy.engine import base, url
 from sqlalchemy import util, exc, event
 from sqlalchemy import pool as poollib
 
@@ -173,7 +173,13 @@ class ThreadLocalEngineStrategy(DefaultEngineStrategy):
     """Strategy for configuring an Engine with threadlocal behavior."""
 
     name = 'threadlocal'
-    engine_cls = threadlocal.TLEngine
+
+    @property
+    def engine_cls(self):
+        # the threadlocal module is only loaded when this strategy
+        # is used
+        from sqlalchemy.engine import threadlocal
+        return threadlocal.TLEngine
 
 ThreadLocalEngineStrategy()
 
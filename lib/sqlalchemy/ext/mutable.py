@@ -351,11 +351,60 @@ As with :class:`.Mutable`, the :class:`.MutableComposite` augments the
 pickling process of the parent's object-relational state so that the
 :meth:`.MutableBase._parents` collection is restored to all ``Point`` objects.
 
+.. _mutable_snapshots:
+
+Detecting Changes by Snapshot
+=============================
+
+The :class:`.Mutable` approach requires that the value be an instance
+of a type which reports its own changes, such as :class:`.MutableDict`;
+changes made within nested structures, such as a list inside of the
+dictionary, aren't seen by the outermost value and go undetected.
+
+For values which are large, deeply nested structures of plain Python
+objects, such as documents stored in a JSON column,
+:class:`.MutableSnapshot` offers an alternative.  Values are left
+as they are; instead, a compact snapshot of each value is taken when
+it is loaded, and the value is compared against this snapshot before
+the :class:`.Session` commits.  A value which no longer matches its
+snapshot is flagged as modified, and an UPDATE is emitted for it::
+
+    from sqlalchemy.ext.mutable import MutableSnapshot
+
+    class MyDataClass(Base):
+        __tablename__ = 'my_data'
+        id = Column(Integer, primary_key=True)
+        data = Column(MutableSnapshot.as_mutable(JSONEncodedDict))
+
+    >>> m1 = sess.query(MyDataClass).first()
+    >>> m1.data['items'][0]['value'] = 'bar'
+    >>> sess.commit()  # the UPDATE for m1.data is emitted
+
+By default, the snapshot is a SHA-1 digest of the value's pickled form,
+so that only a small string is retained per value; a subclass may
+override :meth:`.MutableSnapshot.snapshot` to use a more appropriate
+function for its values.
+
+Snapshots are kept with each :class:`.Session`, and are discarded
+when it's closed.  Values are compared for each object in the
+:class:`.Session` that has a snapshot, before each commit and before
+each flush, including an autoflush.  This comparison is the
+cost of not having the value report its own changes, and is
+proportional to the number and size of the values loaded into that
+:class:`.Session`; :class:`.Mutable` remains the more efficient choice
+for values which can track their own changes.
+
+.. versionadded:: 0.9.0
+
 """
 from ..orm.attributes import flag_modified
 from .. import event, types
-from ..orm import mapper, object_mapper, Mapper
+from ..orm import mapper, object_mapper, Mapper, Session
+from ..orm.session import _state_session
+from ..orm.base import instance_state
 from ..util import memoized_property
+from ..util import pickle
+import hashlib
 import weakref
 
 
@@ -636,3 +685,148 @@ class MutableDict(Mutable, dict):
 
     def __setstate__(self, state):
         self.update(state)
+
+
+class MutableSnapshot(object):
+    """Detect in-place changes to scalar values by comparing them against
+    a snapshot taken when the value was loaded.
+
+    See the example in :ref:`mutable_snapshots` for usage information.
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    @classmethod
+    def snapshot(cls, value):
+        """Return a snapshot of the given value.
+
+        Snapshots are compared using ``==``; a value whose snapshot
+        differs from the one taken when it was loaded is considered
+        to be modified.  By default, returns a SHA-1 digest of the
+        pickled value.
+
+        """
+        return hashlib.sha1(
+                    pickle.dumps(value, pickle.HIGHEST_PROTOCOL)).digest()
+
+    @classmethod
+    def _session_snapshots(cls, session):
+        """Return the dictionary of parent state->{attribute name:
+        (class, snapshot)} for the given :class:`.Session`.
+
+        The dictionary is kept on the session's identity map, so that
+        it's discarded along with the identity map when the session is
+        closed or cleared.
+
+        """
+        identity_map = session.identity_map
+        try:
+            return identity_map._mutable_snapshots
+        except AttributeError:
+            snapshots = identity_map._mutable_snapshots = \
+                                    weakref.WeakKeyDictionary()
+            return snapshots
+
+    @classmethod
+    def _take_snapshots(cls, state, key):
+        session = _state_session(state)
+        if session is None:
+            return
+        snapshots = cls._session_snapshots(session)
+        val = state.dict.get(key, None)
+        if val is not None:
+            snapshots.setdefault(state, {})[key] = cls, cls.snapshot(val)
+        elif state in snapshots:
+            snapshots[state].pop(key, None)
+
+    @classmethod
+    def _check_snapshots(cls, session, *arg):
+        snapshots = getattr(session.identity_map, '_mutable_snapshots', None)
+        if not snapshots:
+            return
+        for state, state_snapshots in list(snapshots.items()):
+            if state.session_id != session.hash_key:
+                # expunged from the session
+                del snapshots[state]
+                continue
+            for key, (snapshot_cls, snapshot) in \
+                    list(state_snapshots.items()):
+                if key in state.committed_state or key not in state.dict:
+                    continue
+                if snapshot_cls.snapshot(state.dict[key]) != snapshot:
+                    obj = state.obj()
+                    if obj is not None:
+                        flag_modified(obj, key)
+
+    @classmethod
+    def associate_with_attribute(cls, attribute):
+        """Establish snapshot comparison for the given mapped descriptor.
+
+        """
+        key = attribute.key
+        parent_cls = attribute.class_
+
+        def load(state, *args):
+            cls._take_snapshots(state, key)
+
+        def flushed(mapper, connection, target):
+            cls._take_snapshots(instance_state(target), key)
+
+        event.listen(parent_cls, 'load', load,
+            raw=True, propagate=True)
+        event.listen(parent_cls, 'refresh', load,
+            raw=True, propagate=True)
+        event.listen(parent_cls, 'after_insert', flushed,
+            propagate=True)
+        event.listen(parent_cls, 'after_update', flushed,
+            propagate=True)
+
+        # compare ahead of the check for pending changes in
+        # Session.flush(), so that a flush of an otherwise clean
+        # session still emits the UPDATE
+        if MutableSnapshot._check_snapshots not in Session._pre_flush_hooks:
+            Session._pre_flush_hooks += (MutableSnapshot._check_snapshots, )
+        if not event.contains(Session, 'before_commit',
+                                MutableSnapshot._check_snapshots):
+            event.listen(Session, 'before_commit',
+                                MutableSnapshot._check_snapshots)
+
+    @classmethod
+    def associate_with(cls, sqltype):
+        """Establish snapshot comparison for all future mapped columns
+        of the given type.
+
+        .. warning::
+
+           As with :meth:`.Mutable.associate_with`, the listeners
+           established by this method are *global* to all mappers.
+
+        """
+
+        def listen_for_type(mapper, class_):
+            for prop in mapper.column_attrs:
+                if isinstance(prop.columns[0].type, sqltype):
+                    cls.associate_with_attribute(getattr(class_, prop.key))
+
+        event.listen(mapper, 'mapper_configured', listen_for_type)
+
+    @classmethod
+    def as_mutable(cls, sqltype):
+        """Establish snapshot comparison for mapped columns which use
+        the given type instance.
+
+        As with :meth:`.Mutable.as_mutable`, the type is returned,
+        unconditionally as an instance.
+
+        """
+        sqltype = types.to_instance(sqltype)
+
+        def listen_for_type(mapper, class_):
+            for prop in mapper.column_attrs:
+                if prop.columns[0].type is sqltype:
+                    cls.associate_with_attribute(getattr(class_, prop.key))
+
+        event.listen(mapper, 'mapper_configured', listen_for_type)
+
+        return sqltype
@@ -227,6 +227,8 @@ undefer_group = strategy_options.undefer_group._unbound_fn
 load_only = strategy_options.load_only._unbound_fn
 lazyload = strategy_options.lazyload._unbound_fn
 lazyload_all = strategy_options.lazyload_all._unbound_all_fn
+batchload = strategy_options.batchload._unbound_fn
+raiseload = strategy_options.raiseload._unbound_fn
 subqueryload = strategy_options.subqueryload._unbound_fn
 subqueryload_all = strategy_options.subqueryload_all._unbound_all_fn
 immediateload = strategy_options.immediateload._unbound_fn
@@ -874,6 +874,35 @@ class CollectionAttributeImpl(AttributeImpl):
 
         return value
 
+    def fire_append_events(self, state, dict_, values, initiator):
+        """Fire append events for a series of values.
+
+        Produces an iterator which yields each value, as returned by
+        the event listeners, after its events have run; the caller
+        adds each value to the collection as it is received.  Listeners
+        and parent tracking run once per value as with
+        :meth:`.fire_append_event`, however the modified event is
+        recorded only once for the whole series.
+
+        """
+        listeners = self.dispatch.append
+        initiator = initiator or self._append_token
+        trackparent = self.trackparent
+        modified = False
+
+        for value in values:
+            for fn in listeners:
+                value = fn(state, value, initiator)
+
+            if not modified:
+                state._modified_event(dict_, self, NEVER_SET, True)
+                modified = True
+
+            if trackparent and value is not None:
+                self.sethasparent(instance_state(value), state, True)
+
+            yield value
+
     def fire_pre_remove_event(self, state, dict_, initiator):
         state._modified_event(dict_, self, NEVER_SET, True)
 
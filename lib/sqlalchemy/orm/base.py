@@ -327,7 +327,7 @@ def _inspect_mapped_class(class_, configure=False):
             return None
         mapper = class_manager.mapper
         if configure and mapper._new_mappers:
-            mapper._configure_all()
+            mapper._check_configure()
         return mapper
 
     except exc.NO_STATE:
@@ -650,6 +650,13 @@ class CollectionAdapter(object):
 
         self._data()._sa_appender(item, _sa_initiator=initiator)
 
+    def append_multiple_with_event(self, items, initiator=None):
+        """Add entities to the collection, firing mutation events."""
+
+        appender = self._data()._sa_appender
+        for item in self.fire_append_events(items, initiator):
+            appender(item, _sa_initiator=False)
+
     def append_without_event(self, item):
         """Add or restore an entity to the collection, firing no events."""
         self._data()._sa_appender(item, _sa_initiator=False)
@@ -715,6 +722,25 @@ class CollectionAdapter(object):
         else:
             return item
 
+    def fire_append_events(self, items, initiator=None):
+        """Notify that a series of entities are entering the collection.
+
+        Returns an iterator which fires the append events for each
+        entity as it is consumed, yielding the entity to be added.  The
+        owner's modified event is recorded once for the whole series
+        rather than once per entity.
+
+        """
+        if initiator is not False:
+            if self.invalidated:
+                self._warn_invalidated()
+            return self.attr.fire_append_events(
+                                    self.owner_state,
+                                    self.owner_state.dict,
+                                    items, initiator)
+        else:
+            return iter(items)
+
     def fire_remove_event(self, item, initiator=None):
         """Notify that a entity has been removed from the collection.
 
@@ -783,11 +809,16 @@ def bulk_replace(values, existing_adapter, new_adapter):
     additions = idset(values or ()).difference(constants)
     removals = existing_idset.difference(constants)
 
-    for member in values or ():
+    # events for the additions are fired lazily, in the order the
+    # members are appended
+    added = new_adapter.fire_append_events(
+                    member for member in values if member in additions)
+    appender = new_adapter.data._sa_appender
+    for member in values:
         if member in additions:
-            new_adapter.append_with_event(member)
+            appender(next(added), _sa_initiator=False)
         elif member in constants:
-            new_adapter.append_without_event(member)
+            appender(member, _sa_initiator=False)
 
     if existing_adapter:
         for member in removals:
@@ -1016,6 +1047,16 @@ def __set(collection, item, _sa_initiator=None):
     return item
 
 
+def __set_multiple(collection, items):
+    """Run set events for a series of items, yielding each in turn."""
+
+    executor = collection._sa_adapter
+    if executor:
+        return executor.fire_append_events(items)
+    else:
+        return items
+
+
 def __del(collection, item, _sa_initiator=None):
     """Run del events, may eventually be inlined into decorators."""
     if _sa_initiator is not False:
@@ -1137,8 +1178,8 @@ def _list_decorators():
 
     def extend(fn):
         def extend(self, iterable):
-            for value in iterable:
-                self.append(value)
+            for value in __set_multiple(self, iterable):
+                self.append(value, _sa_initiator=False)
         _tidy(extend)
         return extend
 
@@ -1146,8 +1187,8 @@ def _list_decorators():
         def __iadd__(self, iterable):
             # list.__iadd__ takes any iterable and seems to let TypeError raise
             # as-is instead of returning NotImplemented
-            for value in iterable:
-                self.append(value)
+            for value in __set_multiple(self, iterable):
+                self.append(value, _sa_initiator=False)
             return self
         _tidy(__iadd__)
         return __iadd__
@@ -1329,8 +1370,9 @@ def _set_decorators():
 
     def update(fn):
         def update(self, value):
-            for item in value:
-                self.add(item)
+            added = (item for item in value if item not in self)
+            for item in __set_multiple(self, added):
+                self.add(item, _sa_initiator=False)
         _tidy(update)
         return update
 
@@ -1338,8 +1380,9 @@ def _set_decorators():
         def __ior__(self, value):
             if not _set_binops_check_strict(self, value):
                 return NotImplemented
-            for item in value:
-                self.add(item)
+            added = (item for item in value if item not in self)
+            for item in __set_multiple(self, added):
+                self.add(item, _sa_initiator=False)
             return self
         _tidy(__ior__)
         return __ior__
@@ -11,13 +11,13 @@ basic add/delete mutation.
 
 """
 
-from .. import log, util, exc
+from .. import log, util, exc, sql
 from ..sql import operators
 from . import (
     attributes, object_session, util as orm_util, strategies,
     object_mapper, exc as orm_exc, properties
     )
-from .query import Query
+from .query import Query, _KeysetCriterion
 
 @log.class_logger
 @properties.RelationshipProperty.strategy_for(lazy="dynamic")
@@ -258,6 +258,107 @@ class AppenderMixin(object):
         else:
             return self._clone(sess).count()
 
+    def cached_count(self):
+        """Return the number of items in the collection, emitting
+        COUNT only if it isn't already known.
+
+        Unlike :meth:`.count`, the result is retained with the parent
+        object and returned again until the :class:`.Session` flushes,
+        its transaction ends, or the collection is appended to or
+        removed from.  Changes made to the table other than through
+        the :class:`.Session`'s flush, such as by :meth:`.Query.delete`
+        or another transaction, aren't seen until then.  When the
+        :class:`.Session` is in autocommit mode and no transaction is
+        in progress, COUNT is emitted each time.
+
+        """
+        sess = self.session
+        if sess is None or sess.transaction is None:
+            return self.count()
+
+        state = attributes.instance_state(self.instance)
+        history = state.committed_state.get(self.attr.key)
+        if history is not None and history.cached_count is not None and \
+                history.cached_count[0] == \
+                    (sess.transaction, sess._flush_count):
+            return history.cached_count[1]
+
+        # the COUNT may autoflush, which discards the parent's
+        # committed state; key the result on the session as it
+        # is after the COUNT is emitted
+        count = self._clone(sess).count()
+        if self.attr.key not in state.committed_state:
+            state.committed_state[self.attr.key] = \
+                                CollectionHistory(self.attr, state)
+        history = state.committed_state[self.attr.key]
+        history.cached_count = (sess.transaction, sess._flush_count), count
+        return count
+
+    def __contains__(self, item):
+        """Return True if the given object is a member of this
+        collection, using an EXISTS query rather than loading the
+        collection.
+
+        """
+        sess = self.session
+        history = self.attr._get_collection_history(
+                    attributes.instance_state(self.instance),
+                    attributes.PASSIVE_NO_INITIALIZE)
+        if item in history.added_items:
+            return True
+        elif sess is None or item in history.deleted_items:
+            return False
+
+        item_state = attributes.instance_state(item)
+        mapper = self.attr.target_mapper
+        if item_state.key is None or not item_state.mapper.isa(mapper):
+            return False
+
+        query = self._clone(sess).order_by(None).filter(
+                    sql.and_(*[
+                        col == value for col, value in
+                        zip(mapper.primary_key, item_state.key[1])
+                    ]))
+        return bool(sess.scalar(sql.select([query.exists()]), mapper=mapper))
+
+    def pages(self, page_size):
+        """Iterate through the collection in lists of up to
+        ``page_size`` objects.
+
+        Each page is loaded by its own SELECT, ordered by the primary
+        key of the target and limited to ``page_size`` rows; pages after
+        the first select rows whose primary key is greater than the
+        last one loaded, rather than using OFFSET, so that each page is
+        equally cheap to retrieve however far into the collection it
+        is.   The ``order_by`` configured on the relationship is not
+        used.
+
+        """
+        sess = self.session
+        if sess is None:
+            items = list(self.attr._get_collection_history(
+                attributes.instance_state(self.instance),
+                attributes.PASSIVE_NO_INITIALIZE).added_items)
+            for index in range(0, len(items), page_size):
+                yield items[index:index + page_size]
+            return
+
+        mapper = self.attr.target_mapper
+        query = self._clone(sess).order_by(None).\
+                        order_by(*mapper.primary_key)
+        page_query = query
+        while True:
+            page = page_query.limit(page_size).all()
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last = attributes.instance_state(page[-1]).key[1]
+            page_query = query.filter(
+                                _KeysetCriterion(mapper.primary_key, last,
+                                    [False] * len(last)))
+
     def _clone(self, sess=None):
         # note we're returning an entirely new Query class instance
         # here without any assignment capabilities; the class of this
@@ -324,6 +425,7 @@ class CollectionHistory(object):
             self.added_items = util.OrderedIdentitySet()
             self.unchanged_items = util.OrderedIdentitySet()
             self._reconcile_collection = False
+        self.cached_count = None
 
     @property
     def added_plus_unchanged(self):
@@ -353,9 +455,11 @@ class CollectionHistory(object):
         return list(self.added_items)[index]
 
     def add_added(self, value):
+        self.cached_count = None
         self.added_items.add(value)
 
     def add_removed(self, value):
+        self.cached_count = None
         if value in self.added_items:
             self.added_items.remove(value)
         else:
@@ -35,6 +35,20 @@ class IdentityMap(dict):
         del state._instance_dict
         self._modified.discard(state)
 
+    def _states_for_class(self, class_):
+        """Return the InstanceStates present whose identity key
+        is against the given class.
+
+        The class is the first element of the identity key, which is
+        the base class of the mapped inheritance hierarchy.  The states
+        are located by scanning the map when called, so that adding
+        and removing states doesn't pay for an index used only by
+        bulk operations.
+
+        """
+        return [state for state in self.all_states()
+                    if state.key[0] is class_]
+
     def _dirty_states(self):
         return self._modified
 
@@ -117,6 +131,9 @@ class WeakInstanceDict(IdentityMap):
                             "A conflicting state is already "
                             "present in the identity map for key %r"
                             % (key, ))
+                    # the existing object has been garbage collected
+                    # without its state having been discarded yet
+                    self._manage_removed_state(existing_state)
                 else:
                     return
             except KeyError:
@@ -363,7 +363,7 @@ class _SerializeManager(object):
                         "Python process!" %
                         self.class_)
         elif manager.is_mapped and not manager.mapper.configured:
-            manager.mapper._configure_all()
+            manager.mapper._check_configure()
 
         # setup _sa_instance_state ahead of time so that
         # unpickle events can access the object normally.
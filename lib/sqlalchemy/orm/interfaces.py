@@ -430,13 +430,9 @@ class StrategizedProperty(MapperProperty):
         # that the path is stated in terms of our base
         search_path = dict.__getitem__(path, self)
 
-        # search among: exact match, "attr.*", "default" strategy
-        # if any.
-        for path_key in (
-                        search_path._loader_key,
-                        search_path._wildcard_path_loader_key,
-                        search_path._default_path_loader_key
-                    ):
+        # search among: exact match, "attr.*", "attr.*" against
+        # a superclass entity, "default" strategy if any.
+        for path_key in search_path._context_loader_keys:
             if path_key in context.attributes:
                 load = context.attributes[path_key]
                 break
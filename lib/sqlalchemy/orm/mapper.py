@@ -34,6 +34,8 @@ import sys
 
 
 _mapper_registry = weakref.WeakKeyDictionary()
+_unconfigured_mappers = weakref.WeakKeyDictionary()
+_unindexed_mappers = weakref.WeakKeyDictionary()
 _already_compiling = False
 
 _memoized_configured_property = util.group_expirable_memoized_property()
@@ -85,6 +87,12 @@ class Mapper(_InspectionAttr):
 
     _new_mappers = False
 
+    # incremented each time a new mapper is constructed; a mapper
+    # which has been configured as of the current generation doesn't
+    # need to check for other mappers again.
+    _mapper_generation = 0
+    _configured_generation = None
+
     def __init__(self,
                  class_,
                  local_table=None,
@@ -598,6 +606,9 @@ class Mapper(_InspectionAttr):
             self._configure_polymorphic_setter()
             self._configure_pks()
             Mapper._new_mappers = True
+            Mapper._mapper_generation += 1
+            _unconfigured_mappers[self] = True
+            _unindexed_mappers[self] = True
             self._log("constructed")
             self._expire_memoizations()
         finally:
@@ -859,6 +870,10 @@ class Mapper(_InspectionAttr):
         # a set of all mappers which inherit from this one.
         self._inheriting_mappers = util.WeakSequence()
 
+        # base mappers which have a relationship to this mapper's
+        # hierarchy; maintained on the base mapper only.
+        self._incoming_mappers = set()
+
         if self.inherits:
             if isinstance(self.inherits, type):
                 self.inherits = class_mapper(self.inherits, configure=False)
@@ -1119,9 +1134,36 @@ class Mapper(_InspectionAttr):
         """
         configure_mappers()
 
+    def _check_configure(self):
+        """Configure this mapper, as well as those mappers which may
+        affect it, if not already done.
+
+        """
+        if Mapper._new_mappers and \
+                self._configured_generation != Mapper._mapper_generation:
+            _configure_mappers(self)
+
+    def _relationship_targets(self):
+        """Return the set of base mappers targeted by the
+        relationships on this mapper, or None if they can't be
+        determined yet.
+
+        """
+        targets = set()
+        for prop in self._props.values():
+            if isinstance(prop, properties.RelationshipProperty):
+                try:
+                    targets.add(prop.mapper.base_mapper)
+                except Exception:
+                    # leave it to configure to report the error
+                    return None
+        return targets
+
     def dispose(self):
         # Disable any attribute-based compilation.
         self.configured = True
+        _unconfigured_mappers.pop(self, None)
+        _unindexed_mappers.pop(self, None)
 
         if hasattr(self, '_configure_failed'):
             del self._configure_failed
@@ -1550,6 +1592,9 @@ class Mapper(_InspectionAttr):
 
         self._props[key] = prop
 
+        if isinstance(prop, properties.RelationshipProperty):
+            _unindexed_mappers[self] = True
+
         if not self.non_primary:
             prop.instrument_class(self)
 
@@ -1736,7 +1781,7 @@ class Mapper(_InspectionAttr):
         """
 
         if _configure_mappers and Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
 
         try:
             return self._props[key]
@@ -1754,7 +1799,7 @@ class Mapper(_InspectionAttr):
     def iterate_properties(self):
         """return an iterator of all MapperProperty objects."""
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return iter(self._props.values())
 
     def _mappers_from_spec(self, spec, selectable):
@@ -1828,7 +1873,7 @@ class Mapper(_InspectionAttr):
     @_memoized_configured_property
     def _with_polymorphic_mappers(self):
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         if not self.with_polymorphic:
             return []
         return self._mappers_from_spec(*self.with_polymorphic)
@@ -1846,6 +1891,15 @@ class Mapper(_InspectionAttr):
                             self._mappers_from_spec(spec, selectable),
                             False)
 
+    @_memoized_configured_property
+    def _polymorphic_adapter(self):
+        """A :class:`.ColumnAdapter` against the default "polymorphic"
+        selectable, shared among all queries against this mapper."""
+
+        return sql_util.ColumnAdapter(
+                            self._with_polymorphic_selectable,
+                            self._equivalent_columns)
+
     with_polymorphic_mappers = _with_polymorphic_mappers
     """The list of :class:`.Mapper` objects included in the
     default "polymorphic" query.
@@ -1935,7 +1989,7 @@ class Mapper(_InspectionAttr):
 
         """
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return util.ImmutableProperties(self._props)
 
     @util.memoized_property
@@ -2026,7 +2080,7 @@ class Mapper(_InspectionAttr):
 
     def _filter_properties(self, type_):
         if Mapper._new_mappers:
-            configure_mappers()
+            self._check_configure()
         return util.ImmutableProperties(util.OrderedDict(
             (k, v) for k, v in self._props.items()
             if isinstance(v, type_)
@@ -2407,6 +2461,14 @@ class Mapper(_InspectionAttr):
     def _compiled_cache(self):
         return util.LRUCache(self._compiled_cache_size)
 
+    @_memoized_configured_property
+    def _flush_order_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
+    @_memoized_configured_property
+    def _eager_adapter_cache(self):
+        return util.LRUCache(self._compiled_cache_size)
+
     @_memoized_configured_property
     def _sorted_tables(self):
         table_to_mapper = {}
@@ -2486,11 +2548,76 @@ def configure_mappers():
     This function can be called any number of times, but in
     most cases is handled internally.
 
+    .. versionchanged:: 0.9.0
+        When a mapper is used, such as when it's queried against or
+        when its class is first instantiated, only that mapper and the
+        mappers which may affect it are configured, rather than all
+        mappers.  These are the mappers in its inheritance hierarchy,
+        as well as those with a :func:`.relationship` to it, since
+        these may add a backref to it.  The target of a relationship
+        is configured once a query or loader path reaches it, and the
+        remaining mappers are configured when they are themselves used.
+        The :meth:`.MapperEvents.after_configured` event is emitted once
+        no unconfigured mappers remain.  Calling
+        :func:`.configure_mappers` explicitly continues to configure
+        all mappers.
+
     """
 
     if not Mapper._new_mappers:
         return
 
+    _configure_mappers(None)
+
+
+def _index_incoming_mappers():
+    """Record the relationships of newly constructed mappers on the
+    base mappers they target.
+
+    Mappers whose relationship targets can't be resolved yet remain
+    unindexed and are retried on the next call.
+
+    """
+    for mapper in list(_unindexed_mappers):
+        targets = mapper._relationship_targets()
+        if targets is None:
+            continue
+        base = mapper.base_mapper
+        for other in targets:
+            other._incoming_mappers.add(base)
+        del _unindexed_mappers[mapper]
+
+
+def _mappers_to_configure(target):
+    """Return the mappers which need to be configured in order for
+    ``target`` to be usable.
+
+    These are the mappers in the hierarchy of ``target``, along with
+    the hierarchies of those which have a relationship to it, since
+    these may establish a backref on it.  Mappers whose relationships
+    can't be resolved yet may affect any other, so they are brought
+    in as well.  The targets of relationships from these mappers are
+    left to be configured once a path reaches them.
+
+    """
+    _index_incoming_mappers()
+
+    base = target.base_mapper
+    bases = set(base._incoming_mappers)
+    bases.add(base)
+    bases.update(mapper.base_mapper for mapper in list(_unindexed_mappers))
+
+    return [mapper for base in bases
+                for mapper in base.self_and_descendants]
+
+
+def _configure_mappers(target):
+    """Configure mappers that have been constructed thus far.
+
+    If ``target`` is given, only the mappers which ``target`` depends
+    on are configured; otherwise all mappers are configured.
+
+    """
     _call_configured = None
     _CONFIGURE_MUTEX.acquire()
     try:
@@ -2504,11 +2631,19 @@ def configure_mappers():
             if not Mapper._new_mappers:
                 return
 
+            generation = Mapper._mapper_generation
+            if target is None:
+                mappers = list(_unconfigured_mappers)
+            elif target._configured_generation == generation:
+                return
+            else:
+                mappers = _mappers_to_configure(target)
+
             # initialize properties on all mappers
             # note that _mapper_registry is unordered, which
             # may randomly conceal/reveal issues related to
             # the order of mapper compilation
-            for mapper in list(_mapper_registry):
+            for mapper in mappers:
                 if getattr(mapper, '_configure_failed', False):
                     e = sa_exc.InvalidRequestError(
                             "One or more mappers failed to initialize - "
@@ -2523,14 +2658,26 @@ def configure_mappers():
                         mapper._expire_memoizations()
                         mapper.dispatch.mapper_configured(
                                 mapper, mapper.class_)
+                        _unconfigured_mappers.pop(mapper, None)
                         _call_configured = mapper
                     except:
                         exc = sys.exc_info()[1]
                         if not hasattr(exc, '_configure_failed'):
                             mapper._configure_failed = exc
                         raise
-
-            Mapper._new_mappers = False
+                # a mapper configured here only because it has a
+                # relationship to the target hasn't had the mappers
+                # with relationships to it configured in turn
+                if target is None or \
+                        mapper.base_mapper is target.base_mapper:
+                    mapper._configured_generation = generation
+
+            if not _unconfigured_mappers:
+                Mapper._new_mappers = False
+            else:
+                # after_configured() signals that all mappers are
+                # ready; don't emit it for a partial configure.
+                _call_configured = None
         finally:
             _already_compiling = False
     finally:
@@ -2610,7 +2757,7 @@ def _event_on_first_init(manager, cls):
     instrumenting_mapper = manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
         if Mapper._new_mappers:
-            configure_mappers()
+            instrumenting_mapper._check_configure()
 
 
 def _event_on_init(state, args, kwargs):
@@ -2625,7 +2772,7 @@ def _event_on_init(state, args, kwargs):
     instrumenting_mapper = state.manager.info.get(_INSTRUMENTOR)
     if instrumenting_mapper:
         if Mapper._new_mappers:
-            configure_mappers()
+            instrumenting_mapper._check_configure()
         if instrumenting_mapper._set_polymorphic_identity:
             instrumenting_mapper._set_polymorphic_identity(state)
 
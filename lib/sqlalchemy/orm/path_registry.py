@@ -178,6 +178,11 @@ class PropRegistry(PathRegistry):
         self.parent = parent
         self.path = parent.path + (prop,)
 
+        # mappers are configured on demand; the target of
+        # a relationship is configured once a path reaches it
+        if self.has_entity:
+            prop.mapper._check_configure()
+
     @util.memoized_property
     def has_entity(self):
         return hasattr(self.prop, "mapper")
@@ -199,6 +204,39 @@ class PropRegistry(PathRegistry):
                     ).path
                 )
 
+    @util.memoized_property
+    def _inherited_wildcard_path_loader_keys(self):
+        """Given a path (mapper B, prop X) where B inherits from A,
+        return the wildcard loader keys stated in terms of the
+        superclass, e.g. (mapper A, 'column:.*'), so that a wildcard
+        established against a base entity applies to subclass
+        properties as well.
+
+        """
+        entity = self.parent.entity
+        if entity.is_aliased_class:
+            if entity._base_alias is entity:
+                return ()
+            entities = [entity._base_alias]
+        else:
+            entities = [m for m in entity.iterate_to_root()
+                            if m is not entity]
+
+        token = "%s:%s" % (self.prop.strategy_wildcard_key, _WILDCARD_TOKEN)
+        return tuple(
+                    ("loader", self.parent.parent[e].token(token).path)
+                    for e in entities
+                )
+
+    @util.memoized_property
+    def _context_loader_keys(self):
+        """The loader keys to search for this path, in order of
+        precedence."""
+
+        return (self._loader_key, self._wildcard_path_loader_key) + \
+                    self._inherited_wildcard_path_loader_keys + \
+                    (self._default_path_loader_key, )
+
     @util.memoized_property
     def _default_path_loader_key(self):
         return ("loader",
@@ -314,10 +314,7 @@ def _collect_update_commands(base_mapper, uowtransaction,
                                     col)
 
                 prop = mapper._columntoproperty[col]
-                history = attributes.get_state_history(
-                    state, prop.key,
-                    attributes.PASSIVE_NO_INITIALIZE
-                )
+                history = _column_history(state, state_dict, prop.key)
                 if history.added:
                     params[col.key] = history.added[0]
                     hasdata = True
@@ -331,16 +328,13 @@ def _collect_update_commands(base_mapper, uowtransaction,
                         # in a different table than the one
                         # where the version_id_col is.
                         for prop in mapper._columntoproperty.values():
-                            history = attributes.get_state_history(
-                                    state, prop.key,
-                                    attributes.PASSIVE_NO_INITIALIZE)
+                            history = _column_history(
+                                        state, state_dict, prop.key)
                             if history.added:
                                 hasdata = True
             else:
                 prop = mapper._columntoproperty[col]
-                history = attributes.get_state_history(
-                                state, prop.key,
-                                attributes.PASSIVE_NO_INITIALIZE)
+                history = _column_history(state, state_dict, prop.key)
                 if history.added:
                     if isinstance(history.added[0],
                                     sql.ClauseElement):
@@ -396,6 +390,22 @@ def _collect_update_commands(base_mapper, uowtransaction,
     return update
 
 
+def _column_history(state, state_dict, key):
+    """Return the history of a column-based attribute within a flush.
+
+    An attribute which has not been changed since it was loaded has no
+    entry in ``committed_state``, and therefore no net change; a blank
+    history is returned for these without building a
+    :class:`.History` of the unchanged value.
+
+    """
+    if key not in state.committed_state:
+        return attributes.HISTORY_BLANK
+    return state.manager[key].impl.get_history(
+                            state, state_dict,
+                            attributes.PASSIVE_NO_INITIALIZE)
+
+
 def _collect_post_update_commands(base_mapper, uowtransaction, table,
                         states_to_update, post_update_cols):
     """Identify sets of values to use in UPDATE statements for a
@@ -420,9 +430,7 @@ def _collect_post_update_commands(base_mapper, uowtransaction, table,
 
             elif col in post_update_cols:
                 prop = mapper._columntoproperty[col]
-                history = attributes.get_state_history(
-                            state, prop.key,
-                            attributes.PASSIVE_NO_INITIALIZE)
+                history = _column_history(state, state.dict, prop.key)
                 if history.added:
                     value = history.added[0]
                     params[col.key] = value
@@ -888,6 +896,11 @@ class BulkUD(object):
     def _do_pre_synchronize(self):
         pass
 
+    def _execute_stmt(self, stmt):
+        self.result = self.query.session.execute(
+                            stmt, params=self.query._params)
+        self.rowcount = self.result.rowcount
+
     def _do_post_synchronize(self):
         pass
 
@@ -916,28 +929,57 @@ class BulkEvaluate(BulkUD):
                     "Could not evaluate current criteria in Python. "
                     "Specify 'fetch' or False for the "
                     "synchronize_session parameter.")
-        target_cls = query._mapper_zero().class_
+        target_mapper = query._mapper_zero()
+        target_cls = target_mapper.class_
 
+        # consider only the objects within the target's inheritance
+        # hierarchy before evaluating the criteria.
         #TODO: detect when the where clause is a trivial primary key match
-        self.matched_objects = [
-                            obj for (cls, pk), obj in
-                            query.session.identity_map.items()
-                            if issubclass(cls, target_cls) and
-                            eval_condition(obj)]
+        self.matched_objects = matched_objects = []
+        for state in query.session.identity_map._states_for_class(
+                                        target_mapper._identity_class):
+            obj = state.obj()
+            if obj is not None and issubclass(state.class_, target_cls) \
+                    and eval_condition(obj):
+                matched_objects.append(obj)
 
 
 class BulkFetch(BulkUD):
-    """BulkUD which does the 'fetch' method of session state resolution."""
+    """BulkUD which does the 'fetch' method of session state resolution.
+
+    Where the dialect supports RETURNING for UPDATE and DELETE, the
+    primary keys of the matched rows are returned by the statement
+    itself; otherwise they're loaded by a SELECT beforehand.
+
+    """
 
     def _do_pre_synchronize(self):
         query = self.query
         session = query.session
+        dialect = session.get_bind(clause=self.primary_table).dialect
+        self.use_returning = dialect.full_returning and \
+                                dialect.implicit_returning and \
+                                self.primary_table.implicit_returning
+        if self.use_returning:
+            return
+
         select_stmt = self.context.statement.with_only_columns(
                                             self.primary_table.primary_key)
         self.matched_rows = session.execute(
                                     select_stmt,
                                     params=query._params).fetchall()
 
+    def _execute_stmt(self, stmt):
+        if self.use_returning:
+            stmt = stmt.returning(*self.primary_table.primary_key)
+            super(BulkFetch, self)._execute_stmt(stmt)
+            self.matched_rows = self.result.fetchall()
+            # the DBAPI's rowcount isn't reliable for all drivers
+            # when rows are returned; each matched row is returned once
+            self.rowcount = len(self.matched_rows)
+        else:
+            super(BulkFetch, self)._execute_stmt(stmt)
+
 
 class BulkUpdate(BulkUD):
     """BulkUD which handles UPDATEs."""
@@ -958,10 +1000,7 @@ class BulkUpdate(BulkUD):
     def _do_exec(self):
         update_stmt = sql.update(self.primary_table,
                             self.context.whereclause, self.values)
-
-        self.result = self.query.session.execute(
-                            update_stmt, params=self.query._params)
-        self.rowcount = self.result.rowcount
+        self._execute_stmt(update_stmt)
 
     def _do_post(self):
         session = self.query.session
@@ -986,10 +1025,7 @@ class BulkDelete(BulkUD):
     def _do_exec(self):
         delete_stmt = sql.delete(self.primary_table,
                                     self.context.whereclause)
-
-        self.result = self.query.session.execute(delete_stmt,
-                                    params=self.query._params)
-        self.rowcount = self.result.rowcount
+        self._execute_stmt(delete_stmt)
 
     def _do_post(self):
         session = self.query.session
@@ -61,6 +61,15 @@ class ColumnProperty(StrategizedProperty):
 
           .. versionadded:: 0.6.6
 
+        :param batch=False:
+          When ``True`` along with ``deferred=True``, the deferred load
+          of this attribute is performed for all objects which were loaded
+          by the same :class:`.Query` result at once, using a single
+          SELECT against their primary keys, rather than emitting one
+          SELECT per object.  See :ref:`deferred_batch`.
+
+          .. versionadded:: 0.9.0
+
         :param comparator_factory: a class which extends
            :class:`.ColumnProperty.Comparator` which provides custom SQL clause
            generation for comparison operations.
@@ -113,6 +122,7 @@ class ColumnProperty(StrategizedProperty):
                             for c in columns]
         self.group = kwargs.pop('group', None)
         self.deferred = kwargs.pop('deferred', False)
+        self.batch = kwargs.pop('batch', False)
         self.instrument = kwargs.pop('_instrument', True)
         self.comparator_factory = kwargs.pop('comparator_factory',
                                             self.__class__.Comparator)
@@ -19,6 +19,10 @@ database to return iterable result sets.
 """
 
 from itertools import chain
+import base64
+import datetime
+import decimal
+import json
 
 from . import (
     attributes, interfaces, object_mapper, persistence,
@@ -40,7 +44,7 @@ from ..sql.base import ColumnCollection
 from ..sql import operators
 from . import properties
 
-__all__ = ['Query', 'QueryContext', 'aliased']
+__all__ = ['Query', 'QueryContext', 'KeysetPage', 'aliased']
 
 
 _path_registry = PathRegistry.root
@@ -129,17 +133,11 @@ class Query(object):
                                             self._polymorphic_adapters:
                             self._mapper_loads_polymorphically_with(
                                 ext_info.mapper,
-                                sql_util.ColumnAdapter(
-                                        ext_info.selectable,
-                                        ext_info.mapper._equivalent_columns
-                                )
+                                ext_info.mapper._polymorphic_adapter
                             )
                         aliased_adapter = None
                     elif ext_info.is_aliased_class:
-                        aliased_adapter = sql_util.ColumnAdapter(
-                                    ext_info.selectable,
-                                    ext_info.mapper._equivalent_columns
-                                    )
+                        aliased_adapter = ext_info._column_adapter
                     else:
                         aliased_adapter = None
 
@@ -2179,6 +2177,220 @@ class Query(object):
         """
         self._offset = offset
 
+    def keyset_page(self, size, after=None, before=None):
+        """Return a page of results using keyset, or "seek", pagination.
+
+        Rather than skipping over the rows of earlier pages using
+        OFFSET, which becomes slower the further into the results the
+        page is, each page is located using criterion against the ORDER
+        BY columns of the query, relative to the row at the edge of the
+        neighboring page::
+
+            q = session.query(User).order_by(User.name, User.id)
+
+            page = q.keyset_page(20)
+            while True:
+                for user in page:
+                    print user.name
+                if page.next_cursor is None:
+                    break
+                page = q.keyset_page(20, after=page.next_cursor)
+
+        The ORDER BY columns, which may be ascending or descending, must
+        in combination be unique and not NULL for each row.  When they
+        all have the same direction and the dialect supports it, the
+        criterion is rendered as a row value comparison, such as
+        ``(users.name, users.id) > (:param_1, :param_2)``; otherwise, it
+        is rendered as the equivalent series of comparisons joined by
+        OR.
+
+        :param size: the maximum number of rows in the page.
+
+        :param after: a cursor, as given by
+         :attr:`.KeysetPage.next_cursor`, following which the page
+         is returned.
+
+        :param before: a cursor, as given by
+         :attr:`.KeysetPage.previous_cursor`, preceding which the page
+         is returned, so that results may be paged backwards.
+
+        :return: a :class:`.KeysetPage`, which is a list of results
+         along with the cursors locating the neighboring pages.
+
+        .. versionadded:: 0.9.0
+
+        """
+        if after is not None and before is not None:
+            raise sa_exc.ArgumentError(
+                    "Only one of 'after' or 'before' may be given")
+        if self._limit is not None or self._offset is not None:
+            raise sa_exc.InvalidRequestError(
+                    "Query.keyset_page() may not be called on a Query "
+                    "which has LIMIT or OFFSET applied")
+        if not self._order_by:
+            raise sa_exc.InvalidRequestError(
+                    "Query.keyset_page() requires ORDER BY")
+
+        cols = []
+        descending = []
+        for elem in self._order_by:
+            if isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier in (operators.desc_op, operators.asc_op):
+                descending.append(elem.modifier is operators.desc_op)
+                elem = elem.element
+            else:
+                descending.append(False)
+            cols.append(elem)
+
+        backwards = before is not None
+        if backwards:
+            descending = [not desc for desc in descending]
+
+        q = self.add_columns(*cols)
+        q._order_by = [col.desc() if desc else col.asc()
+                            for col, desc in zip(cols, descending)]
+
+        cursor = after if after is not None else before
+        if cursor is not None:
+            values = _decode_keyset_cursor(cursor)
+            if len(values) != len(cols):
+                raise sa_exc.ArgumentError(
+                        "Cursor %r does not match the ORDER BY of "
+                        "this Query" % cursor)
+            criterion = _KeysetCriterion(cols, values, descending)
+            if q._criterion is not None:
+                q._criterion = q._criterion & criterion
+            else:
+                q._criterion = criterion
+
+        rows = q.limit(size + 1).all()
+        more = len(rows) > size
+        del rows[size:]
+        if backwards:
+            rows.reverse()
+
+        n = len(cols)
+        if len(self._entities) == 1 and \
+                self._entities[0].supports_single_entity:
+            page = KeysetPage(row[0] for row in rows)
+        else:
+            page = KeysetPage(util.KeyedTuple(row[:-n], row._labels[:-n])
+                                for row in rows)
+        if rows:
+            first = _encode_keyset_cursor(rows[0][-n:])
+            last = _encode_keyset_cursor(rows[-1][-n:])
+            if backwards:
+                page.previous_cursor = first if more else None
+                page.next_cursor = last
+            else:
+                page.previous_cursor = first if after is not None else None
+                page.next_cursor = last if more else None
+        return page
+
+    def iterate_windows(self, size, column=None, expunge=False):
+        """Iterate through the results of this ``Query`` in lists of up
+        to ``size`` rows, each loaded by its own short SELECT.
+
+        The values of ``column``, by default the primary key of the
+        queried entity, are first divided into ranges, or "windows", of
+        ``size`` rows each; each window is then loaded by selecting the
+        rows which fall between its boundary values.  Unlike
+        :meth:`.Query.yield_per`, no cursor is held open across the
+        whole iteration, so that the :class:`.Session` may be committed
+        between windows and a long running batch job doesn't need to
+        keep one transaction open throughout::
+
+            for window in session.query(Widget).iterate_windows(
+                                                1000, expunge=True):
+                for widget in window:
+                    widget.processed = True
+                session.commit()
+
+        The window boundaries are computed up front, using the
+        ``row_number()`` window function on backends which support it,
+        and otherwise by a series of SELECTs which each locate the next
+        boundary ``size`` rows beyond the previous one.  As each window is
+        selected at the time it's reached, windows may contain more or
+        fewer than ``size`` rows if rows are inserted or deleted during
+        the iteration.
+
+        :param size: the number of rows per window.
+
+        :param column: the column on which the rows are divided, which
+         must be unique and not NULL for each row.  Defaults to the
+         primary key of the queried entity, which must consist of a
+         single column.
+
+        :param expunge: if True, :meth:`.Session.expunge_all` is called
+         before each window after the first, so that objects loaded by
+         earlier windows don't accumulate in the :class:`.Session`.
+         Note that changes which haven't been flushed by that point
+         are discarded.
+
+        .. versionadded:: 0.9.0
+
+        """
+        if self._limit is not None or self._offset is not None:
+            raise sa_exc.InvalidRequestError(
+                    "Query.iterate_windows() may not be called on a Query "
+                    "which has LIMIT or OFFSET applied")
+
+        if column is None:
+            if self._primary_entity is None:
+                raise sa_exc.ArgumentError(
+                        "A column must be given to iterate_windows() when "
+                        "the Query has no mapped entity")
+            entity = self._primary_entity.entity_zero
+            if len(entity.mapper.primary_key) != 1:
+                raise sa_exc.ArgumentError(
+                        "A column must be given to iterate_windows() "
+                        "when the primary key of %s consists of more "
+                        "than one column" % entity.mapper)
+            prop = entity.mapper._columntoproperty[
+                                    entity.mapper.primary_key[0]]
+            column = getattr(entity.entity, prop.key)
+
+        return self._iterate_windows(size, column, expunge)
+
+    def _iterate_windows(self, size, column, expunge):
+        boundaries = self._window_boundaries(size, column)
+        for index, start in enumerate(boundaries):
+            if index and expunge:
+                self.session.expunge_all()
+            window = self.filter(column >= start)
+            if index + 1 < len(boundaries):
+                window = window.filter(column < boundaries[index + 1])
+            yield window.all()
+
+    def _window_boundaries(self, size, column):
+        """Return the first value of ``column`` within each window of
+        ``size`` rows, in order."""
+
+        conn = self._connection_from_session(
+                        mapper=self._mapper_zero_or_none(),
+                        clause=self.statement)
+        if conn.dialect.supports_window_functions:
+            if self._autoflush:
+                self.session._autoflush()
+            rows = self.with_entities(
+                        column.label('value'),
+                        sql.func.row_number().over(order_by=column).
+                                                    label('rownum')
+                    ).order_by(None).subquery()
+            stmt = sql.select([rows.c.value]).\
+                        where((rows.c.rownum - 1) % size == 0).\
+                        order_by(rows.c.value)
+            return [row[0] for row in conn.execute(stmt)]
+        else:
+            q = self.with_entities(column).order_by(column)
+            boundaries = []
+            value = q.limit(1).scalar()
+            while value is not None:
+                boundaries.append(value)
+                value = q.filter(column > value).\
+                            offset(size - 1).limit(1).scalar()
+            return boundaries
+
     @_generative(_no_statement_condition)
     def distinct(self, *criterion):
         """Apply a ``DISTINCT`` to the query and return the newly resulting
@@ -2490,15 +2702,32 @@ class Query(object):
     def count(self):
         """Return a count of rows this Query would return.
 
-        This generates the SQL for this Query as follows::
+        When the Query selects only mapped entities and plain columns
+        and has no DISTINCT, GROUP BY, HAVING, LIMIT or OFFSET,
+        this generates the SQL for this Query as follows::
+
+            SELECT count(*) AS count_1 FROM <FROM clause of the query>
+            WHERE <criterion of the query>
 
-            SELECT count(1) AS count_1 FROM (
+        Otherwise, the Query is counted as a subquery::
+
+            SELECT count(*) AS count_1 FROM (
                 SELECT <rest of query follows...>
             ) AS anon_1
 
+        where the columns of a query with GROUP BY or HAVING are
+        replaced by a single constant, when the Query has no DISTINCT,
+        LIMIT or OFFSET.  In all cases,
+        eager loaders are not rendered, and ORDER BY is omitted
+        unless LIMIT or OFFSET are present.
+
         .. versionchanged:: 0.7
             The above scheme is newly refined as of 0.7b3.
 
+        .. versionchanged:: 0.9.0
+            The subquery is no longer rendered for Query objects
+            with no DISTINCT, GROUP BY, HAVING, LIMIT or OFFSET.
+
         For fine grained control over specific columns
         to count, to skip the usage of a subquery or
         otherwise control of the FROM clause,
@@ -2525,7 +2754,58 @@ class Query(object):
 
         """
         col = sql.func.count(sql.literal_column('*'))
-        return self.from_self(col).scalar()
+        if self._statement is not None:
+            return self.from_self(col).scalar()
+
+        q = self.enable_eagerloads(False)
+        if self._limit is None and self._offset is None:
+            q = q.order_by(None)
+
+        grouped = bool(self._group_by) or self._having is not None
+        if self._distinct or self._lockmode or \
+                self._limit is not None or self._offset is not None or \
+                not (grouped or self._selects_plain_columns):
+            return q.from_self(col).scalar()
+
+        # replace the columns clause, keeping the FROM objects which
+        # were derived from it
+        stmt = q._compile_context().statement
+        froms = stmt.froms
+        if grouped:
+            stmt = stmt.with_only_columns([sql.literal_column('1')])
+        else:
+            stmt = stmt.with_only_columns([col])
+        for fromclause in froms:
+            stmt = stmt.select_from(fromclause)
+        if grouped:
+            stmt = sql.select([col]).select_from(stmt.alias())
+
+        if self._autoflush:
+            self.session._autoflush()
+        conn = self._connection_from_session(
+                        mapper=self._mapper_zero_or_none(),
+                        clause=stmt,
+                        close_with_result=True)
+        return conn.execute(stmt, self._params).scalar()
+
+    @property
+    def _selects_plain_columns(self):
+        """Return True if each entity of this Query is a mapped
+        entity or a plain column, so that replacing the columns clause
+        won't change the number of rows returned."""
+
+        for ent in self._entities:
+            if isinstance(ent, _MapperEntity):
+                continue
+            elif isinstance(ent, _ColumnEntity):
+                column = ent.column
+                if isinstance(column, expression.Label):
+                    column = column.element
+                if isinstance(column, expression.ColumnClause) and \
+                        not column.is_literal:
+                    continue
+            return False
+        return True
 
     def delete(self, synchronize_session='evaluate'):
         """Perform a bulk delete query.
@@ -2546,10 +2826,13 @@ class Query(object):
             ``'fetch'`` - performs a select query before the delete to find
             objects that are matched by the delete query and need to be
             removed from the session. Matched objects are removed from the
-            session.
+            session.  On backends which support RETURNING for DELETE,
+            such as Postgresql and SQL Server, the primary keys of the
+            deleted rows are returned by the DELETE itself instead.
 
             ``'evaluate'`` - Evaluate the query's criteria in Python straight
-            on the objects in the session. If evaluation of the criteria isn't
+            on the objects in the session which are of the target entity's
+            class hierarchy. If evaluation of the criteria isn't
             implemented, an error is raised.  In that case you probably
             want to use the 'fetch' strategy as a fallback.
 
@@ -2616,10 +2899,14 @@ class Query(object):
 
             ``'fetch'`` - performs a select query before the update to find
             objects that are matched by the update query. The updated
-            attributes are expired on matched objects.
+            attributes are expired on matched objects.  On backends which
+            support RETURNING for UPDATE, such as Postgresql and SQL
+            Server, the primary keys of the updated rows are returned by
+            the UPDATE itself instead.
 
             ``'evaluate'`` - Evaluate the Query's criteria in Python straight
-            on the objects in the session. If evaluation of the criteria isn't
+            on the objects in the session which are of the target entity's
+            class hierarchy. If evaluation of the criteria isn't
             implemented, an exception is raised.
 
             The expression evaluator currently doesn't account for differing
@@ -3488,3 +3775,153 @@ class AliasOption(interfaces.MapperOption):
         else:
             alias = self.alias
         query._from_obj_alias = sql_util.ColumnAdapter(alias)
+
+
+class KeysetPage(list):
+    """A page of results returned by :meth:`.Query.keyset_page`.
+
+    This is a list of results, along with opaque cursors which are
+    passed back to :meth:`.Query.keyset_page` in order to retrieve
+    the neighboring pages.
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    next_cursor = None
+    """Cursor for the page following this one, to be passed as ``after``.
+
+    ``None`` if there are no further rows.
+
+    """
+
+    previous_cursor = None
+    """Cursor for the page preceding this one, to be passed as ``before``.
+
+    ``None`` if this is the first page.
+
+    """
+
+
+class _KeysetCriterion(expression.ColumnElement):
+    """Criterion selecting rows which follow the given values
+    of a series of ORDER BY columns.
+
+    Renders as a row value comparison when all columns share the same
+    direction and the dialect supports it, else as the expanded form
+    ``a > :a OR (a = :a AND b > :b) ...``.
+
+    """
+
+    __visit_name__ = 'keyset_criterion'
+
+    def __init__(self, cols, values, descending):
+        comparisons = [operators.lt if desc else operators.gt
+                                for desc in descending]
+
+        clauses = []
+        for index, (col, value) in enumerate(zip(cols, values)):
+            clauses.append(sql.and_(*[
+                            c == v for c, v in
+                            zip(cols[:index], values[:index])
+                        ] + [comparisons[index](col, value)]))
+        self.expanded = sql.or_(*clauses).self_group()
+
+        if len(cols) > 1 and len(set(comparisons)) == 1:
+            self.row_value = comparisons[0](
+                        sql.tuple_(*cols),
+                        sql.tuple_(*[sql.literal(value, type_=col.type)
+                                    for col, value in zip(cols, values)]))
+        else:
+            self.row_value = None
+
+    def get_children(self, **kwargs):
+        if self.row_value is not None:
+            return self.row_value, self.expanded
+        else:
+            return self.expanded,
+
+    def _copy_internals(self, clone=expression._clone, **kw):
+        self.expanded = clone(self.expanded, **kw)
+        if self.row_value is not None:
+            self.row_value = clone(self.row_value, **kw)
+
+
+class _UTCOffset(datetime.tzinfo):
+    """A fixed offset from UTC, restored from a keyset cursor."""
+
+    def __init__(self, seconds):
+        self._offset = datetime.timedelta(seconds=seconds)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return None
+
+    def tzname(self, dt):
+        return None
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__,
+                            _total_seconds(self._offset))
+
+
+def _total_seconds(delta):
+    return delta.days * 86400 + delta.seconds
+
+
+def _encode_keyset_cursor(values):
+    def encode(value):
+        if isinstance(value, datetime.datetime):
+            fields = [value.year, value.month, value.day,
+                        value.hour, value.minute, value.second,
+                        value.microsecond]
+            offset = value.utcoffset()
+            if offset is not None:
+                fields.append(_total_seconds(offset))
+            return {'datetime': fields}
+        elif isinstance(value, datetime.date):
+            return {'date': [value.year, value.month, value.day]}
+        elif isinstance(value, datetime.time):
+            fields = [value.hour, value.minute, value.second,
+                        value.microsecond]
+            offset = value.utcoffset()
+            if offset is not None:
+                fields.append(_total_seconds(offset))
+            return {'time': fields}
+        elif isinstance(value, decimal.Decimal):
+            return {'decimal': str(value)}
+        else:
+            return value
+    cursor = json.dumps([encode(value) for value in values])
+    return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('ascii')
+
+
+def _decode_keyset_cursor(cursor):
+    def decode(value):
+        if isinstance(value, dict):
+            (type_, value), = value.items()
+            if type_ == 'datetime':
+                if len(value) > 7:
+                    value[7] = _UTCOffset(value[7])
+                return datetime.datetime(*value)
+            elif type_ == 'date':
+                return datetime.date(*value)
+            elif type_ == 'time':
+                if len(value) > 4:
+                    value[4] = _UTCOffset(value[4])
+                return datetime.time(*value)
+            elif type_ == 'decimal':
+                return decimal.Decimal(value)
+            else:
+                raise ValueError(type_)
+        else:
+            return value
+    try:
+        values = json.loads(
+                    base64.urlsafe_b64decode(
+                            cursor.encode('ascii')).decode('utf-8'))
+        return [decode(value) for value in values]
+    except (ValueError, TypeError):
+        raise sa_exc.ArgumentError("Invalid keyset cursor %r" % cursor)
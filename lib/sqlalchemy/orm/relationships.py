@@ -396,6 +396,13 @@ class RelationshipProperty(StrategizedProperty):
 
             .. versionadded:: 0.6.5
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, for all objects which were loaded by the same
+            query at once, using a single SELECT with an IN clause against
+            the parent primary key.
+
+            .. versionadded:: 0.9.0
+
           * ``joined`` - items should be loaded "eagerly" in the same query as
             that of the parent, using a JOIN or LEFT OUTER JOIN.  Whether
             the join is "outer" or not is determined by the ``innerjoin``
@@ -409,6 +416,14 @@ class RelationshipProperty(StrategizedProperty):
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
 
+          * ``raise`` - an error should be raised when the attribute would
+            otherwise be loaded using SQL.  Many-to-one loads which can be
+            satisfied from the identity map, as well as loads performed by
+            the unit of work during a flush, proceed normally.  This is used
+            to guard against unexpected lazy loads.
+
+            .. versionadded:: 0.9.0
+
           * ``dynamic`` - the attribute will return a pre-configured
             :class:`~sqlalchemy.orm.query.Query` object for all read
             operations, onto which further filtering operations can be
@@ -1122,7 +1137,7 @@ class RelationshipProperty(StrategizedProperty):
         @util.memoized_property
         def property(self):
             if mapperlib.Mapper._new_mappers:
-                mapperlib.Mapper._configure_all()
+                self.prop.parent._check_configure()
             return self.prop
 
     def compare(self, op, value,
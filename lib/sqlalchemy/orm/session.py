@@ -23,8 +23,11 @@ from .base import (
 from .unitofwork import UOWTransaction
 from . import state as statelib
 import sys
+import os
+import traceback
 
-__all__ = ['Session', 'SessionTransaction', 'SessionExtension', 'sessionmaker']
+__all__ = ['Session', 'SessionTransaction', 'SessionExtension',
+            'sessionmaker', 'LazyLoadStats']
 
 _sessions = weakref.WeakValueDictionary()
 """Weak-referencing dictionary of :class:`.Session` objects.
@@ -80,6 +83,74 @@ COMMITTED = util.symbol('COMMITTED')
 DEACTIVE = util.symbol('DEACTIVE')
 CLOSED = util.symbol('CLOSED')
 
+_sa_path = os.path.dirname(os.path.dirname(__file__))
+
+
+class LazyLoadStats(object):
+    """Counts the lazy loads emitted on behalf of a :class:`.Session`.
+
+    An instance is available via the :attr:`.Session.lazyload_stats`
+    attribute when the ``lazyload_warn_threshold`` argument is passed
+    to :class:`.Session`.  Loads are counted per relationship as well
+    as per relationship and calling stack, the latter consisting of the
+    innermost frames outside of SQLAlchemy itself.  A warning is emitted
+    the first time a single relationship lazy loads more than
+    ``threshold`` times within one unit of work; the counts are reset
+    after each flush which writes changes, when the outermost
+    transaction ends, when a transaction is begun on an ``autocommit``
+    :class:`.Session`, and when the :class:`.Session` is closed.
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    stack_depth = 5
+    """Number of non-SQLAlchemy frames which identify a calling stack."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = util.defaultdict(int)
+        self.stacks = util.defaultdict(int)
+
+    def reset(self):
+        """Reset all counts to zero."""
+
+        self.counts.clear()
+        self.stacks.clear()
+
+    def by_stack(self, prop):
+        """Return ``(stack, count)`` tuples for the given relationship,
+        most frequent first.
+
+        """
+        return sorted(
+                ((stack, count) for (p, stack), count
+                    in self.stacks.items() if p is prop),
+                key=lambda rec: rec[1], reverse=True)
+
+    def _record(self, prop):
+        stack = tuple(
+                    tuple(frame) for frame in traceback.extract_stack()
+                    if not frame[0].startswith(_sa_path) and
+                    not frame[0].startswith("<")
+                )[-self.stack_depth:]
+
+        self.counts[prop] += 1
+        self.stacks[(prop, stack)] += 1
+
+        if self.counts[prop] == self.threshold + 1:
+            if stack:
+                filename, lineno, name, line = stack[-1]
+                site = "; most recent call at %s:%d in %s()" % (
+                                                    filename, lineno, name)
+            else:
+                site = ""
+            util.warn(
+                "Relationship %s has lazy loaded more than %d times "
+                "within a single unit of work%s" % (
+                    prop, self.threshold, site))
+
+
 class SessionTransaction(object):
     """A :class:`.Session`-level transaction.
 
@@ -279,9 +350,19 @@ class SessionTransaction(object):
 
         assert not self.session._deleted
 
-        for s in self.session.identity_map.all_states():
-            if not dirty_only or s.modified or s in self._dirty:
-                s._expire(s.dict, self.session.identity_map._modified)
+        identity_map = self.session.identity_map
+        if dirty_only:
+            # only those states modified, or flushed within this
+            # transaction, need to be expired; locate them using the
+            # identity map's modified set rather than scanning every state
+            states = [s for s in
+                        set(identity_map._modified).union(self._dirty)
+                        if identity_map.contains_state(s)]
+        else:
+            states = identity_map.all_states()
+
+        for s in states:
+            s._expire(s.dict, identity_map._modified)
 
     def _remove_snapshot(self):
         assert self._is_transaction_boundary
@@ -437,6 +518,8 @@ class SessionTransaction(object):
                     connection.close()
                 else:
                     transaction.close()
+            if self.session.lazyload_stats is not None:
+                self.session.lazyload_stats.reset()
 
         self._state = CLOSED
         if self.session.dispatch.after_transaction_end:
@@ -486,7 +569,8 @@ class Session(_SessionClassMethods):
                  autocommit=False, twophase=False,
                  weak_identity_map=True, binds=None, extension=None,
                  info=None,
-                 query_cls=query.Query):
+                 query_cls=query.Query,
+                 lazyload_warn_threshold=None):
         """Construct a new Session.
 
         See also the :class:`.sessionmaker` function which is used to
@@ -582,6 +666,18 @@ class Session(_SessionClassMethods):
 
            .. versionadded:: 0.9.0
 
+        :param lazyload_warn_threshold: optional integer; when present,
+           lazy loads emitted by this :class:`.Session` are counted per
+           relationship and calling stack by a :class:`.LazyLoadStats`
+           object, available as :attr:`.Session.lazyload_stats`.  A warning
+           is emitted when the same relationship lazy loads more than
+           this many times within a single unit of work, that is between
+           flushes and within a transaction, which typically
+           indicates an "N+1" load pattern that should use eager
+           loading instead.
+
+           .. versionadded:: 0.9.0
+
         :param query_cls:  Class which should be used to create new Query
            objects, as returned by the ``query()`` method. Defaults to
            :class:`~sqlalchemy.orm.query.Query`.
@@ -615,6 +711,7 @@ class Session(_SessionClassMethods):
         self.bind = bind
         self.__binds = {}
         self._flushing = False
+        self._flush_count = 0
         self._warn_on_events = False
         self.transaction = None
         self.hash_key = _new_sessionid()
@@ -624,6 +721,8 @@ class Session(_SessionClassMethods):
         self._enable_transaction_accounting = _enable_transaction_accounting
         self.twophase = twophase
         self._query_cls = query_cls
+        if lazyload_warn_threshold is not None:
+            self.lazyload_stats = LazyLoadStats(lazyload_warn_threshold)
         if info:
             self.info.update(info)
 
@@ -651,6 +750,21 @@ class Session(_SessionClassMethods):
     transaction = None
     """The current active or inactive :class:`.SessionTransaction`."""
 
+    _pre_flush_hooks = ()
+    """Internal; callables invoked with the :class:`.Session` at the
+    start of each :meth:`.Session.flush`, before it's determined whether
+    there's anything to flush, so that extensions may mark objects as
+    modified."""
+
+    lazyload_stats = None
+    """The :class:`.LazyLoadStats` tracking lazy loads for this
+    :class:`.Session`, if the ``lazyload_warn_threshold`` argument
+    was given; otherwise ``None``.
+
+    .. versionadded:: 0.9.0
+
+    """
+
     @util.memoized_property
     def info(self):
         """A user-modifiable dictionary.
@@ -692,6 +806,8 @@ class Session(_SessionClassMethods):
                     "A transaction is already begun.  Use "
                     "subtransactions=True to allow subtransactions.")
         else:
+            if self.autocommit and self.lazyload_stats is not None:
+                self.lazyload_stats.reset()
             self.transaction = SessionTransaction(
                 self, nested=nested)
         return self.transaction  # needed for __enter__/__exit__ hook
@@ -997,6 +1113,8 @@ class Session(_SessionClassMethods):
         if self.transaction is not None:
             for transaction in self.transaction._iterate_parents():
                 transaction.close()
+        if self.lazyload_stats is not None:
+            self.lazyload_stats.reset()
 
     def expunge_all(self):
         """Remove all object instances from this ``Session``.
@@ -1855,6 +1973,9 @@ class Session(_SessionClassMethods):
         if self._flushing:
             raise sa_exc.InvalidRequestError("Session is already flushing")
 
+        for hook in self._pre_flush_hooks:
+            hook(self)
+
         if self._is_clean():
             return
         try:
@@ -1862,6 +1983,9 @@ class Session(_SessionClassMethods):
             self._flush(objects)
         finally:
             self._flushing = False
+        self._flush_count += 1
+        if self.lazyload_stats is not None:
+            self.lazyload_stats.reset()
 
     def _flush_warning(self, method):
         util.warn(
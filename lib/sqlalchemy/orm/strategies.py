@@ -8,7 +8,7 @@
    implementations, and related MapperOptions."""
 
 from .. import exc as sa_exc, inspect
-from .. import util, log, event
+from .. import sql, util, log, event
 from ..sql import util as sql_util, visitors
 from . import (
         attributes, interfaces, exc as orm_exc, loading,
@@ -148,9 +148,26 @@ class ColumnLoader(LoaderStrategy):
         for col in self.columns:
             if adapter:
                 col = adapter.columns[col]
-            if col is not None and col in row:
-                def fetch_col(state, dict_, row):
-                    dict_[key] = row[col]
+            if col is None:
+                continue
+            if mapper.dispatch.translate_row:
+                # the row may be replaced with one of any layout
+                if col in row:
+                    def fetch_col(state, dict_, row):
+                        dict_[key] = row[col]
+                    return fetch_col, None, None
+                continue
+            position = row._parent._position(col)
+            if position is not None:
+                # fetch from the raw row by index, skipping the
+                # RowProxy's per-row lookup of the column
+                index, processor = position
+                if processor is None:
+                    def fetch_col(state, dict_, row):
+                        dict_[key] = row._row[index]
+                else:
+                    def fetch_col(state, dict_, row):
+                        dict_[key] = processor(row._row[index])
                 return fetch_col, None, None
         else:
             def expire_for_non_present_col(state, dict_, row):
@@ -164,6 +181,8 @@ class ColumnLoader(LoaderStrategy):
 class DeferredColumnLoader(LoaderStrategy):
     """Provide loading behavior for a deferred :class:`.ColumnProperty`."""
 
+    _chunksize = 500
+
     def __init__(self, parent):
         super(DeferredColumnLoader, self).__init__(parent)
         if hasattr(self.parent_property, 'composite_class'):
@@ -183,6 +202,22 @@ class DeferredColumnLoader(LoaderStrategy):
                         create_row_processor(
                                 context, path, loadopt, mapper, row, adapter)
 
+        elif self.parent_property.batch:
+            # a single batch is shared among all mappers and paths which
+            # load this column within the same query result
+            batch_key = ("batch_deferred", self.parent_property)
+            loader = context.attributes.get(batch_key)
+            if loader is None:
+                loader = context.attributes[batch_key] = \
+                                    LoadBatchDeferredColumns(key)
+
+            def set_batch_deferred_callable(state, dict_, row):
+                state._reset(dict_, key)
+                state.callables[key] = loader
+                loader.states.append(state)
+
+            return set_batch_deferred_callable, None, None
+
         elif not self.is_class_level:
             set_deferred_for_local_state = InstanceState._row_processor(
                                                 mapper.class_manager,
@@ -204,16 +239,40 @@ class DeferredColumnLoader(LoaderStrategy):
              expire_missing=False
         )
 
+    @util.memoized_property
+    def _is_identifying(self):
+        # primary key and discriminator columns are always loaded,
+        # even when deferred by a wildcard option such as load_only()
+        return bool(
+                    set(self.columns).intersection(self.parent.primary_key)
+                ) or (
+                    self.parent.polymorphic_on is not None and
+                    self.parent.polymorphic_on in self.columns
+                )
+
     def setup_query(self, context, entity, path, loadopt, adapter,
                                 only_load_props=None, **kwargs):
         if (
                 loadopt and self.group and
                 loadopt.local_opts.get('undefer_group', False) == self.group
-            ) or (only_load_props and self.key in only_load_props):
+            ) or (only_load_props and self.key in only_load_props) or \
+                (loadopt and self._is_identifying):
             self.parent_property._get_strategy_by_cls(ColumnLoader).\
                             setup_query(context, entity,
                                         path, loadopt, adapter, **kwargs)
 
+    def _group_keys(self, mapper):
+        if self.group:
+            return [
+                    p.key for p in
+                    mapper.iterate_properties
+                    if isinstance(p, StrategizedProperty) and
+                      isinstance(p.strategy, DeferredColumnLoader) and
+                      p.group == self.group
+                    ]
+        else:
+            return [self.key]
+
     def _load_for_state(self, state, passive):
         if not state.key:
             return attributes.ATTR_EMPTY
@@ -223,16 +282,7 @@ class DeferredColumnLoader(LoaderStrategy):
 
         localparent = state.manager.mapper
 
-        if self.group:
-            toload = [
-                    p.key for p in
-                    localparent.iterate_properties
-                    if isinstance(p, StrategizedProperty) and
-                      isinstance(p.strategy, DeferredColumnLoader) and
-                      p.group == self.group
-                    ]
-        else:
-            toload = [self.key]
+        toload = self._group_keys(localparent)
 
         # narrow the keys down to just those which have no history
         group = [k for k in toload if k in state.unmodified]
@@ -252,6 +302,60 @@ class DeferredColumnLoader(LoaderStrategy):
 
         return attributes.ATTR_WAS_SET
 
+    def _load_for_batch(self, state, passive, loader):
+        if not state.key or not passive & attributes.SQL_OK:
+            return self._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if session is None:
+            return self._load_for_state(state, passive)
+
+        # all objects in the batch are instances of the mapper
+        # which declares this attribute, or of a subclass
+        mapper = self.parent
+        group = [k for k in self._group_keys(mapper)
+                    if k not in state.committed_state]
+
+        key = self.key
+        states = [state] + [
+            s for s in loader.states
+            if s is not state and
+                s.key is not None and
+                s.session_id == state.session_id and
+                s.callables.get(key) is loader and
+                not [k for k in group if k in s.committed_state] and
+                s.obj() is not None
+        ]
+
+        states_by_ident = dict((s.key[1], s) for s in states)
+        pk_cols = list(mapper.primary_key)
+        num_pk = len(pk_cols)
+
+        q = session.query(*(
+                    pk_cols +
+                    [mapper._props[k].columns[0] for k in group]
+                )).select_from(mapper)
+
+        chunksize = max(self._chunksize // num_pk, 1)
+        for i in range(0, len(states), chunksize):
+            criterion = _pk_in_criterion(
+                            pk_cols,
+                            [s.key[1] for s in states[i:i + chunksize]])
+
+            for row in q.filter(criterion):
+                s = states_by_ident[tuple(row[0:num_pk])]
+                dict_ = s.dict
+                for k, value in zip(group, row[num_pk:]):
+                    dict_[k] = value
+                s._commit(dict_, group)
+
+        loaded = set(s for s in states if key in s.dict)
+        loader.states = [s for s in loader.states if s not in loaded]
+
+        if state not in loaded:
+            raise orm_exc.ObjectDeletedError(state)
+
+        return attributes.ATTR_WAS_SET
 
 
 class LoadDeferredColumns(object):
@@ -269,6 +373,45 @@ class LoadDeferredColumns(object):
         return strategy._load_for_state(state, passive)
 
 
+class LoadBatchDeferredColumns(object):
+    """loader object used by DeferredColumnLoader for a "batch" deferred
+    column, shared among the objects loaded by a single query result.
+
+    When pickled, degrades to a :class:`.LoadDeferredColumns`.
+
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.states = []
+
+    def __reduce__(self):
+        return LoadDeferredColumns, (self.key, )
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+
+        localparent = state.manager.mapper
+        prop = localparent._props[key]
+        strategy = prop._get_strategy_by_cls(DeferredColumnLoader)
+        return strategy._load_for_batch(state, passive, self)
+
+
+def _pk_in_criterion(pk_cols, idents):
+    """Produce criterion matching the given primary key identities."""
+
+    if len(pk_cols) == 1:
+        return pk_cols[0].in_([ident[0] for ident in idents])
+    else:
+        return sql.or_(*[
+                    sql.and_(*[
+                        col == value for col, value
+                        in zip(pk_cols, ident)
+                    ])
+                    for ident in idents
+                ])
+
+
 
 class AbstractRelationshipLoader(LoaderStrategy):
     """LoaderStratgies which deal with related objects."""
@@ -524,6 +667,9 @@ class LazyLoader(AbstractRelationshipLoader):
 
     @util.dependencies("sqlalchemy.orm.strategy_options")
     def _emit_lazyload(self, strategy_options, session, state, ident_key, passive):
+        if session.lazyload_stats is not None:
+            session.lazyload_stats._record(self.parent_property)
+
         q = session.query(self.mapper)._adapt_all_clauses()
 
         q = q._with_invoke_all_eagers(False)
@@ -593,7 +739,8 @@ class LazyLoader(AbstractRelationshipLoader):
             # class-level lazyloader installed.
             set_lazy_callable = InstanceState._row_processor(
                                         mapper.class_manager,
-                                        LoadLazyAttribute(key), key)
+                                        LoadLazyAttribute(key,
+                                            self._strategy_keys[0]), key)
 
             return set_lazy_callable, None, None
         else:
@@ -615,18 +762,215 @@ class LazyLoader(AbstractRelationshipLoader):
 class LoadLazyAttribute(object):
     """serializable loader object used by LazyLoader"""
 
-    def __init__(self, key):
+    strategy_key = (("lazy", "select"),)
+
+    def __init__(self, key, strategy_key=None):
         self.key = key
+        if strategy_key is not None:
+            self.strategy_key = strategy_key
 
     def __call__(self, state, passive=attributes.PASSIVE_OFF):
         key = self.key
         instance_mapper = state.manager.mapper
         prop = instance_mapper._props[key]
-        strategy = prop._strategies[LazyLoader]
+        strategy = prop._get_strategy(self.strategy_key)
 
         return strategy._load_for_state(state, passive)
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="raise")
+class RaiseLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='raise'", that is raises an error when a load would
+    otherwise emit SQL.
+
+    Many-to-one loads which can be satisfied from the identity map
+    proceed normally, as do loads emitted by the unit of work during
+    a flush.
+
+    """
+
+    def _emit_lazyload(self, session, state, ident_key, passive):
+        if passive & attributes.LOAD_AGAINST_COMMITTED:
+            return super(RaiseLoader, self)._emit_lazyload(
+                                    session, state, ident_key, passive)
+
+        raise sa_exc.InvalidRequestError(
+                "'%s' is not available due to lazy='raise'" %
+                self.parent_property)
+
+
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLazyLoader(AbstractRelationshipLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for
+    all objects loaded by the same query at once.
+
+    Each object loaded by a query is associated with a
+    :class:`.LoadBatchLazyAttribute` shared among all of the objects
+    in that result.  When the attribute is first accessed on any one
+    of them, a single SELECT using an IN clause against the parent
+    primary key loads the attribute for all of them.
+
+    """
+
+    _chunksize = 500
+
+    def init_class_attribute(self, mapper):
+        # objects that weren't loaded by a Query, i.e. those that
+        # are merged or refreshed, use the plain lazyloader.
+        self.parent_property.\
+                _get_strategy_by_cls(LazyLoader).\
+                init_class_attribute(mapper)
+
+    def create_row_processor(self, context, path, loadopt,
+                                    mapper, row, adapter):
+        key = self.key
+
+        # a single batch is shared among all mappers and paths which
+        # load this relationship within the same query result
+        batch_key = ("batch_lazyload", self.parent_property)
+        loader = context.attributes.get(batch_key)
+        if loader is None:
+            loader = context.attributes[batch_key] = \
+                                    LoadBatchLazyAttribute(key)
+
+        def set_batch_lazy_callable(state, dict_, row):
+            state._reset(dict_, key)
+            state.callables[key] = loader
+            loader.states.append(state)
+
+        return set_batch_lazy_callable, None, None
+
+    def _load_for_batch(self, state, passive, loader):
+        lazyloader = self.parent_property._get_strategy_by_cls(LazyLoader)
+
+        if not state.key or \
+                not passive & attributes.SQL_OK or \
+                passive & attributes.LOAD_AGAINST_COMMITTED:
+            return lazyloader._load_for_state(state, passive)
+
+        session = _state_session(state)
+        if not session:
+            return lazyloader._load_for_state(state, passive)
+
+        if lazyloader.use_get:
+            # a many-to-one against the target's primary key may be
+            # satisfied from the identity map without emitting SQL.
+            value = lazyloader._load_for_state(
+                                state, passive & ~attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        key = self.key
+        states = [state] + [
+            s for s in loader.states
+            if s is not state and
+                s.key is not None and
+                s.session_id == state.session_id and
+                s.callables.get(key) is loader and
+                key not in s.dict and
+                key not in s.committed_state and
+                s.obj() is not None
+        ]
+
+        values = self._emit_batch_lazyload(session, state, states)
+
+        for s in states[1:]:
+            s.get_impl(key).set_committed_value(
+                                    s, s.dict, values[s.key[1]])
+
+        loaded = set(states)
+        loader.states = [s for s in loader.states if s not in loaded]
+
+        return values[state.key[1]]
+
+    @util.dependencies("sqlalchemy.orm.strategy_options")
+    def _emit_batch_lazyload(self, strategy_options, session, state, states):
+        if session.lazyload_stats is not None:
+            session.lazyload_stats._record(self.parent_property)
+
+        parent_alias = orm_util.AliasedClass(self.parent)
+        pk_attrs = [
+            getattr(parent_alias, self.parent._columntoproperty[c].key)
+            for c in self.parent.primary_key
+        ]
+
+        q = session.query(*pk_attrs).\
+                    add_entity(self.mapper).\
+                    join(getattr(parent_alias, self.key))
+
+        q = q._with_invoke_all_eagers(False)
+
+        if state.load_path:
+            q = q._with_current_path(state.load_path[self.parent_property])
+
+        if state.load_options:
+            q = q._conditional_options(*state.load_options)
+
+        if self.parent_property.order_by:
+            q = q.order_by(*util.to_list(self.parent_property.order_by))
+
+        for rev in self.parent_property._reverse_property:
+            # reverse props that are MANYTOONE are loading *this*
+            # object from get(), so don't need to eager out to those.
+            if rev.direction is interfaces.MANYTOONE and \
+                        rev._use_get and \
+                        not isinstance(rev.strategy, LazyLoader):
+                q = q.options(
+                        strategy_options.Load(rev.parent).lazyload(rev.key))
+
+        idents = [s.key[1] for s in states]
+        collections = dict((ident, []) for ident in idents)
+        num_pk = len(pk_attrs)
+        chunksize = max(self._chunksize // num_pk, 1)
+
+        for i in range(0, len(idents), chunksize):
+            criterion = _pk_in_criterion(
+                                pk_attrs, idents[i:i + chunksize])
+            for row in q.filter(criterion):
+                collections[tuple(row[0:num_pk])].append(row[num_pk])
+
+        if self.uselist:
+            return collections
+
+        scalars = {}
+        for ident, collection in collections.items():
+            if len(collection) > 1:
+                util.warn(
+                    "Multiple rows returned with "
+                    "uselist=False for lazily-loaded attribute '%s' "
+                    % self.parent_property)
+            scalars[ident] = collection[0] if collection else None
+        return scalars
+
+
+class LoadBatchLazyAttribute(object):
+    """loader object used by BatchLazyLoader, shared among the objects
+    loaded by a single query result.
+
+    When pickled, degrades to a :class:`.LoadLazyAttribute`.
+
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.states = []
+
+    def __reduce__(self):
+        return LoadLazyAttribute, (self.key, )
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._strategies[BatchLazyLoader]
+
+        return strategy._load_for_batch(state, passive, self)
+
+
 @properties.RelationshipProperty.strategy_for(lazy="immediate")
 class ImmediateLoader(AbstractRelationshipLoader):
     def init_class_attribute(self, mapper):
@@ -1128,15 +1472,12 @@ class JoinedLoader(AbstractRelationshipLoader):
             None
         )
         if with_poly_info:
-            to_adapt = with_poly_info.entity
+            clauses = orm_util.ORMAdapter(
+                        with_poly_info.entity,
+                        equivalents=self.mapper._equivalent_columns,
+                        adapt_required=True)
         else:
-            to_adapt = orm_util.AliasedClass(self.mapper,
-                                flat=True,
-                                use_mapper_path=True)
-        clauses = orm_util.ORMAdapter(
-                    to_adapt,
-                    equivalents=self.mapper._equivalent_columns,
-                    adapt_required=True)
+            clauses = self._eager_adapter(context, path)
         assert clauses.aliased_class is not None
 
         if self.parent_property.direction != interfaces.MANYTOONE:
@@ -1164,6 +1505,46 @@ class JoinedLoader(AbstractRelationshipLoader):
 
         return clauses, adapter, add_to_collection, allow_innerjoin
 
+    def _eager_adapter(self, context, path):
+        """Return an :class:`.ORMAdapter` against an anonymous alias
+        of the target mapper, used to render the eager join along the
+        given path.
+
+        The adapter, including its alias and the columns it has
+        adapted, is reused by subsequent compilations along the
+        same path; the cache is bounded and is reset when mappers
+        are configured.  A path that's used more than once within
+        a single compilation gets a new alias each subsequent time.
+
+        """
+        key = path.path
+        if ("joined_eager_adapter", key) in context.attributes:
+            clauses = None
+        else:
+            cache = self.mapper._eager_adapter_cache
+            try:
+                clauses = cache[key]
+            except KeyError:
+                clauses = cache[key] = self._create_eager_adapter_for_path()
+            context.attributes[("joined_eager_adapter", key)] = clauses
+
+        if clauses is None:
+            clauses = self._create_eager_adapter_for_path()
+        return clauses
+
+    def _create_eager_adapter_for_path(self):
+        clauses = orm_util.ORMAdapter(
+                    orm_util.AliasedClass(self.mapper,
+                                flat=True,
+                                use_mapper_path=True),
+                    equivalents=self.mapper._equivalent_columns,
+                    adapt_required=True)
+
+        # populate the column collection of the alias up front, as
+        # the adapter may be shared among compilations
+        clauses.selectable.c
+        return clauses
+
     def _create_eager_join(self, context, entity,
                             path, adapter, parentmapper,
                             clauses, innerjoin):
@@ -708,6 +708,54 @@ def lazyload(*keys):
 def lazyload_all(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.lazyload, keys, True, {})
 
+@loader_option()
+def batchload(loadopt, attr):
+    """Indicate that the given attribute should be loaded using
+    "batch" lazy loading, which loads the attribute for all objects
+    in the same query result when first accessed on any one of them.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    .. versionadded:: 0.9.0
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :func:`.orm.lazyload`
+
+    """
+    return loadopt.set_relationship_strategy(attr, {"lazy": "batch"})
+
+@batchload._add_unbound_fn
+def batchload(*keys):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, False, {})
+
+@loader_option()
+def raiseload(loadopt, attr):
+    """Indicate that the given relationship attribute should raise
+    an error, rather than emitting SQL, when it would otherwise be
+    lazy loaded.
+
+    This function is part of the :class:`.Load` interface and supports
+    both method-chained and standalone operation.
+
+    .. versionadded:: 0.9.0
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :func:`.orm.lazyload`
+
+    """
+    return loadopt.set_relationship_strategy(attr, {"lazy": "raise"})
+
+@raiseload._add_unbound_fn
+def raiseload(*keys):
+    return _UnboundLoad._from_keys(_UnboundLoad.raiseload, keys, False, {})
+
 @loader_option()
 def immediateload(loadopt, attr):
     """Indicate that the given attribute should be loaded using
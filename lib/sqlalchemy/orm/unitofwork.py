@@ -311,9 +311,31 @@ class UOWTransaction(object):
                 break
 
         # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
+        # the graph is derived from the mapper configuration and
+        # is typically the same from one flush to the next, so the
+        # result is memoized against it within the base mappers involved,
+        # along with the sorted order of actions if there are no cycles.
+        graph_key = self._graph_key()
+        caches = [m._flush_order_cache for m in
+                    set(mapper.base_mapper for mapper in self.mappers)]
+        if caches and graph_key in caches[0]:
+            self._flush_order = flush_order = caches[0][graph_key]
+        else:
+            self._flush_order = flush_order = [
+                    frozenset(
+                        rec._sort_key for rec in
+                        topological.find_cycles(
                                         self.dependencies,
                                         list(self.postsort_actions.values()))
+                    ),
+                    None
+                ]
+            for cache in caches:
+                cache[graph_key] = flush_order
+
+        self.cycles = cycles = set(
+                                self.postsort_actions[key]
+                                for key in flush_order[0])
 
         if cycles:
             # if yes, break the per-mapper actions into
@@ -345,6 +367,22 @@ class UOWTransaction(object):
                     ]
                 ).difference(cycles)
 
+    def _graph_key(self):
+        """Return a hashable key representing the current collection of
+        per-mapper PostSortRecs and the dependencies between them.
+
+        """
+        return (
+            frozenset(self.postsort_actions),
+            frozenset(
+                (
+                    parent._sort_key if parent is not None else None,
+                    child._sort_key if child is not None else None
+                )
+                for parent, child in self.dependencies
+            )
+        )
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
@@ -364,10 +402,17 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(
+            order = self._flush_order[1]
+            if order is None:
+                order = self._flush_order[1] = [
+                            rec._sort_key for rec in
+                            topological.sort(
                                     self.dependencies,
-                                    postsort_actions):
-                rec.execute(self)
+                                    postsort_actions)
+                        ]
+            postsort_actions = self.postsort_actions
+            for key in order:
+                postsort_actions[key].execute(self)
 
     def finalize_flush_changes(self):
         """mark processed objects as clean / deleted after a successful
@@ -451,6 +496,7 @@ class PostSortRec(object):
             uow.postsort_actions[key] = \
                                     ret = \
                                     object.__new__(cls)
+            ret._sort_key = key
             return ret
 
     def execute_aggregate(self, uow, recs):
@@ -417,6 +417,15 @@ class AliasedInsp(_InspectionAttr):
     is_aliased_class = True
     "always returns True"
 
+    @util.memoized_property
+    def _column_adapter(self):
+        """A :class:`.ColumnAdapter` against the aliased selectable,
+        shared among all queries against this entity."""
+
+        return sql_util.ColumnAdapter(
+                            self.selectable,
+                            self.mapper._equivalent_columns)
+
     @property
     def class_(self):
         """Return the mapped class ultimately represented by this
@@ -189,6 +189,12 @@ class Compiled(object):
 
         self.dialect = dialect
         self.bind = bind
+
+        # a (key, ResultMetaData) pair for the most recent result
+        # produced by executing this statement; see
+        # ResultProxy._init_metadata()
+        self._cached_metadata = None
+
         if statement is not None:
             self.statement = statement
             self.can_execute = statement.supports_execution
@@ -327,6 +333,16 @@ class SQLCompiler(Compiled):
     driver/DB enforces this
     """
 
+    contains_expanding_parameters = False
+    """set to True if the statement contains "expanding" bind
+    parameters, which are rendered as placeholder tokens to be
+    replaced at execution time
+    """
+
+    positiontup = None
+    """for a positional dialect, the list of bind parameter names
+    in the order in which they're rendered"""
+
     def __init__(self, dialect, statement, column_keys=None,
                     inline=False, **kwargs):
         """Construct a new ``DefaultCompiler`` object.
@@ -365,6 +381,23 @@ class SQLCompiler(Compiled):
         # column targeting
         self.result_map = {}
 
+        # the same records as result_map, in the order in which the
+        # columns are rendered in the columns clause, each as a tuple of
+        # (keyname, name, objects, type).  ResultProxy uses this to
+        # target columns by position when it lines up with the
+        # columns present in cursor.description
+        self._result_columns = []
+
+        # true if the order of _result_columns is known to be that of
+        # the columns in cursor.description; not the case for textual
+        # statements whose columns were given only by name
+        self._ordered_columns = True
+
+        # true if the columns were given in order for a textual
+        # statement, in which case they're matched to cursor.description
+        # by position even if the names differ
+        self._textual_ordered_columns = False
+
         # true if the paramstyle is positional
         self.positional = dialect.positional
         if self.positional:
@@ -385,6 +418,10 @@ class SQLCompiler(Compiled):
         # a map which tracks "truncated" names based on
         # dialect.label_length or dialect.max_identifier_length
         self.truncated_names = {}
+
+        # a map of Table/Alias objects to the rendered, quoted
+        # qualifier used for each of their columns
+        self._table_prefixes = {}
         Compiled.__init__(self, dialect, statement, **kwargs)
 
         if self.positional and dialect.paramstyle == 'numeric':
@@ -421,6 +458,15 @@ class SQLCompiler(Compiled):
                  if value is not None
             )
 
+    @util.memoized_property
+    def _parameter_converter(self):
+        """A callable converting the result of construct_params() into
+        the parameter structure sent to the DBAPI, taking into account
+        the ordering of positional parameters and bind processors."""
+
+        return self.dialect._parameter_converter(
+                                self.positiontup, self._bind_processors)
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -485,6 +531,13 @@ class SQLCompiler(Compiled):
     def visit_grouping(self, grouping, asfrom=False, **kwargs):
         return "(" + grouping.element._compiler_dispatch(self, **kwargs) + ")"
 
+    def visit_keyset_criterion(self, criterion, **kw):
+        if criterion.row_value is not None and \
+                self.dialect.supports_row_value_comparison:
+            return criterion.row_value._compiler_dispatch(self, **kw)
+        else:
+            return criterion.expanded._compiler_dispatch(self, **kw)
+
     def visit_label(self, label,
                             add_to_result_map=None,
                             within_label_clause=False,
@@ -553,17 +606,17 @@ class SQLCompiler(Compiled):
         if table is None or not include_table or not table.named_with_column:
             return name
         else:
-            if table.schema:
-                schema_prefix = self.preparer.quote_schema(table.schema) + '.'
-            else:
-                schema_prefix = ''
-            tablename = table.name
-            if isinstance(tablename, elements._truncated_label):
-                tablename = self._truncated_identifier("alias", tablename)
-
-            return schema_prefix + \
-                    self.preparer.quote(tablename) + \
-                    "." + name
+            try:
+                prefix = self._table_prefixes[table]
+            except KeyError:
+                tablename = table.name
+                if isinstance(tablename, elements._truncated_label):
+                    tablename = self._truncated_identifier(
+                                            "alias", tablename)
+                prefix = self._table_prefixes[table] = \
+                            self.preparer._quoted_table_name(
+                                        tablename, table.schema) + "."
+            return prefix + name
 
     def escape_literal_column(self, text):
         """provide escaping for the literal_column() construct."""
@@ -604,6 +657,33 @@ class SQLCompiler(Compiled):
              self.post_process_text(textclause.text))
         )
 
+    def visit_text_as_from(self, taf, iswrapper=False,
+                                    compound_index=0, force_result_map=False,
+                                    asfrom=False,
+                                    parens=True, **kw):
+
+        toplevel = not self.stack
+        entry = self._default_stack_entry if toplevel else self.stack[-1]
+
+        populate_result_map = force_result_map or (
+                                compound_index == 0 and (
+                                    toplevel or \
+                                    entry['iswrapper']
+                                )
+                            )
+
+        if populate_result_map:
+            self._ordered_columns = \
+                self._textual_ordered_columns = taf.positional
+            for c in taf.column_args:
+                self.process(c, within_columns_clause=True,
+                                add_to_result_map=self._add_to_result_map)
+
+        text = self.process(taf.element, **kw)
+        if asfrom and parens:
+            text = "(%s)" % text
+        return text
+
     def visit_null(self, expr, **kw):
         return 'NULL'
 
@@ -950,15 +1030,32 @@ class SQLCompiler(Compiled):
 
         self.binds[bindparam.key] = self.binds[name] = bindparam
 
-        return self.bindparam_string(name, **kwargs)
+        return self.bindparam_string(name,
+                                expanding=bindparam.expanding, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
         value = bindparam.value
         processor = bindparam.type._cached_bind_processor(self.dialect)
+        if bindparam.expanding:
+            if not value:
+                return "(%s)" % self.visit_empty_set_expr(bindparam.type)
+            return "(%s)" % ", ".join(
+                        self.render_literal_value(
+                            processor(elem) if processor else elem,
+                            bindparam.type)
+                        for elem in value
+                    )
         if processor:
             value = processor(value)
         return self.render_literal_value(value, bindparam.type)
 
+    def visit_empty_set_expr(self, type_):
+        """Render a SELECT which returns no rows, used as the
+        target of an "expanding" IN which receives an empty sequence.
+
+        """
+        return "SELECT 1%s WHERE 1!=1" % self.default_from()
+
     def render_literal_value(self, value, type_):
         """Render the value of a bind parameter as a quoted literal.
 
@@ -1020,13 +1117,20 @@ class SQLCompiler(Compiled):
         self.anon_map[derived] = anonymous_counter + 1
         return derived + "_" + str(anonymous_counter)
 
-    def bindparam_string(self, name, positional_names=None, **kw):
+    def bindparam_string(self, name, positional_names=None,
+                                    expanding=False, **kw):
         if self.positional:
             if positional_names is not None:
                 positional_names.append(name)
             else:
                 self.positiontup.append(name)
-        return self.bindtemplate % {'name': name}
+        if expanding:
+            # rendered as a token, which is replaced with the
+            # individual parameters for each execution
+            self.contains_expanding_parameters = True
+            return "([EXPANDING_%s])" % name
+        else:
+            return self.bindtemplate % {'name': name}
 
     def visit_cte(self, cte, asfrom=False, ashint=False,
                                 fromhints=None,
@@ -1139,6 +1243,8 @@ class SQLCompiler(Compiled):
             self.result_map[keyname] = e_name, e_obj + objects, e_type
         else:
             self.result_map[keyname] = name, objects, type_
+        # in-place add rather than append(), saving a call per column
+        self._result_columns += ((keyname, name, objects, type_), )
 
     def _label_select_column(self, select, column,
                                     populate_result_map,
@@ -1312,6 +1418,12 @@ class SQLCompiler(Compiled):
         for key, (name, objs, typ) in list(self.result_map.items()):
             objs = tuple([d.get(col, col) for col in objs])
             self.result_map[key] = (name, objs, typ)
+        # positional records are only used when no keyname is
+        # repeated, so each can share the result_map entry's objects
+        self._result_columns = [
+            (key, name, self.result_map[key][1], typ)
+            for key, name, objs, typ in self._result_columns
+        ]
 
 
     _default_stack_entry = util.immutabledict([
@@ -1569,11 +1681,8 @@ class SQLCompiler(Compiled):
     def visit_table(self, table, asfrom=False, iscrud=False, ashint=False,
                         fromhints=None, **kwargs):
         if asfrom or ashint:
-            if getattr(table, "schema", None):
-                ret = self.preparer.quote_schema(table.schema) + \
-                                "." + self.preparer.quote(table.name)
-            else:
-                ret = self.preparer.quote(table.name)
+            ret = self.preparer._quoted_table_name(
+                                table.name, getattr(table, "schema", None))
             if fromhints and table in fromhints:
                 ret = self.format_from_hint_text(ret, table,
                                     fromhints[table], iscrud)
@@ -2666,6 +2775,7 @@ class IdentifierPreparer(object):
         self.escape_to_quote = self.escape_quote * 2
         self.omit_schema = omit_schema
         self._strings = {}
+        self._table_names = {}
 
     def _escape_identifier(self, value):
         """Escape an identifier.
@@ -2737,6 +2847,28 @@ class IdentifierPreparer(object):
         else:
             return ident
 
+    def _quoted_table_name(self, name, schema):
+        """Return the quoted form of a table name, qualified by the
+        given schema name if present.
+
+        The rendered string is memoized per preparer; the explicit
+        quoting flags of each name are part of the key, so that a
+        :class:`.quoted_name` won't share an entry with the equivalent
+        plain string.
+
+        """
+        key = (name, getattr(name, "quote", None),
+                schema, getattr(schema, "quote", None))
+        try:
+            return self._table_names[key]
+        except KeyError:
+            if schema:
+                ret = self.quote_schema(schema) + "." + self.quote(name)
+            else:
+                ret = self.quote(name)
+            self._table_names[key] = ret
+            return ret
+
     def format_sequence(self, sequence, use_schema=True):
         name = self.quote(sequence.name)
         if not self.omit_schema and use_schema and sequence.schema is not None:
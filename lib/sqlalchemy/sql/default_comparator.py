@@ -146,6 +146,10 @@ class _DefaultColumnComparator(operators.ColumnOperators):
         elif isinstance(seq_or_selectable, (Selectable, TextClause)):
             return self._boolean_compare(expr, op, seq_or_selectable,
                                   negate=negate_op, **kw)
+        elif isinstance(seq_or_selectable, BindParameter) and \
+                seq_or_selectable.expanding:
+            return self._boolean_compare(expr, op, seq_or_selectable,
+                                  negate=negate_op)
 
         # Handle non selectable arguments as sequences
         args = []
@@ -701,7 +701,7 @@ class BindParameter(ColumnElement):
     def __init__(self, key, value=NO_ARG, type_=None,
                             unique=False, required=NO_ARG,
                             quote=None, callable_=None,
-                            isoutparam=False,
+                            isoutparam=False, expanding=False,
                             _compared_to_operator=None,
                             _compared_to_type=None):
         """Construct a new :class:`.BindParameter`.
@@ -768,7 +768,28 @@ class BindParameter(ColumnElement):
 
                 :func:`.outparam`
 
+            :param expanding:
+              if True, this parameter will be treated as an "expanding"
+              parameter at execution time; the parameter value is expected
+              to be a sequence, rather than a scalar value, and the string
+              SQL statement will be transformed on a per-execution basis
+              to accommodate the sequence with a variable number of
+              parameter slots passed to the DBAPI.  This allows statement
+              caching to be used in conjunction with an IN clause::
 
+                stmt = select([table]).where(
+                    table.c.id.in_(bindparam('ids', expanding=True)))
+
+                conn.execute(stmt, ids=[1, 2, 3])
+
+              An empty sequence renders an IN against an empty subquery,
+              which matches no rows.
+
+              .. note:: The "expanding" feature does not support
+                 "executemany"-style parameter sets, nor the "numeric"
+                 paramstyle.
+
+              .. versionadded:: 0.9.0
 
         """
         if isinstance(key, ColumnClause):
@@ -803,6 +824,7 @@ class BindParameter(ColumnElement):
         self.callable = callable_
         self.isoutparam = isoutparam
         self.required = required
+        self.expanding = expanding
         if type_ is None:
             if _compared_to_type is not None:
                 self.type = \
@@ -1034,6 +1056,76 @@ class TextClause(Executable, ClauseElement):
             for b in bindparams:
                 self.bindparams[b.key] = b
 
+    @util.dependencies('sqlalchemy.sql.selectable')
+    def columns(self, selectable, *cols, **types):
+        """Turn this :class:`.TextClause` object into a :class:`.TextAsFrom`
+        object that can be embedded into another statement, and whose
+        result columns are known ahead of time.
+
+        This function essentially bridges the gap between an entirely
+        textual SELECT statement and the SQL expression language concept
+        of a "selectable"::
+
+            from sqlalchemy.sql import column, text
+
+            stmt = text("SELECT id, name FROM some_table")
+            stmt = stmt.columns(column('id'), column('name')).alias('st')
+
+            stmt = select([mytable]).\\
+                    select_from(
+                        mytable.join(stmt, mytable.c.name == stmt.c.name)
+                    ).where(stmt.c.id > 5)
+
+        Above, we used untyped :func:`.column` elements.  These can also
+        have types specified, which will impact how the column behaves in
+        expressions as well as determining result set behavior::
+
+            stmt = text("SELECT id, name, timestamp FROM some_table")
+            stmt = stmt.columns(
+                        column('id', Integer),
+                        column('name', Unicode),
+                        column('timestamp', DateTime)
+                    )
+
+            for id, name, timestamp in connection.execute(stmt):
+                print(id, name, timestamp)
+
+        Keyword arguments allow just the names and types of columns to be
+        specified, where the :func:`.column` elements will be generated
+        automatically::
+
+            stmt = text("SELECT id, name, timestamp FROM some_table")
+            stmt = stmt.columns(
+                        id=Integer,
+                        name=Unicode,
+                        timestamp=DateTime
+                    )
+
+        The positional form of :meth:`.TextClause.columns` also provides
+        the order of the columns in the result.  When the
+        ``cursor.description`` of the result has the same number of
+        columns, each is matched to the given column by position
+        rather than by name, in the same way as for a :func:`.select`,
+        and the result metadata is cached on the compiled statement
+        for subsequent executions.   Columns given only as keyword
+        arguments have no defined order; if any are present, all of
+        the columns are matched to those in the result by name.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        input_cols = [
+            ColumnClause(col.key, types.pop(col.key))
+            if col.key in types
+            else col
+            for col in cols
+        ]
+        positional = not types
+        input_cols.extend(
+                ColumnClause(key, type_) for key, type_ in types.items())
+        return selectable.TextAsFrom(self, input_cols, positional=positional)
+
     @property
     def type(self):
         if self.typemap is not None and len(self.typemap) == 1:
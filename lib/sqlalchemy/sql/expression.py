@@ -46,7 +46,7 @@ from .base import ColumnCollection, Generative, Executable, \
 from .selectable import Alias, Join, Select, Selectable, TableClause, \
         CompoundSelect, FromClause, FromGrouping, SelectBase, \
         alias, \
-        subquery, HasPrefixes, Exists, ScalarSelect
+        subquery, HasPrefixes, Exists, ScalarSelect, TextAsFrom
 
 
 from .dml import Insert, Update, Delete, UpdateBase, ValuesBase
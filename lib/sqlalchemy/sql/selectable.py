@@ -1687,6 +1687,56 @@ class CompoundSelect(SelectBase):
     bind = property(bind, _set_bind)
 
 
+class TextAsFrom(SelectBase):
+    """Wrap a :class:`.TextClause` construct within a :class:`.SelectBase`
+    interface.
+
+    This allows the :class:`.TextClause` object to gain a ``.c`` collection
+    and other FROM-like capabilities such as :meth:`.FromClause.alias`,
+    :meth:`.SelectBase.cte`, etc.  The columns given also establish the
+    order and types of the columns in the result.
+
+    The :class:`.TextAsFrom` construct is produced via the
+    :meth:`.TextClause.columns` method - see that method for details.
+
+    .. versionadded:: 0.9.0
+
+    .. seealso::
+
+        :func:`.text`
+
+        :meth:`.TextClause.columns`
+
+    """
+    __visit_name__ = "text_as_from"
+
+    use_labels = False
+    for_update = False
+
+    def __init__(self, text, columns, positional=False):
+        self.element = text
+        self.column_args = columns
+        self.positional = positional
+
+    @property
+    def _bind(self):
+        return self.element._bind
+
+    def _populate_column_collection(self):
+        for c in self.column_args:
+            c._make_proxy(self)
+
+    def _copy_internals(self, clone=_clone, **kw):
+        self._reset_exported()
+        self.element = clone(self.element, **kw)
+
+    def get_children(self, **kwargs):
+        return [self.element]
+
+    def _scalar_type(self):
+        return self.column_args[0].type
+
+
 class HasPrefixes(object):
     _prefixes = ()
 
@@ -289,11 +289,22 @@ def cloned_traverse(obj, opts, visitors):
 
 def replacement_traverse(obj, opts, replace):
     """clone the given expression structure, allowing element
-    replacement by a given replacement function."""
+    replacement by a given replacement function.
+
+    Only the path from the top of the structure down to each
+    replaced element is copied; a sub-structure in which no element
+    is replaced is shared with the original structure.
+
+    """
 
     cloned = {}
     stop_on = set([id(x) for x in opts.get('stop_on', [])])
 
+    # a stack of flags, one for each element whose internals are
+    # currently being copied, indicating if any of its
+    # sub-elements were replaced
+    changed = [False]
+
     def clone(elem, **kw):
         if id(elem) in stop_on or \
             'no_replacement_traverse' in elem._annotations:
@@ -302,12 +313,18 @@ def replacement_traverse(obj, opts, replace):
             newelem = replace(elem)
             if newelem is not None:
                 stop_on.add(id(newelem))
-                return newelem
             else:
                 if elem not in cloned:
-                    cloned[elem] = newelem = elem._clone()
+                    newelem = elem._clone()
+                    changed.append(False)
                     newelem._copy_internals(clone=clone, **kw)
-                return cloned[elem]
+                    if not changed.pop():
+                        newelem = elem
+                    cloned[elem] = newelem
+                newelem = cloned[elem]
+            if newelem is not elem:
+                changed[-1] = True
+            return newelem
 
     if obj is not None:
         obj = clone(obj, **opts)
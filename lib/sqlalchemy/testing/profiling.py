@@ -253,43 +253,64 @@ def function_call_count(variance=0.05):
             timespent, load_stats, fn_result = _profile(
                 fn, *args, **kw
             )
-            stats = load_stats()
-            callcount = stats.total_calls
-
-            expected = _profile_stats.result(callcount)
-            if expected is None:
-                expected_count = None
-            else:
-                line_no, expected_count = expected
-
-            print(("Pstats calls: %d Expected %s" % (
-                    callcount,
-                    expected_count
-                )
-            ))
-            stats.print_stats()
-            #stats.print_callers()
-
-            if expected_count:
-                deviance = int(callcount * variance)
-                failed = abs(callcount - expected_count) > deviance
-
-                if failed:
-                    if _profile_stats.write:
-                        _profile_stats.replace(callcount)
-                    else:
-                        raise AssertionError(
-                            "Adjusted function call count %s not within %s%% "
-                            "of expected %s. Rerun with --write-profiles to "
-                            "regenerate this callcount."
-                            % (
-                            callcount, (variance * 100),
-                            expected_count))
+            _assert_stats_call_count(load_stats(), variance)
             return fn_result
         return update_wrapper(wrap, fn)
     return decorate
 
 
+def stats_call_count(stats, variance=0.05):
+    """Assert a target for the function call count recorded by the given
+    ``pstats.Stats`` object.
+
+    This is the assertion made by :func:`.function_call_count`, for
+    profiles which can't be collected by calling a function within the
+    current process, such as that of importing a module in a new
+    interpreter.
+
+    """
+    if not _profile_stats.has_stats() and not _profile_stats.write:
+        raise SkipTest("No profiling stats available on this "
+                    "platform for this function.  Run tests with "
+                    "--write-profiles to add statistics to %s for "
+                    "this platform." % _profile_stats.short_fname)
+    _assert_stats_call_count(stats, variance)
+
+
+def _assert_stats_call_count(stats, variance):
+    callcount = stats.total_calls
+
+    expected = _profile_stats.result(callcount)
+    if expected is None:
+        expected_count = None
+    else:
+        line_no, expected_count = expected
+
+    print(("Pstats calls: %d Expected %s" % (
+            callcount,
+            expected_count
+        )
+    ))
+    stats.print_stats()
+    #stats.print_callers()
+
+    if expected_count:
+        deviance = int(callcount * variance)
+        failed = abs(callcount - expected_count) > deviance
+
+        if failed:
+            if _profile_stats.write:
+                _profile_stats.replace(callcount)
+            else:
+                raise AssertionError(
+                    "Adjusted function call count %s not within %s%% "
+                    "of expected %s. Rerun with --write-profiles to "
+                    "regenerate this callcount."
+                    % (
+                    callcount, (variance * 100),
+                    expected_count))
+
+
 def _profile(fn, *args, **kw):
     filename = "%s.prof" % fn.__name__
 
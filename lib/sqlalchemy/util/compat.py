@@ -95,8 +95,17 @@ if py3k:
 else:
     from inspect import getargspec as inspect_getfullargspec
     inspect_getargspec = inspect_getfullargspec
-    from urllib import quote_plus, unquote_plus
     from urlparse import parse_qsl
+
+    # urllib is imported on first use; it pulls in socket, ssl and
+    # other modules which aren't otherwise needed.
+    def quote_plus(*arg, **kw):
+        from urllib import quote_plus
+        return quote_plus(*arg, **kw)
+
+    def unquote_plus(*arg, **kw):
+        from urllib import unquote_plus
+        return unquote_plus(*arg, **kw)
     import ConfigParser as configparser
     from StringIO import StringIO
     from cStringIO import StringIO as byte_buffer
@@ -8,7 +8,7 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
     @classmethod
     def setup_class(cls):
 
-        global t1, t2, metadata
+        global t1, t2, wide, metadata
         metadata = MetaData()
         t1 = Table('t1', metadata,
             Column('c1', Integer, primary_key=True),
@@ -18,6 +18,12 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             Column('c1', Integer, primary_key=True),
             Column('c2', String(30)))
 
+        wide = Table('wide', metadata,
+            *[Column('col%d' % i, Integer, primary_key=i == 0)
+                for i in range(100)],
+            schema='someschema'
+        )
+
         # do a "compile" ahead of time to load
         # deferred imports
         t1.insert().compile()
@@ -25,7 +31,7 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
         # go through all the TypeEngine
         # objects in use and pre-load their _type_affinity
         # entries.
-        for t in (t1, t2):
+        for t in (t1, t2, wide):
             for c in t.c:
                 c.type._type_affinity
         from sqlalchemy import types
@@ -72,4 +78,24 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
         def go():
             s = select([t1], t1.c.c2 == t2.c.c1).apply_labels()
             s.compile(dialect=self.dialect)
-        go()
\ No newline at end of file
+        go()
+
+    def test_select_wide(self):
+        s = select([wide])
+        s.compile(dialect=self.dialect)
+
+        @profiling.function_call_count()
+        def go():
+            s = select([wide])
+            s.compile(dialect=self.dialect)
+        go()
+
+    def test_select_wide_labels(self):
+        s = select([wide]).apply_labels()
+        s.compile(dialect=self.dialect)
+
+        @profiling.function_call_count()
+        def go():
+            s = select([wide]).apply_labels()
+            s.compile(dialect=self.dialect)
+        go()
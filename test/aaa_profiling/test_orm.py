@@ -257,6 +257,55 @@ class MergeBackrefsTest(fixtures.MappedTest):
         ]:
             s.merge(a)
 
+class BulkAppendTest(fixtures.MappedTest):
+    __requires__ = 'cpython',
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+            Column('id', Integer, primary_key=True)
+        )
+        Table('child', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('parent_id', Integer, ForeignKey('parent.id'))
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+        class Child(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        mapper(Parent, cls.tables.parent, properties={
+            'children': relationship(Child, backref='parent')
+        })
+        mapper(Child, cls.tables.child)
+
+    def test_extend(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        p = Parent()
+        children = [Child() for i in range(500)]
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            p.children.extend(children)
+        go()
+
+    def test_replace(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        p = Parent()
+        children = [Child() for i in range(500)]
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            p.children = children
+        go()
+
+
 class DeferOptionsTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -310,3 +359,48 @@ class DeferOptionsTest(fixtures.MappedTest):
             *[defer(letter) for letter in ['x', 'y', 'z', 'p', 'q', 'r']]).\
             all()
 
+
+
+class FlushUpdateTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('a', metadata,
+            Column('id', Integer, primary_key=True),
+            *[Column('c%d' % i, String(10)) for i in range(20)]
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        A = cls.classes.A
+        a = cls.tables.a
+        mapper(A, a)
+
+    @classmethod
+    def insert_data(cls):
+        A = cls.classes.A
+        s = Session()
+        s.add_all([
+            A(id=i, **dict(("c%d" % j, "x") for j in range(20)))
+            for i in range(1, 101)
+        ])
+        s.commit()
+
+    def test_update_few_cols(self):
+        # unchanged attributes shouldn't contribute to the
+        # cost of the UPDATE
+        A = self.classes.A
+        s = Session()
+        objs = s.query(A).all()
+        for obj in objs:
+            obj.c1 = "y"
+            obj.c2 = "y"
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            s.flush()
+        go()
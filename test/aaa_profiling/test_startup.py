@@ -0,0 +1,169 @@
+"""Track the cost of importing SQLAlchemy and configuring mappers.
+
+Imports are profiled within a new interpreter; the elapsed time of each
+is also reported, although only function call counts are asserted, as
+elsewhere in this suite.
+
+Command line tools and short-lived processes pay these costs before
+doing any work, so modules which are only needed for specific features
+should not be loaded by ``import sqlalchemy``.
+
+"""
+from sqlalchemy.testing import fixtures, profiling
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy import Integer, String, ForeignKey, MetaData
+from sqlalchemy.orm import mapper, relationship, configure_mappers, \
+    clear_mappers, class_mapper
+import subprocess
+import sys
+import os
+import pstats
+import tempfile
+
+
+class ImportTest(fixtures.TestBase):
+
+    def _loaded_modules(self, code):
+        import sqlalchemy
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(
+                                os.path.dirname(sqlalchemy.__file__))
+        script = (
+            "import sys\n"
+            "%s\n"
+            "sys.stdout.write(' '.join(sorted(name for name, mod in "
+            "sys.modules.items() if mod is not None)))\n" % code
+        )
+        proc = subprocess.Popen([sys.executable, "-c", script],
+                    env=env, stdout=subprocess.PIPE)
+        out = proc.communicate()[0]
+        assert proc.returncode == 0
+        return set(out.decode('ascii').split())
+
+    def test_import_sqlalchemy(self):
+        modules = self._loaded_modules("import sqlalchemy")
+        assert 'sqlalchemy.sql' in modules
+
+        for name in ('sqlalchemy.orm', 'sqlalchemy.engine.threadlocal',
+                        'sqlalchemy.ext', 'socket'):
+            assert name not in modules, "%s was imported" % name
+        loaded_dialects = [name for name in modules
+                        if name.startswith('sqlalchemy.dialects.')]
+        assert not loaded_dialects, loaded_dialects
+
+    def test_create_engine_loads_one_dialect(self):
+        modules = self._loaded_modules(
+                    "import sqlalchemy\n"
+                    "sqlalchemy.create_engine('sqlite://')")
+        loaded_dialects = set(name for name in modules
+                        if name.startswith('sqlalchemy.dialects.'))
+        assert loaded_dialects.issubset([
+                        'sqlalchemy.dialects.sqlite',
+                        'sqlalchemy.dialects.sqlite.base',
+                        'sqlalchemy.dialects.sqlite.pysqlite']), \
+                        loaded_dialects
+        assert 'sqlalchemy.orm' not in modules
+
+
+class ImportProfileTest(fixtures.TestBase):
+    __requires__ = 'cpython',
+
+    def _run(self, script):
+        import sqlalchemy
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(
+                                os.path.dirname(sqlalchemy.__file__))
+        proc = subprocess.Popen([sys.executable, "-c", script],
+                    env=env, stdout=subprocess.PIPE)
+        out = proc.communicate()[0]
+        assert proc.returncode == 0
+        return out.decode('ascii')
+
+    def _profile(self, code):
+        """Run the given code in a new interpreter under the profiler
+        and return the profile."""
+
+        fd, filename = tempfile.mkstemp(suffix='.prof')
+        os.close(fd)
+        try:
+            self._run(
+                "import cProfile\n"
+                "cProfile.run(%r, %r)\n" % (code, filename)
+            )
+            stats = pstats.Stats(filename)
+        finally:
+            os.unlink(filename)
+        return stats
+
+    def test_import_sqlalchemy(self):
+        profiling.stats_call_count(
+            self._profile("import sqlalchemy"), variance=0.10)
+
+    def test_import_orm(self):
+        profiling.stats_call_count(
+            self._profile("import sqlalchemy.orm"), variance=0.10)
+
+    def test_create_engine(self):
+        profiling.stats_call_count(
+            self._profile(
+                "import sqlalchemy\n"
+                "sqlalchemy.create_engine('sqlite://')"), variance=0.10)
+
+
+class ConfigureMappersTest(fixtures.TestBase):
+    __requires__ = 'cpython',
+
+    def teardown(self):
+        clear_mappers()
+
+    def _setup_mappers(self, count, prefix='t'):
+        metadata = MetaData()
+        classes = []
+        for i in range(count):
+            table = Table('%s%d' % (prefix, i), metadata,
+                        Column('id', Integer, primary_key=True),
+                        Column('data', String(30)),
+                        *(
+                            [Column('parent_id', Integer,
+                                    ForeignKey('%s%d.id' % (prefix, i - 1)))]
+                            if i else []
+                        )
+                    )
+            cls = type('%s%d' % (prefix.upper(), i), (object, ), {})
+            properties = {}
+            if i:
+                properties['parent'] = relationship(classes[i - 1],
+                                            backref='children')
+            mapper(cls, table, properties=properties)
+            classes.append(cls)
+        return classes
+
+    def test_configure_mappers(self):
+        # hold onto the classes; the mapper registry is weak referencing
+        classes = self._setup_mappers(20)
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            configure_mappers()
+        go()
+
+    def test_configure_on_demand(self):
+        # only the mappers related to the one in use are configured
+        classes = [self._setup_mappers(5, prefix='t%d_' % i)
+                        for i in range(10)]
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            classes[0][0]()
+        go()
+
+    def test_configure_on_demand_connected(self):
+        # the mappers related to the one in use only through
+        # relationships it has itself aren't configured up front
+        classes = self._setup_mappers(50)
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            classes[-1]()
+        go()
+        assert not class_mapper(classes[0], configure=False).configured
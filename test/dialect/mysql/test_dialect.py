@@ -1,6 +1,6 @@
 # coding: utf-8
 
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises
 from sqlalchemy import *
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.testing import fixtures
@@ -33,6 +33,72 @@ class DialectTest(fixtures.TestBase):
             }
         )
 
+class StatementTimeoutTest(fixtures.TestBase):
+    def _dialect(self, version):
+        from sqlalchemy.dialects.mysql import base as mysql
+        dialect = mysql.dialect()
+        dialect.server_version_info = version
+        return dialect
+
+    def test_select_hint(self):
+        dialect = self._dialect((5, 7, 8))
+        eq_(
+            dialect.set_statement_timeout(
+                None, "SELECT a FROM b", 2.5, None),
+            "SELECT /*+ MAX_EXECUTION_TIME(2500) */ a FROM b"
+        )
+        eq_(
+            dialect.set_statement_timeout(
+                None, "\n  select a\nFROM b", 1, None),
+            "\n  select /*+ MAX_EXECUTION_TIME(1000) */ a\nFROM b"
+        )
+
+    def test_non_select_unchanged(self):
+        dialect = self._dialect((5, 7, 8))
+        for stmt in (
+                "UPDATE a SET b=%s",
+                "(SELECT a FROM b) UNION (SELECT a FROM c)",
+                "SELECTED"):
+            eq_(
+                dialect.set_statement_timeout(None, stmt, 1, None),
+                stmt
+            )
+
+    def test_old_version(self):
+        dialect = self._dialect((5, 6, 10))
+        assert_raises(
+            NotImplementedError,
+            dialect.set_statement_timeout, None, "SELECT a FROM b", 1, None
+        )
+
+    def test_mariadb(self):
+        for version in [
+                    (10, 1, 2, 'MariaDB'),
+                    (5, 5, 5, 10, 2, 9, 'MariaDB')]:
+            dialect = self._dialect(version)
+            eq_(
+                dialect.set_statement_timeout(
+                    None, "SELECT a FROM b", 2.5, None),
+                "SET STATEMENT max_statement_time=2.5 FOR SELECT a FROM b"
+            )
+            eq_(
+                dialect.set_statement_timeout(
+                    None, "UPDATE a SET b=%s", 1, None),
+                "SET STATEMENT max_statement_time=1 FOR UPDATE a SET b=%s"
+            )
+
+    def test_mariadb_old_version(self):
+        for version in [
+                    (10, 0, 17, 'MariaDB'),
+                    (5, 5, 5, 10, 0, 17, 'MariaDB')]:
+            dialect = self._dialect(version)
+            assert_raises(
+                NotImplementedError,
+                dialect.set_statement_timeout, None, "SELECT a FROM b",
+                1, None
+            )
+
+
 class SQLModeDetectionTest(fixtures.TestBase):
     __only_on__ = 'mysql'
 
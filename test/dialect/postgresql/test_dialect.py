@@ -218,3 +218,17 @@ class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
                 ddl_compiler.get_column_specification(t.c.c),
                 "c %s NOT NULL" % expected
             )
+
+class StatementTimeoutTest(fixtures.TestBase):
+    __only_on__ = 'postgresql+psycopg2'
+
+    def test_prior_timeout_restored(self):
+        with testing.db.connect() as conn:
+            conn.execute("SET statement_timeout TO '12s'")
+            eq_(
+                conn.execution_options(statement_timeout=5).
+                    scalar("SHOW statement_timeout"),
+                "5s"
+            )
+            eq_(conn.scalar("SHOW statement_timeout"), "12s")
+            conn.execute("SET statement_timeout TO DEFAULT")
@@ -20,6 +20,7 @@ from sqlalchemy.testing import fixtures, AssertsCompiledSQL, \
 from sqlalchemy import testing
 import os
 from sqlalchemy.schema import CreateTable
+from nose import SkipTest
 
 class TestTypes(fixtures.TestBase, AssertsExecutionResults):
 
@@ -650,6 +651,60 @@ class DialectTest(fixtures.TestBase, AssertsExecutionResults):
             meta.drop_all()
 
 
+class StatementTimeoutTest(fixtures.TestBase):
+    __only_on__ = 'sqlite'
+
+    __requires__ = 'ad_hoc_engines',
+
+    # a statement which runs forever; requires SQLite 3.8.3
+    _slow = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL "\
+            "SELECT x + 1 FROM c) SELECT count(*) FROM c"
+
+    def setup(self):
+        if testing.db.dialect.server_version_info < (3, 8, 3):
+            raise SkipTest("WITH RECURSIVE requires SQLite 3.8.3")
+        self.engine = engines.testing_engine()
+
+    def test_timeout(self):
+        conn = self.engine.connect()
+        assert_raises_message(
+            exc.OperationalError,
+            "interrupted",
+            conn.execution_options(statement_timeout=.1).execute,
+            self._slow
+        )
+
+        # the progress handler is removed afterwards
+        dbapi_conn = conn.connection.connection
+        conn.execute("select 1")
+        calls = []
+        dbapi_conn.set_progress_handler(lambda: calls.append(1), 1)
+        try:
+            conn.execute("select 1")
+            assert calls
+        finally:
+            dbapi_conn.set_progress_handler(None, 1)
+
+    def test_timeout_not_reached(self):
+        conn = self.engine.connect().execution_options(statement_timeout=5)
+        eq_(conn.scalar("select 5"), 5)
+
+    def test_cancel(self):
+        import threading
+        conn = self.engine.connect()
+        timer = threading.Timer(.2, conn.cancel)
+        timer.start()
+        try:
+            assert_raises_message(
+                exc.OperationalError,
+                "interrupted",
+                conn.execute, self._slow
+            )
+        finally:
+            timer.cancel()
+        eq_(conn.scalar("select 5"), 5)
+
+
 class SQLTest(fixtures.TestBase, AssertsCompiledSQL):
 
     """Tests SQLite-dialect specific compilation."""
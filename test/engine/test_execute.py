@@ -601,6 +601,215 @@ class CompiledCacheTest(fixtures.TestBase):
         assert len(cache) == 1
         eq_(conn.execute("select count(*) from users").scalar(), 3)
 
+class ParameterConverterTest(fixtures.TestBase):
+    def _stmt(self):
+        class MyType(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "BIND_IN" + value
+
+        return select([column('q')]).where(
+                    (column('x') == bindparam('x', type_=MyType())) &
+                    (column('y') == bindparam('y')) &
+                    (column('z') == bindparam('x', type_=MyType()))
+                )
+
+    def _convert(self, dialect, params):
+        compiled = self._stmt().compile(dialect=dialect)
+        return compiled._parameter_converter(
+                            compiled.construct_params(params))
+
+    def test_positional(self):
+        dialect = default.DefaultDialect(paramstyle='qmark')
+        eq_(
+            self._convert(dialect, {'x': 'a', 'y': 5}),
+            ('BIND_INa', 5, 'BIND_INa')
+        )
+
+    def test_positional_no_processors(self):
+        dialect = default.DefaultDialect(paramstyle='format')
+        compiled = select([column('q')]).where(
+                    column('y') == bindparam('y')).\
+                    where(column('z') == bindparam('z')).\
+                    compile(dialect=dialect)
+        eq_(
+            compiled._parameter_converter({'y': 5, 'z': 6}),
+            (5, 6)
+        )
+
+    def test_positional_single(self):
+        dialect = default.DefaultDialect(paramstyle='qmark')
+        compiled = select([column('q')]).where(
+                    column('y') == bindparam('y')).compile(dialect=dialect)
+        eq_(compiled._parameter_converter({'y': 5}), (5, ))
+
+    def test_positional_none(self):
+        dialect = default.DefaultDialect(paramstyle='qmark')
+        compiled = select([column('q')]).compile(dialect=dialect)
+        eq_(compiled._parameter_converter({}), ())
+
+    def test_positional_sequence_format(self):
+        dialect = default.DefaultDialect(paramstyle='qmark')
+        dialect.execute_sequence_format = list
+        eq_(
+            self._convert(dialect, {'x': 'a', 'y': 5}),
+            ['BIND_INa', 5, 'BIND_INa']
+        )
+
+    def test_named(self):
+        dialect = default.DefaultDialect(paramstyle='named')
+        params = {'x': 'a', 'y': 5}
+        compiled = self._stmt().compile(dialect=dialect)
+        compiled_params = compiled.construct_params(params)
+        eq_(
+            compiled._parameter_converter(compiled_params),
+            {'x': 'BIND_INa', 'y': 5}
+        )
+        # the compiled parameters aren't modified
+        eq_(compiled_params, params)
+
+    def test_named_encoded_keys(self):
+        dialect = default.DefaultDialect(paramstyle='named')
+        dialect.supports_unicode_statements = False
+        eq_(
+            self._convert(dialect, {'x': 'a', 'y': 5}),
+            {util.b('x'): 'BIND_INa', util.b('y'): 5}
+        )
+
+
+class StatementTimeoutTest(fixtures.TestBase):
+    __only_on__ = 'sqlite'
+    __requires__ = 'ad_hoc_engines',
+
+    def _fixture(self):
+        eng = engines.testing_engine()
+        canary = Mock()
+
+        def set_statement_timeout(cursor, statement, timeout, context):
+            canary.set(statement, timeout)
+            return statement
+
+        def reset_statement_timeout(cursor, context):
+            canary.reset()
+        eng.dialect.set_statement_timeout = set_statement_timeout
+        eng.dialect.reset_statement_timeout = reset_statement_timeout
+        return eng, canary
+
+    def test_timeout_set_and_reset(self):
+        eng, canary = self._fixture()
+        conn = eng.connect().execution_options(statement_timeout=5)
+        conn.execute(select([literal(1)]))
+        eq_(
+            canary.mock_calls,
+            [call.set("SELECT ? AS anon_1", 5), call.reset()]
+        )
+
+    def test_statement_option(self):
+        eng, canary = self._fixture()
+        eng.execute(select([literal(1)]))
+        eq_(canary.mock_calls, [])
+        eng.execute(
+            select([literal(1)]).execution_options(statement_timeout=2.5))
+        eq_(
+            canary.mock_calls,
+            [call.set("SELECT ? AS anon_1", 2.5), call.reset()]
+        )
+
+    def test_reset_on_error(self):
+        eng, canary = self._fixture()
+        conn = eng.connect().execution_options(statement_timeout=5)
+        assert_raises(
+            tsa.exc.DBAPIError,
+            conn.execute, "select * from nonexistent"
+        )
+        eq_(
+            canary.mock_calls,
+            [call.set("select * from nonexistent", 5), call.reset()]
+        )
+
+    def test_statement_replaced(self):
+        eng = engines.testing_engine()
+        eng.dialect.set_statement_timeout = \
+            lambda cursor, statement, timeout, context: "SELECT 2"
+        eng.dialect.reset_statement_timeout = lambda cursor, context: None
+        eq_(
+            eng.connect().execution_options(statement_timeout=5).
+                scalar("SELECT 1"),
+            2
+        )
+
+    def test_events_see_replaced_statement(self):
+        eng = engines.testing_engine()
+        eng.dialect.set_statement_timeout = \
+            lambda cursor, statement, timeout, context: "SELECT 2"
+        eng.dialect.reset_statement_timeout = lambda cursor, context: None
+        canary = Mock()
+        event.listen(eng, "before_cursor_execute",
+            lambda conn, cursor, statement, *arg:
+                canary.before(statement))
+        event.listen(eng, "after_cursor_execute",
+            lambda conn, cursor, statement, *arg:
+                canary.after(statement))
+        eng.connect().execution_options(statement_timeout=5).\
+                scalar("SELECT 1")
+        eq_(
+            canary.mock_calls,
+            [call.before("SELECT 2"), call.after("SELECT 2")]
+        )
+
+    def test_reset_on_event_error(self):
+        eng, canary = self._fixture()
+
+        def before_cursor_execute(*arg):
+            raise ValueError("event failed")
+        event.listen(eng, "before_cursor_execute", before_cursor_execute)
+        conn = eng.connect().execution_options(statement_timeout=5)
+        assert_raises_message(
+            ValueError,
+            "event failed",
+            conn.execute, "SELECT 1"
+        )
+        eq_(
+            canary.mock_calls,
+            [call.set("SELECT 1", 5), call.reset()]
+        )
+
+    def test_not_supported(self):
+        eng = engines.testing_engine()
+        eng.dialect.set_statement_timeout = default.DefaultDialect.\
+            set_statement_timeout.__get__(eng.dialect)
+        assert_raises_message(
+            NotImplementedError,
+            "does not support statement timeouts",
+            eng.connect().execution_options(statement_timeout=5).
+                scalar, select([literal(1)])
+        )
+
+    def test_cancel(self):
+        eng = engines.testing_engine()
+        canary = Mock()
+        eng.dialect.do_cancel = canary
+        conn = eng.connect()
+        conn.cancel()
+        r = conn.execute(select([literal(1)]))
+        r.cancel()
+        dbapi_conn = conn.connection.connection
+        eq_(
+            canary.mock_calls,
+            [call(conn, dbapi_conn), call(conn, dbapi_conn)]
+        )
+
+    def test_cancel_closed(self):
+        eng = engines.testing_engine()
+        canary = Mock()
+        eng.dialect.do_cancel = canary
+        conn = eng.connect()
+        conn.close()
+        conn.cancel()
+        eq_(canary.mock_calls, [])
+
+
 class LogParamsTest(fixtures.TestBase):
     __only_on__ = 'sqlite'
     __requires__ = 'ad_hoc_engines',
@@ -1122,6 +1331,51 @@ class AlternateResultProxyTest(fixtures.TestBase):
     def test_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def _test_metadata_cache(self, cls):
+        class ExcCtx(default.DefaultExecutionContext):
+            def get_result_proxy(self):
+                return cls(self)
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+
+        compiled = select([self.table]).compile(self.engine)
+        conn = self.engine.connect()
+        r1 = conn.execute(compiled)
+        r2 = conn.execute(compiled)
+        eq_(r1.fetchall(), r2.fetchall())
+        r3 = self.engine.execute(select([self.table]))
+        assert r3._metadata is not r1._metadata
+        conn.close()
+        return r1, r2
+
+    def test_metadata_cached_per_compiled(self):
+        r1, r2 = self._test_metadata_cache(_result.ResultProxy)
+        assert r1._metadata is r2._metadata
+
+    def test_metadata_not_cached_buffered_column(self):
+        r1, r2 = self._test_metadata_cache(
+                            _result.BufferedColumnResultProxy)
+        assert r1._metadata is not r2._metadata
+
+    def test_metadata_cache_keyed_on_description(self):
+        compiled = select([self.table]).compile(self.engine)
+        conn = self.engine.connect()
+        r1 = conn.execute(compiled)
+        r1.close()
+        ctx = r1.context
+        eq_(
+            compiled._cached_metadata[0],
+            ctx._result_metadata_key(r1._saved_cursor.description)
+        )
+        assert compiled._cached_metadata[1] is r1._metadata
+
+        # a different description replaces the cached metadata
+        compiled._cached_metadata = (("bogus", ), r1._metadata)
+        r2 = conn.execute(compiled)
+        assert r2._metadata is not r1._metadata
+        assert compiled._cached_metadata[1] is r2._metadata
+        eq_(r2.fetchall(), [(i, "t_%d" % i) for i in range(1, 12)])
+        conn.close()
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
 
@@ -1,12 +1,13 @@
 from sqlalchemy import Integer, ForeignKey, String
 from sqlalchemy.types import PickleType, TypeDecorator, VARCHAR
 from sqlalchemy.orm import mapper, Session, composite
+from sqlalchemy.orm.base import instance_state
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.instrumentation import ClassManager
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.testing import eq_, assert_raises_message
 from sqlalchemy.testing.util import picklers
-from sqlalchemy import testing
+from sqlalchemy import testing, event
 from sqlalchemy.testing import fixtures
 import sys
 import pickle
@@ -28,7 +29,7 @@ class FooWithEq(object):
     def __eq__(self, other):
         return self.id == other.id
 
-from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.ext.mutable import MutableDict, MutableSnapshot
 
 class _MutableDictTestBase(object):
     run_define_tables = 'each'
@@ -271,6 +272,169 @@ class MutableAssociationScalarJSONTest(_MutableDictTestBase, fixtures.MappedTest
         )
 
 
+class MutableSnapshotTest(fixtures.MappedTest,
+                            testing.AssertsExecutionResults):
+    run_define_tables = 'each'
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('foo', metadata,
+            Column('id', Integer, primary_key=True,
+                            test_needs_autoincrement=True),
+            Column('data', MutableSnapshot.as_mutable(PickleType)),
+            Column('unrelated_data', String(50))
+        )
+
+    def setup_mappers(cls):
+        foo = cls.tables.foo
+
+        mapper(Foo, foo)
+
+    def teardown(self):
+        # clear out mapper and session events
+        Mapper.dispatch._clear()
+        ClassManager.dispatch._clear()
+        Session._pre_flush_hooks = ()
+        if event.contains(Session, 'before_commit',
+                            MutableSnapshot._check_snapshots):
+            event.remove(Session, 'before_commit',
+                            MutableSnapshot._check_snapshots)
+        super(MutableSnapshotTest, self).teardown()
+
+    def test_nested_mutation(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+        sess.close()
+
+        f1 = sess.query(Foo).first()
+        f1.data['a'].append('c')
+        sess.commit()
+        sess.close()
+
+        eq_(sess.query(Foo).first().data, {'a': ['b', 'c']})
+
+    def test_no_mutation(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        eq_(f1.data, {'a': ['b']})
+
+        self.assert_sql_count(testing.db, sess.commit, 0)
+
+    def test_mutation_after_insert(self):
+        sess = Session()
+        f1 = Foo(id=1, data={'a': ['b']})
+        sess.add(f1)
+        sess.flush()
+
+        f1.data['a'].append('c')
+        sess.commit()
+        sess.close()
+
+        eq_(sess.query(Foo).first().data, {'a': ['b', 'c']})
+
+    def test_flush_with_unrelated_change(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        f1.data['a'].append('c')
+        f1.unrelated_data = 'unrelated'
+        sess.flush()
+        assert f1 not in sess.dirty
+
+        f1.data['a'].append('d')
+        sess.commit()
+        sess.close()
+
+        eq_(sess.query(Foo).first().data, {'a': ['b', 'c', 'd']})
+
+    def test_replace(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        f1.data = {'c': ['d']}
+        sess.flush()
+
+        f1.data['c'].append('e')
+        sess.commit()
+        sess.close()
+
+        eq_(sess.query(Foo).first().data, {'c': ['d', 'e']})
+
+    def test_snapshots_per_session(self):
+        sess = Session()
+        sess.add_all([Foo(id=1, data={'a': ['b']}),
+                        Foo(id=2, data={'c': ['d']})])
+        sess.commit()
+        sess.close()
+
+        s1, s2 = Session(), Session()
+        f1 = s1.query(Foo).get(1)
+        f2 = s2.query(Foo).get(2)
+
+        eq_(list(MutableSnapshot._session_snapshots(s1)),
+                [instance_state(f1)])
+        eq_(list(MutableSnapshot._session_snapshots(s2)),
+                [instance_state(f2)])
+
+        f1.data['a'].append('x')
+        s2.commit()
+        assert instance_state(f1).committed_state == {}
+
+        s1.commit()
+        s1.close()
+        eq_(MutableSnapshot._session_snapshots(s1), {})
+        eq_(s2.query(Foo).get(1).data, {'a': ['b', 'x']})
+
+    def test_expunged(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        sess.expunge(f1)
+        f1.data['a'].append('c')
+        sess.commit()
+        assert instance_state(f1) not in \
+                    MutableSnapshot._session_snapshots(sess)
+        sess.close()
+
+        eq_(sess.query(Foo).first().data, {'a': ['b']})
+
+    def test_flush_clean_session(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        f1.data['a'].append('c')
+        self.assert_sql_count(testing.db, sess.flush, 1)
+        self.assert_sql_count(testing.db, sess.flush, 0)
+
+        eq_(sess.execute(self.tables.foo.select()).first()['data'],
+                {'a': ['b', 'c']})
+        sess.commit()
+
+    def test_autoflush_clean_session(self):
+        sess = Session()
+        sess.add(Foo(id=1, data={'a': ['b']}))
+        sess.commit()
+
+        f1 = sess.query(Foo).first()
+        f1.data['a'].append('c')
+        eq_(sess.query(Foo.data).scalar(), {'a': ['b', 'c']})
+        sess.rollback()
+
+        eq_(f1.data, {'a': ['b']})
+
+
 class _CompositeTestBase(object):
     @classmethod
     def define_tables(cls, metadata):
@@ -2496,6 +2496,77 @@ class ListenerTest(fixtures.ORMTest):
         f1.barlist.remove(None)
         eq_(canary, [(f1, b1), (f1, None), (f1, b2), (f1, None)])
 
+    def test_bulk_append_events(self):
+        """test that bulk appends fire each event in order, with
+        the values returned by the listeners."""
+
+        class Foo(object):
+            pass
+        class Bar(object):
+            def __init__(self, data):
+                self.data = data
+        instrumentation.register_class(Foo)
+        instrumentation.register_class(Bar)
+        attributes.register_attribute(Foo, 'barlist', uselist=True,
+                useobject=True)
+        attributes.register_attribute(Foo, 'barset', typecallable=set,
+                uselist=True, useobject=True)
+
+        canary = []
+        def append(state, child, initiator):
+            canary.append(child.data)
+            return Bar(child.data + " appended")
+        def set_append(state, child, initiator):
+            canary.append(child.data)
+        event.listen(Foo.barlist, 'append', append, retval=True)
+        event.listen(Foo.barset, 'append', set_append)
+
+        f1 = Foo()
+        b1, b2, b3 = Bar('b1'), Bar('b2'), Bar('b3')
+        f1.barlist.extend([b1, b2])
+        f1.barlist += [b3]
+        eq_(canary, ['b1', 'b2', 'b3'])
+        eq_([b.data for b in f1.barlist],
+            ['b1 appended', 'b2 appended', 'b3 appended'])
+        eq_(attributes.get_state_history(attributes.instance_state(f1),
+                        'barlist'), (f1.barlist, [], []))
+
+        canary[:] = []
+        f1.barlist = [f1.barlist[1], b1]
+        eq_(canary, ['b1'])
+        eq_([b.data for b in f1.barlist], ['b2 appended', 'b1 appended'])
+
+        canary[:] = []
+        f1.barset.update([b1, b2, b1])
+        f1.barset |= set([b2, b3])
+        eq_(canary, ['b1', 'b2', 'b3'])
+        eq_(f1.barset, set([b1, b2, b3]))
+
+    def test_bulk_append_listener_raises(self):
+        """test that values appended before a listener raises
+        remain in the collection."""
+
+        class Foo(object):
+            pass
+        class Bar(object):
+            pass
+        instrumentation.register_class(Foo)
+        instrumentation.register_class(Bar)
+        attributes.register_attribute(Foo, 'barlist', uselist=True,
+                useobject=True)
+
+        b1, b2, b3 = Bar(), Bar(), Bar()
+        def append(state, child, initiator):
+            if child is b2:
+                raise ValueError("no b2")
+        event.listen(Foo.barlist, 'append', append)
+
+        f1 = Foo()
+        assert_raises(ValueError, f1.barlist.extend, [b1, b2, b3])
+        eq_(f1.barlist, [b1])
+        eq_(attributes.get_state_history(attributes.instance_state(f1),
+                        'barlist'), ([b1], [], []))
+
     def test_propagate(self):
         classes = [None, None, None]
         canary = []
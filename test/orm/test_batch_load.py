@@ -0,0 +1,276 @@
+"""tests of "batch" lazy loaded attributes"""
+
+import pickle
+from sqlalchemy import testing
+from sqlalchemy import Integer, ForeignKeyConstraint
+from sqlalchemy.orm import mapper, relationship, create_session, \
+    batchload, attributes, strategies
+from sqlalchemy.testing import eq_, assert_raises, fixtures
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.orm import exc as orm_exc
+from test.orm import _fixtures
+
+
+class BatchLoadTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _user_address_fixture(self, **kw):
+        Address, addresses, users, User = (self.classes.Address,
+                                self.tables.addresses,
+                                self.tables.users,
+                                self.classes.User)
+
+        mapper(Address, addresses)
+        mapper(User, users, properties={
+            'addresses': relationship(Address,
+                                order_by=addresses.c.id, **kw)
+        })
+        return User, Address
+
+    def test_basic(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(
+                users[0].addresses,
+                [Address(id=1, email_address='jack@bean.com')]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(
+                [len(u.addresses) for u in users],
+                [1, 3, 1, 0]
+            )
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_option(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+
+        users = sess.query(User).options(batchload(User.addresses)).\
+                    order_by(User.id).all()
+
+        def go():
+            eq_(
+                [[a.id for a in u.addresses] for u in users],
+                [[1], [2, 3, 4], [5], []]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_separate_results(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        u7 = sess.query(User).filter_by(id=7).one()
+        u8 = sess.query(User).filter_by(id=8).one()
+
+        def go():
+            eq_(len(u7.addresses), 1)
+            eq_(len(u8.addresses), 3)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_small_chunks(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        strategy = User.addresses.property.\
+                        _get_strategy_by_cls(strategies.BatchLazyLoader)
+        strategy._chunksize = 3
+        try:
+            users = sess.query(User).order_by(User.id).all()
+
+            def go():
+                eq_(
+                    [len(u.addresses) for u in users],
+                    [1, 3, 1, 0]
+                )
+            self.assert_sql_count(testing.db, go, 2)
+        finally:
+            del strategy._chunksize
+
+    def test_pending_changes_not_overwritten(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        u7, u8 = sess.query(User).filter(User.id.in_([7, 8])).\
+                    order_by(User.id).all()
+        u8.addresses = []
+        eq_(len(u7.addresses), 1)
+        eq_(u8.addresses, [])
+
+    def test_expire_reloads(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        eq_(len(users[1].addresses), 3)
+
+        sess.expire(users[1])
+
+        def go():
+            eq_(len(users[1].addresses), 3)
+        # refresh of the row, then the plain lazyload
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_one_uses_identity_map(self):
+        Address, addresses, users, User = (self.classes.Address,
+                                self.tables.addresses,
+                                self.tables.users,
+                                self.classes.User)
+
+        mapper(User, users)
+        mapper(Address, addresses, properties={
+            'user': relationship(User, lazy='batch')
+        })
+        sess = create_session()
+
+        addrs = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(
+                [a.user.id for a in addrs],
+                [7, 8, 8, 8, 9]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.expunge_all()
+        u8 = sess.query(User).get(8)
+        addrs = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            assert addrs[1].user is u8
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_many_to_many(self):
+        items, Order, orders, order_items, Item = (self.tables.items,
+                                self.classes.Order,
+                                self.tables.orders,
+                                self.tables.order_items,
+                                self.classes.Item)
+
+        mapper(Item, items)
+        mapper(Order, orders, properties={
+            'items': relationship(Item, secondary=order_items,
+                                lazy='batch', order_by=items.c.id)
+        })
+        sess = create_session()
+
+        orders = sess.query(Order).order_by(Order.id).all()
+
+        def go():
+            eq_(
+                [[i.id for i in o.items] for o in orders],
+                [[1, 2, 3], [1, 2, 3], [3, 4, 5], [1, 5], [5]]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_self_referential(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node, lazy='batch',
+                                order_by=nodes.c.id)
+        })
+        sess = create_session()
+        n1 = Node(data='n1', children=[Node(data='n11'), Node(data='n12')])
+        n2 = Node(data='n2', children=[Node(data='n21')])
+        sess.add_all([n1, n2])
+        sess.flush()
+        sess.expunge_all()
+
+        roots = sess.query(Node).filter(Node.parent_id == None).\
+                    order_by(Node.id).all()
+
+        def go():
+            eq_(
+                [[c.data for c in n.children] for n in roots],
+                [['n11', 'n12'], ['n21']]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(
+                [c.children for n in roots for c in n.children],
+                [[], [], []]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_detached(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        u = sess.query(User).filter_by(id=7).one()
+        sess.expunge(u)
+        assert_raises(orm_exc.DetachedInstanceError, getattr, u, 'addresses')
+
+    def test_pickle(self):
+        User, Address = self._user_address_fixture(lazy='batch')
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        state = attributes.instance_state(users[1])
+        loader = pickle.loads(pickle.dumps(state.callables['addresses']))
+        assert isinstance(loader, strategies.LoadLazyAttribute)
+        eq_(len(loader(state)), 3)
+
+
+class CompositePKBatchLoadTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+            Column('a', Integer, primary_key=True),
+            Column('b', Integer, primary_key=True),
+        )
+        Table('child', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('parent_a', Integer),
+            Column('parent_b', Integer),
+            ForeignKeyConstraint(['parent_a', 'parent_b'],
+                                    ['parent.a', 'parent.b'])
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Comparable):
+            pass
+
+        class Child(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        mapper(Parent, cls.tables.parent, properties={
+            'children': relationship(Child, lazy='batch',
+                                order_by=cls.tables.child.c.id)
+        })
+        mapper(Child, cls.tables.child)
+
+    @classmethod
+    def insert_data(cls):
+        parent, child = cls.tables.parent, cls.tables.child
+        parent.insert().execute(
+            {'a': 1, 'b': 1}, {'a': 1, 'b': 2}, {'a': 2, 'b': 1}
+        )
+        child.insert().execute(
+            {'id': 1, 'parent_a': 1, 'parent_b': 1},
+            {'id': 2, 'parent_a': 1, 'parent_b': 2},
+            {'id': 3, 'parent_a': 1, 'parent_b': 2},
+        )
+
+    def test_composite_pk(self):
+        Parent = self.classes.Parent
+        sess = create_session()
+        parents = sess.query(Parent).order_by(Parent.a, Parent.b).all()
+
+        def go():
+            eq_(
+                [[c.id for c in p.children] for p in parents],
+                [[1], [2, 3], []]
+            )
+        self.assert_sql_count(testing.db, go, 1)
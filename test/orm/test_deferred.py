@@ -3,9 +3,13 @@ from sqlalchemy import testing, util
 from sqlalchemy.orm import mapper, deferred, defer, undefer, Load, \
     load_only, undefer_group, create_session, synonym, relationship, Session,\
     joinedload, defaultload
+from sqlalchemy.orm import with_polymorphic, attributes
 from sqlalchemy.testing import eq_, AssertsCompiledSQL
 from test.orm import _fixtures
+from test.orm.inheritance._poly_fixtures import _Polymorphic, \
+    Person, Engineer, Manager, Boss
 from sqlalchemy.orm import strategies
+import pickle
 
 class DeferredTest(AssertsCompiledSQL, _fixtures.FixtureTest):
 
@@ -232,6 +236,136 @@ class DeferredTest(AssertsCompiledSQL, _fixtures.FixtureTest):
         eq_(o1.description, 'order 1')
 
 
+class BatchDeferredTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _order_fixture(self, **kw):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders, properties=util.OrderedDict([
+            ('description', deferred(orders.c.description, **kw)),
+            ('opened', deferred(orders.c.isopen, **kw))
+        ]))
+        return Order
+
+    def test_basic(self):
+        Order = self._order_fixture(batch=True)
+
+        sess = create_session()
+        orders = sess.query(Order).order_by(Order.id).all()
+
+        def go():
+            eq_(orders[2].description, 'order 3')
+        self.sql_eq_(go, [
+            ("SELECT orders.id AS orders_id, "
+             "orders.description AS orders_description "
+             "FROM orders WHERE orders.id IN "
+             "(:id_1, :id_2, :id_3, :id_4, :id_5)",
+             {'id_1': 3, 'id_2': 1, 'id_3': 2, 'id_4': 4, 'id_5': 5})])
+
+        def go():
+            eq_(
+                [o.description for o in orders],
+                ['order 1', 'order 2', 'order 3', 'order 4', 'order 5']
+            )
+        self.assert_sql_count(testing.db, go, 0)
+        assert not sess.dirty
+
+    def test_group(self):
+        Order = self._order_fixture(batch=True, group='primary')
+
+        sess = create_session()
+        orders = sess.query(Order).order_by(Order.id).all()
+
+        def go():
+            eq_(
+                [(o.description, o.opened) for o in orders],
+                [('order 1', 0), ('order 2', 0), ('order 3', 1),
+                    ('order 4', 1), ('order 5', 0)]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_small_chunks(self):
+        Order = self._order_fixture(batch=True)
+
+        sess = create_session()
+        orders = sess.query(Order).order_by(Order.id).all()
+
+        strategy = Order.description.property.\
+                        _get_strategy_by_cls(strategies.DeferredColumnLoader)
+        strategy._chunksize = 2
+        try:
+            def go():
+                eq_(
+                    [o.description for o in orders],
+                    ['order 1', 'order 2', 'order 3', 'order 4', 'order 5']
+                )
+            self.assert_sql_count(testing.db, go, 3)
+        finally:
+            del strategy._chunksize
+
+    def test_preserve_changes(self):
+        Order = self._order_fixture(batch=True, group='primary')
+
+        sess = create_session()
+        o1, o2, o3 = sess.query(Order).filter(Order.id.in_([1, 2, 3])).\
+                        order_by(Order.id).all()
+        o2.description = 'somenewdescription'
+
+        def go():
+            eq_(o1.opened, 0)
+        self.assert_sql_count(testing.db, go, 1)
+
+        assert 'description' in o3.__dict__
+        assert 'opened' not in o2.__dict__
+        eq_(o2.description, 'somenewdescription')
+        assert o2 in sess.dirty
+        assert o3 not in sess.dirty
+
+    def test_separate_results(self):
+        Order = self._order_fixture(batch=True)
+
+        sess = create_session()
+        o1 = sess.query(Order).get(1)
+        o2 = sess.query(Order).get(2)
+
+        def go():
+            eq_(o1.description, 'order 1')
+            eq_(o2.description, 'order 2')
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_option(self):
+        Order = self._order_fixture(batch=True)
+
+        sess = create_session()
+        orders = sess.query(Order).options(undefer('description')).\
+                    order_by(Order.id).all()
+
+        def go():
+            eq_(orders[0].description, 'order 1')
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            eq_([o.opened for o in orders], [0, 0, 1, 1, 0])
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_pickle(self):
+        Order = self._order_fixture(batch=True)
+
+        sess = create_session()
+        orders = sess.query(Order).order_by(Order.id).all()
+        state = attributes.instance_state(orders[1])
+        loader = pickle.loads(pickle.dumps(state.callables['description']))
+        assert isinstance(loader, strategies.LoadDeferredColumns)
+
+        def go():
+            loader(state)
+        self.assert_sql_count(testing.db, go, 1)
+        eq_(orders[1].description, 'order 2')
+        assert 'description' not in orders[2].__dict__
+
+
 class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
     __dialect__ = 'default'
 
@@ -439,7 +573,8 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
         sess = create_session()
         q = sess.query(Order).options(load_only("isopen", "description"))
         self.assert_compile(q,
-            "SELECT orders.description AS orders_description, "
+            "SELECT orders.id AS orders_id, "
+            "orders.description AS orders_description, "
             "orders.isopen AS orders_isopen FROM orders")
 
     def test_load_only_w_deferred(self):
@@ -456,6 +591,7 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
                 )
         self.assert_compile(q,
             "SELECT orders.description AS orders_description, "
+            "orders.id AS orders_id, "
             "orders.user_id AS orders_user_id, "
             "orders.isopen AS orders_isopen FROM orders")
 
@@ -522,7 +658,8 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
                 )
 
         self.assert_compile(q,
-            "SELECT users.name AS users_name, orders.id AS orders_id, "
+            "SELECT users.id AS users_id, "
+            "users.name AS users_name, orders.id AS orders_id, "
             "addresses.id AS addresses_id, addresses.email_address "
             "AS addresses_email_address FROM users, orders, addresses"
             )
@@ -551,10 +688,9 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
                 defaultload("orders").load_only("id")
             )
 
-        # hmmmm joinedload seems to be forcing users.id into here...
         self.assert_compile(
             q,
-            "SELECT users.name AS users_name, users.id AS users_id, "
+            "SELECT users.id AS users_id, users.name AS users_name, "
             "addresses_1.id AS addresses_1_id, "
             "addresses_1.email_address AS addresses_1_email_address, "
             "orders_1.id AS orders_1_id FROM users "
@@ -564,3 +700,60 @@ class DeferredOptionsTest(AssertsCompiledSQL, _fixtures.FixtureTest):
         )
 
 
+class InheritanceTest(_Polymorphic):
+    __dialect__ = 'default'
+
+    def test_load_only_subclass(self):
+        s = Session()
+        q = s.query(Person).with_polymorphic('*').\
+                options(load_only('name')).order_by(Person.person_id)
+        self.assert_compile(q,
+            "SELECT people.person_id AS people_person_id, "
+            "people.name AS people_name, people.type AS people_type, "
+            "engineers.person_id AS engineers_person_id, "
+            "managers.person_id AS managers_person_id "
+            "FROM people LEFT OUTER JOIN engineers "
+            "ON people.person_id = engineers.person_id "
+            "LEFT OUTER JOIN managers "
+            "ON people.person_id = managers.person_id "
+            "LEFT OUTER JOIN boss ON managers.person_id = boss.boss_id "
+            "ORDER BY people.person_id"
+        )
+
+        result = q.all()
+        eq_(
+            [type(p) for p in result],
+            [Engineer, Engineer, Boss, Manager, Engineer]
+        )
+        for p in result:
+            assert 'name' in p.__dict__
+            assert 'status' not in p.__dict__
+        eq_(result[0].primary_language, 'java')
+
+    def test_load_only_aliased_subclass(self):
+        s = Session()
+        wp = with_polymorphic(Person, [Engineer, Manager])
+        q = s.query(wp).options(load_only('name')).\
+                order_by(wp.person_id)
+        result = q.all()
+        eq_(
+            [p.name for p in result],
+            ['dilbert', 'wally', 'pointy haired boss', 'dogbert', 'vlad']
+        )
+        for p in result:
+            assert 'status' not in p.__dict__
+            assert 'engineer_name' not in p.__dict__
+            assert 'manager_name' not in p.__dict__
+
+    def test_load_only_subclass_explicit(self):
+        s = Session()
+        q = s.query(Person).with_polymorphic([Engineer]).\
+                options(
+                    load_only('name'),
+                    undefer(Engineer.primary_language)
+                ).order_by(Person.person_id)
+        result = q.all()
+        e1 = result[0]
+        assert 'primary_language' in e1.__dict__
+        assert 'engineer_name' not in e1.__dict__
+        eq_(e1.primary_language, 'java')
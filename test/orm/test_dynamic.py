@@ -169,6 +169,176 @@ class DynamicTest(_DynamicFixture, _fixtures.FixtureTest, AssertsCompiledSQL):
         u = sess.query(User).first()
         eq_(u.addresses.count(), 1)
 
+    def test_count_after_delete(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_(u.addresses.count(), 3)
+        sess.delete(sess.query(Address).get(2))
+        sess.flush()
+        eq_(u.addresses.count(), 2)
+
+    def test_count_after_fk_add(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_(u.addresses.count(), 3)
+        sess.add(Address(user_id=8, email_address='foo'))
+        sess.flush()
+        eq_(u.addresses.count(), 4)
+
+    def test_cached_count(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session(autocommit=False, autoflush=True)
+        u = sess.query(User).get(8)
+
+        def go():
+            eq_(u.addresses.cached_count(), 3)
+            eq_(u.addresses.cached_count(), 3)
+        self.assert_sql_count(testing.db, go, 1)
+
+        # append, then flush as part of the COUNT
+        u.addresses.append(Address(email_address='foo'))
+        def go():
+            eq_(u.addresses.cached_count(), 4)
+            eq_(u.addresses.cached_count(), 4)
+        self.assert_sql_count(testing.db, go, 2)
+
+        # a flushed change elsewhere in the session
+        sess.delete(sess.query(Address).get(2))
+        sess.flush()
+        eq_(u.addresses.cached_count(), 3)
+
+        # a new transaction
+        sess.rollback()
+        eq_(u.addresses.cached_count(), 3)
+
+    def test_cached_count_flushed_append(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session(autocommit=False, autoflush=False)
+        u = sess.query(User).get(8)
+
+        eq_(u.addresses.cached_count(), 3)
+        sess.add(Address(user_id=8, email_address='foo'))
+        sess.flush()
+        eq_(u.addresses.cached_count(), 4)
+        sess.rollback()
+
+    def test_cached_count_autocommit(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        def go():
+            eq_(u.addresses.cached_count(), 3)
+            eq_(u.addresses.cached_count(), 3)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_count_filter(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_(u.addresses.count(), 3)
+        eq_(
+            u.addresses.filter(Address.email_address.like('%wood%')).count(),
+            1
+        )
+
+    def test_contains(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+        a2, a1 = sess.query(Address).get(2), sess.query(Address).get(1)
+
+        def go():
+            assert a2 in u.addresses
+            assert a1 not in u.addresses
+        self.assert_sql_count(testing.db, go, 2)
+
+        self.assert_sql_count(testing.db,
+                    lambda: Address() not in u.addresses, 0)
+
+    def test_contains_pending(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session(autoflush=False)
+        u = sess.query(User).get(8)
+        a1, a2 = sess.query(Address).get(1), sess.query(Address).get(2)
+
+        u.addresses.append(a1)
+        u.addresses.remove(a2)
+
+        def go():
+            assert a1 in u.addresses
+            assert a2 not in u.addresses
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_transient_contains(self):
+        User, Address = self._user_address_fixture()
+        u1 = User()
+        a1 = Address()
+        u1.addresses.append(a1)
+        assert a1 in u1.addresses
+        assert Address() not in u1.addresses
+
+    def test_pages(self):
+        User, Address = self._user_address_fixture(
+                    addresses_args={
+                        "order_by": self.tables.addresses.c.id.desc()})
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        def go():
+            eq_(
+                [[a.id for a in page] for page in u.addresses.pages(2)],
+                [[2, 3], [4]]
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+        def go():
+            eq_(
+                [[a.id for a in page] for page in u.addresses.pages(4)],
+                [[2, 3, 4]]
+            )
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.query(Address).get(5)
+        eq_(
+            [[a.id for a in page] for page in u.addresses.pages(3)],
+            [[2, 3, 4]]
+        )
+
+    def test_pages_m2m(self):
+        Order, Item = self._order_item_fixture()
+        sess = create_session()
+        o = sess.query(Order).get(1)
+
+        eq_(
+            [[i.id for i in page] for page in o.items.pages(2)],
+            [[1, 2], [3]]
+        )
+
+    def test_transient_pages(self):
+        User, Address = self._user_address_fixture()
+        u1 = User()
+        a1, a2, a3 = Address(), Address(), Address()
+        u1.addresses.extend([a1, a2, a3])
+        eq_(list(u1.addresses.pages(2)), [[a1, a2], [a3]])
+
+    def test_pages_composite_criterion(self):
+        from sqlalchemy.orm.query import _KeysetCriterion
+        users = self.tables.users
+
+        self.assert_compile(
+            _KeysetCriterion([users.c.id, users.c.name], [5, 'ed'],
+                                [False, False]),
+            "(users.id > :id_1 OR users.id = :id_2 AND users.name > :name_1)",
+            checkparams={'id_1': 5, 'id_2': 5, 'name_1': 'ed'},
+            dialect='default'
+        )
+
     def test_dynamic_on_backref(self):
         users, Address, addresses, User = (self.tables.users,
                                 self.classes.Address,
@@ -1461,6 +1461,82 @@ class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
 
 
 
+class EagerAdapterCacheTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+    __dialect__ = 'default'
+
+    def _fixture(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(mapper(Address, addresses),
+                                lazy='joined', order_by=addresses.c.id)
+        })
+        return User, Address
+
+    def test_adapter_reused(self):
+        User, Address = self._fixture()
+        sess = create_session()
+
+        q = sess.query(User).filter(User.id == 7)
+        eq_(q.all(), [User(id=7, addresses=[Address(id=1)])])
+
+        cache = sa.inspect(Address)._eager_adapter_cache
+        eq_(len(cache), 1)
+        adapter = list(cache.values())[0]
+
+        eq_(q.all(), [User(id=7, addresses=[Address(id=1)])])
+        eq_(len(cache), 1)
+        is_(list(cache.values())[0], adapter)
+
+    def test_same_path_twice_in_statement(self):
+        User, Address = self._fixture()
+        sess = create_session()
+
+        self.assert_compile(
+            sess.query(User.id).select_from(User).
+                    add_entity(User).add_entity(User),
+            "SELECT users.id AS users_id, users.name AS users_name, "
+            "addresses_1.id AS addresses_1_id, "
+            "addresses_1.user_id AS addresses_1_user_id, "
+            "addresses_1.email_address AS addresses_1_email_address, "
+            "addresses_2.id AS addresses_2_id, "
+            "addresses_2.user_id AS addresses_2_user_id, "
+            "addresses_2.email_address AS addresses_2_email_address "
+            "FROM users LEFT OUTER JOIN addresses AS addresses_1 "
+            "ON users.id = addresses_1.user_id "
+            "LEFT OUTER JOIN addresses AS addresses_2 "
+            "ON users.id = addresses_2.user_id "
+            "ORDER BY addresses_1.id, addresses_2.id"
+        )
+
+    def test_reset_on_configure(self):
+        User, Address = self._fixture()
+        sess = create_session()
+
+        sess.query(User).all()
+        eq_(len(sa.inspect(Address)._eager_adapter_cache), 1)
+
+        class SubAddress(Address):
+            pass
+        mapper(SubAddress, inherits=Address)
+
+        eq_(len(sa.inspect(Address)._eager_adapter_cache), 0)
+
+    def test_aliased_entity_adapter_reused(self):
+        User, Address = self._fixture()
+        sess = create_session()
+
+        ua = aliased(User)
+        q1 = sess.query(ua)
+        q2 = sess.query(ua).filter(ua.id == 7)
+        is_(q1._mapper_adapter_map[ua][1], q2._mapper_adapter_map[ua][1])
+
+
 class SubqueryAliasingTest(fixtures.MappedTest, testing.AssertsCompiledSQL):
     """test #2188"""
 
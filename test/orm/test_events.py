@@ -319,6 +319,30 @@ class MapperEventsTest(_RemoveListeners, _fixtures.FixtureTest):
         mapper(Address, addresses)
         eq_(canary, [User, Address])
 
+    def test_after_configured_partial(self):
+        """after_configured fires only once all mappers are
+        configured, not when a mapper is configured on demand."""
+
+        User, users, Keyword, keywords = (self.classes.User,
+                                self.tables.users,
+                                self.classes.Keyword,
+                                self.tables.keywords)
+
+        canary = []
+        event.listen(Mapper, 'after_configured',
+                        lambda: canary.append(True))
+
+        um = mapper(User, users)
+        km = mapper(Keyword, keywords)
+        User()
+        assert um.configured
+        assert not km.configured
+        eq_(canary, [])
+
+        Keyword()
+        assert km.configured
+        eq_(canary, [True])
+
 class DeferredMapperEventsTest(_RemoveListeners, _fixtures.FixtureTest):
     """"test event listeners against unmapped classes.
 
@@ -637,6 +637,240 @@ class M2OGetTest(_fixtures.FixtureTest):
             assert ad3.user is None
         self.assert_sql_count(testing.db, go, 1)
 
+class RaiseLoadTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_o2m_raise(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, lazy='raise')
+        })
+        mapper(Address, addresses)
+
+        sess = create_session()
+        u1 = sess.query(User).get(7)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "'User.addresses' is not available due to lazy='raise'",
+            getattr, u1, 'addresses'
+        )
+
+    def test_m2o_raise_uses_identity_map(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users)
+        mapper(Address, addresses, properties={
+            'user': relationship(User, lazy='raise')
+        })
+
+        sess = create_session()
+        a1 = sess.query(Address).get(1)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "'Address.user' is not available due to lazy='raise'",
+            getattr, a1, 'user'
+        )
+
+        u7 = sess.query(User).get(7)
+        def go():
+            assert a1.user is u7
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_option(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address)
+        })
+        mapper(Address, addresses)
+
+        sess = create_session()
+        u7, u8 = sess.query(User).options(sa.orm.raiseload('*')).\
+                    filter(User.id.in_([7, 8])).order_by(User.id).all()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "'User.addresses' is not available due to lazy='raise'",
+            getattr, u7, 'addresses'
+        )
+
+        u9 = sess.query(User).get(9)
+        eq_(len(u9.addresses), 1)
+
+    def test_option_overrides_raise(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, lazy='raise')
+        })
+        mapper(Address, addresses)
+
+        sess = create_session()
+        u8 = sess.query(User).options(sa.orm.lazyload(User.addresses)).\
+                    get(8)
+        eq_(len(u8.addresses), 3)
+
+    def test_flush_loads(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, lazy='raise')
+        })
+        mapper(Address, addresses)
+
+        sess = create_session()
+        u = User(name='u1', addresses=[Address(email_address='a1')])
+        sess.add(u)
+        sess.flush()
+        sess.expunge_all()
+
+        # the flush loads the collection in order to
+        # null out the foreign key
+        u = sess.query(User).filter_by(name='u1').one()
+        sess.delete(u)
+        sess.flush()
+        eq_(
+            sess.query(Address.user_id).
+                    filter_by(email_address='a1').scalar(),
+            None
+        )
+
+
+class LazyLoadStatsTest(_fixtures.FixtureTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _fixture(self, threshold):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address)
+        })
+        mapper(Address, addresses)
+        return sa.orm.Session(testing.db,
+                            lazyload_warn_threshold=threshold)
+
+    def test_no_stats_by_default(self):
+        sess = create_session()
+        assert sess.lazyload_stats is None
+
+    def test_counts(self):
+        User = self.classes.User
+        sess = self._fixture(10)
+        users = sess.query(User).all()
+        for u in users:
+            u.addresses
+
+        prop = User.addresses.property
+        eq_(sess.lazyload_stats.counts[prop], 4)
+
+        stacks = sess.lazyload_stats.by_stack(prop)
+        eq_(len(stacks), 1)
+        stack, count = stacks[0]
+        eq_(count, 4)
+        eq_(stack[-1][2], 'test_counts')
+
+    def test_warns_over_threshold(self):
+        User = self.classes.User
+        sess = self._fixture(2)
+        users = sess.query(User).all()
+
+        def go():
+            for u in users:
+                u.addresses
+        assert_raises_message(
+            sa_exc.SAWarning,
+            r"Relationship User.addresses has lazy loaded more than 2 "
+            r"times within a single unit of work; most recent call at "
+            r".*test_lazy_relations.py:\d+ in go\(\)",
+            go
+        )
+        eq_(sess.lazyload_stats.counts[self.classes.User.addresses.property],
+            3)
+
+    def test_reset_on_commit(self):
+        User = self.classes.User
+        sess = self._fixture(10)
+        for u in sess.query(User).all():
+            u.addresses
+        prop = User.addresses.property
+        eq_(sess.lazyload_stats.counts[prop], 4)
+
+        sess.commit()
+        eq_(sess.lazyload_stats.counts[prop], 0)
+        eq_(sess.lazyload_stats.by_stack(prop), [])
+
+    def test_reset_on_flush(self):
+        User = self.classes.User
+        sess = self._fixture(10)
+        users = sess.query(User).order_by(User.id).all()
+        for u in users:
+            u.addresses
+        prop = User.addresses.property
+        eq_(sess.lazyload_stats.counts[prop], 4)
+
+        # a flush with nothing to write isn't a unit of work
+        sess.flush()
+        eq_(sess.lazyload_stats.counts[prop], 4)
+
+        users[0].name = 'jack jr.'
+        sess.flush()
+        eq_(sess.lazyload_stats.counts[prop], 0)
+        sess.rollback()
+
+    def test_reset_autocommit(self):
+        User = self.classes.User
+        sess = self._fixture(10)
+        sess.autocommit = True
+        sess.close()
+
+        users = sess.query(User).order_by(User.id).all()
+        for u in users:
+            u.addresses
+        prop = User.addresses.property
+        eq_(sess.lazyload_stats.counts[prop], 4)
+
+        users[0].name = 'jack jr.'
+        sess.flush()
+        eq_(sess.lazyload_stats.counts[prop], 0)
+        users[0].name = 'jack'
+        sess.flush()
+
+        for u in users:
+            sess.expire(u, ['addresses'])
+            u.addresses
+        eq_(sess.lazyload_stats.counts[prop], 4)
+        sess.begin()
+        eq_(sess.lazyload_stats.counts[prop], 0)
+        sess.rollback()
+
+        for u in users:
+            sess.expire(u, ['addresses'])
+            u.addresses
+        eq_(sess.lazyload_stats.counts[prop], 4)
+        sess.close()
+        eq_(sess.lazyload_stats.counts[prop], 0)
+
+
 class CorrelatedTest(fixtures.MappedTest):
 
     @classmethod
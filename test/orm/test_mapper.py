@@ -10,7 +10,7 @@ from sqlalchemy.orm import mapper, relationship, backref, \
     create_session, class_mapper, configure_mappers, reconstructor, \
     validates, aliased, defer, deferred, synonym, attributes, \
     column_property, composite, dynamic_loader, \
-    comparable_property, Session
+    comparable_property, Session, joinedload_all
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import eq_, AssertsCompiledSQL, is_
 from sqlalchemy.testing import fixtures
@@ -207,6 +207,106 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
         assert User.addresses
         assert sa.orm.mapperlib.Mapper._new_mappers is False
 
+    def test_configure_on_demand(self):
+        """Using a mapper configures it along with the mappers
+        that have relationships to it, but not unrelated mappers."""
+
+        users, Address, addresses, User, Keyword, keywords = (
+                                self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User,
+                                self.classes.Keyword,
+                                self.tables.keywords)
+
+        um = mapper(User, users)
+        am = mapper(Address, addresses, properties={
+                'user': relationship(User, backref="addresses")})
+        km = mapper(Keyword, keywords)
+
+        User()
+        assert um.configured
+        assert am.configured
+        assert not km.configured
+        assert User.addresses
+        assert sa.orm.mapperlib.Mapper._new_mappers is True
+
+        create_session().query(Keyword)
+        assert km.configured
+        assert sa.orm.mapperlib.Mapper._new_mappers is False
+
+    def test_configure_on_demand_relationship_target(self):
+        """The target of a relationship is configured once a
+        query path reaches it, along with the mappers that add
+        a backref to it."""
+
+        users, Address, addresses, User, Dingaling, dingalings, \
+            Keyword, keywords = (
+                                self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User,
+                                self.classes.Dingaling,
+                                self.tables.dingalings,
+                                self.classes.Keyword,
+                                self.tables.keywords)
+
+        um = mapper(User, users, properties={
+                'addresses': relationship(Address)})
+        am = mapper(Address, addresses)
+        dm = mapper(Dingaling, dingalings, properties={
+                'address': relationship(Address, backref='dingalings')})
+        km = mapper(Keyword, keywords)
+
+        sess = create_session()
+        sess.query(User)
+        assert um.configured
+        assert not am.configured
+        assert not dm.configured
+
+        q = sess.query(User).options(
+                    joinedload_all("addresses.dingalings"))
+        assert am.configured
+        assert dm.configured
+        assert not km.configured
+        q.all()
+
+    def test_configure_on_demand_inheritance(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        class SubUser(User):
+            pass
+
+        um = mapper(User, users)
+        sm = mapper(SubUser, inherits=um)
+        am = mapper(Address, addresses, properties={
+                'user': relationship(SubUser, backref="addresses")})
+
+        User()
+        assert um.configured
+        assert sm.configured
+        assert am.configured
+        assert SubUser.addresses
+
+    def test_configure_mappers_configures_all(self):
+        users, User, Keyword, keywords = (self.tables.users,
+                                self.classes.User,
+                                self.classes.Keyword,
+                                self.tables.keywords)
+
+        um = mapper(User, users)
+        km = mapper(Keyword, keywords)
+        User()
+        assert not km.configured
+
+        sa.orm.configure_mappers()
+        assert um.configured
+        assert km.configured
+        assert sa.orm.mapperlib.Mapper._new_mappers is False
+
     def test_configure_on_session(self):
         User, users = self.classes.User, self.tables.users
 
@@ -1207,6 +1207,284 @@ class SliceTest(QueryTest):
         ])
 
 
+class KeysetPageTest(QueryTest, AssertsCompiledSQL):
+    __dialect__ = 'default'
+
+    def test_forward(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        page = q.keyset_page(2)
+        eq_([u.id for u in page], [7, 8])
+        eq_(page.previous_cursor, None)
+
+        page = q.keyset_page(2, after=page.next_cursor)
+        eq_([u.id for u in page], [9, 10])
+        eq_(page.next_cursor, None)
+        assert page.previous_cursor is not None
+
+    def test_backwards(self):
+        User = self.classes.User
+
+        q = create_session().query(User).order_by(User.id)
+        page = q.keyset_page(3)
+        page = q.keyset_page(3, after=page.next_cursor)
+        eq_([u.id for u in page], [10])
+
+        page = q.keyset_page(2, before=page.previous_cursor)
+        eq_([u.id for u in page], [8, 9])
+        assert page.previous_cursor is not None
+
+        page = q.keyset_page(2, before=page.previous_cursor)
+        eq_([u.id for u in page], [7])
+        eq_(page.previous_cursor, None)
+
+        page = q.keyset_page(2, after=page.next_cursor)
+        eq_([u.id for u in page], [8, 9])
+
+    def test_mixed_directions(self):
+        Address = self.classes.Address
+
+        q = create_session().query(Address).\
+                    order_by(Address.user_id.desc(), Address.id)
+        pages = [q.keyset_page(2)]
+        while pages[-1].next_cursor is not None:
+            pages.append(q.keyset_page(2, after=pages[-1].next_cursor))
+        eq_([[a.id for a in page] for page in pages],
+            [[5, 2], [3, 4], [1]])
+
+        page = q.keyset_page(2, before=pages[-1].previous_cursor)
+        eq_([a.id for a in page], [3, 4])
+
+    def test_columns(self):
+        User = self.classes.User
+
+        q = create_session().query(User.id, User.name).order_by(User.name)
+        page = q.keyset_page(2)
+        eq_(page, [(10, 'chuck'), (8, 'ed')])
+        page = q.keyset_page(2, after=page.next_cursor)
+        eq_([row.name for row in page], ['fred', 'jack'])
+
+    def test_joinedload(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        q = create_session().query(User).\
+                    options(joinedload(User.addresses)).order_by(User.id)
+        page = q.keyset_page(1)
+        page = q.keyset_page(2, after=page.next_cursor)
+        eq_(page, [
+                User(id=8, addresses=[Address(id=2), Address(id=3),
+                                            Address(id=4)]),
+                User(id=9, addresses=[Address(id=5)])
+            ])
+
+    def test_criterion(self):
+        from sqlalchemy.orm.query import _KeysetCriterion
+        from sqlalchemy.dialects import postgresql
+        users = self.tables.users
+
+        crit = _KeysetCriterion([users.c.name, users.c.id],
+                                ['ed', 8], [False, False])
+        self.assert_compile(
+            crit,
+            "(users.name > :name_1 OR users.name = :name_2 "
+            "AND users.id > :id_1)"
+        )
+        self.assert_compile(
+            crit,
+            "(users.name, users.id) > (%(param_1)s, %(param_2)s)",
+            dialect=postgresql.dialect()
+        )
+        self.assert_compile(
+            _KeysetCriterion([users.c.name, users.c.id],
+                                ['ed', 8], [True, False]),
+            "(users.name < %(name_1)s OR users.name = %(name_2)s "
+            "AND users.id > %(id_1)s)",
+            dialect=postgresql.dialect()
+        )
+
+    def test_cursor_round_trip(self):
+        import datetime
+        import decimal
+        from sqlalchemy.orm.query import _encode_keyset_cursor, \
+                    _decode_keyset_cursor
+
+        values = [5, 'some name', None,
+                    datetime.datetime(2013, 10, 5, 12, 15, 30, 500),
+                    datetime.date(2013, 10, 5), datetime.time(12, 15, 30),
+                    decimal.Decimal("12.50")]
+        eq_(_decode_keyset_cursor(_encode_keyset_cursor(values)), values)
+
+    def test_cursor_round_trip_utc_offset(self):
+        import datetime
+        from sqlalchemy.orm.query import _encode_keyset_cursor, \
+                    _decode_keyset_cursor, _UTCOffset
+
+        values = [
+                datetime.datetime(2013, 10, 5, 12, 15, 30, 500,
+                                    tzinfo=_UTCOffset(-5 * 3600)),
+                datetime.datetime(2013, 10, 5, 12, 15, 30,
+                                    tzinfo=_UTCOffset(5400)),
+                datetime.time(12, 15, 30, tzinfo=_UTCOffset(3600))]
+        decoded = _decode_keyset_cursor(_encode_keyset_cursor(values))
+        eq_(decoded, values)
+        eq_([value.utcoffset() for value in decoded],
+                [datetime.timedelta(hours=-5),
+                    datetime.timedelta(minutes=90),
+                    datetime.timedelta(hours=1)])
+
+        # a naive datetime stays naive
+        naive, = _decode_keyset_cursor(_encode_keyset_cursor(
+                        [datetime.datetime(2013, 10, 5, 12, 15, 30)]))
+        assert naive.tzinfo is None
+
+    def test_errors(self):
+        User = self.classes.User
+
+        q = create_session().query(User)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            r"Query.keyset_page\(\) requires ORDER BY",
+            q.keyset_page, 2
+        )
+
+        q = q.order_by(User.id)
+        cursor = q.keyset_page(2).next_cursor
+        assert_raises(sa_exc.ArgumentError,
+                q.keyset_page, 2, after=cursor, before=cursor)
+        assert_raises(sa_exc.InvalidRequestError,
+                q.limit(5).keyset_page, 2)
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "Invalid keyset cursor",
+            q.keyset_page, 2, after="foo"
+        )
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "does not match the ORDER BY",
+            q.order_by(User.name).keyset_page, 2, after=cursor
+        )
+
+
+class IterateWindowsTest(QueryTest):
+    def test_basic(self):
+        User = self.classes.User
+
+        sess = create_session()
+        windows = sess.query(User).iterate_windows(3)
+        eq_(
+            [[u.id for u in window] for window in windows],
+            [[7, 8, 9], [10]]
+        )
+
+    def test_filter_and_column(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = create_session()
+        q = sess.query(Address.email_address).\
+                    filter(Address.user_id != 7).\
+                    order_by(Address.id)
+        eq_(
+            list(q.iterate_windows(2, column=Address.id)),
+            [
+                [('ed@wood.com',), ('ed@bettyboop.com',)],
+                [('ed@lala.com',), ('fred@fred.com',)]
+            ]
+        )
+
+    def test_window_count(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User)
+        if testing.db.dialect.supports_window_functions:
+            # one SELECT for all boundaries, plus one per window
+            count = 3
+        else:
+            # one SELECT per boundary plus the final empty one,
+            # plus one per window
+            count = 5
+        self.assert_sql_count(testing.db,
+                    lambda: list(q.iterate_windows(2)), count)
+
+    @testing.requires.window_functions
+    def test_window_function_boundaries(self):
+        User = self.classes.User
+
+        sess = create_session()
+        q = sess.query(User)
+        eq_(
+            [[u.id for u in window] for window in q.iterate_windows(3)],
+            [[7, 8, 9], [10]]
+        )
+
+    def _assert_window_function_windows(self, size, expected):
+        User = self.classes.User
+
+        dialect = testing.db.dialect
+        supports_window_functions = dialect.supports_window_functions
+        dialect.supports_window_functions = True
+        try:
+            q = create_session().query(User)
+            eq_(
+                [[u.id for u in window]
+                        for window in q.iterate_windows(size)],
+                expected
+            )
+        finally:
+            dialect.supports_window_functions = supports_window_functions
+
+    @testing.requires.window_function_syntax
+    def test_window_function_size_one(self):
+        self._assert_window_function_windows(1, [[7], [8], [9], [10]])
+
+    @testing.requires.window_function_syntax
+    def test_window_function_size_exceeds_rowcount(self):
+        self._assert_window_function_windows(10, [[7, 8, 9, 10]])
+
+    def test_size_one(self):
+        User = self.classes.User
+
+        sess = create_session()
+        eq_(
+            [[u.id for u in window]
+                    for window in sess.query(User).iterate_windows(1)],
+            [[7], [8], [9], [10]]
+        )
+
+    def test_expunge(self):
+        User = self.classes.User
+
+        sess = create_session()
+        for window in sess.query(User).iterate_windows(2, expunge=True):
+            eq_(len(sess.identity_map), 2)
+            for user in window:
+                assert user in sess
+
+        sess.expunge_all()
+        windows = list(sess.query(User).iterate_windows(2))
+        eq_(len(sess.identity_map), 4)
+
+    def test_errors(self):
+        User, CompositePk = self.classes.User, self.classes.CompositePk
+
+        sess = create_session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "may not be called on a Query which has LIMIT or OFFSET",
+            sess.query(User).limit(5).iterate_windows, 2
+        )
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "consists of more than one column",
+            sess.query(CompositePk).iterate_windows, 2
+        )
+        assert_raises_message(
+            sa_exc.ArgumentError,
+            "the Query has no mapped entity",
+            sess.query(User.name).iterate_windows, 2
+        )
+
 
 class FilterTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = 'default'
@@ -1768,14 +2046,91 @@ class CountTest(QueryTest):
         self.assert_sql_execution(
                 testing.db,
                 s.query(User).count,
+                CompiledSQL(
+                    "SELECT count(*) AS count_1 FROM users",
+                    {}
+                )
+        )
+
+    def test_no_subquery(self):
+        User, Address = self.classes.User, self.classes.Address
+        s = create_session()
+
+        q = s.query(User).options(joinedload(User.addresses)).\
+                    filter(User.name != 'fred').order_by(User.name)
+        self.assert_sql_execution(
+                testing.db,
+                q.count,
+                CompiledSQL(
+                    "SELECT count(*) AS count_1 FROM users "
+                    "WHERE users.name != :name_1",
+                    {'name_1': 'fred'}
+                )
+        )
+        eq_(q.count(), 3)
+
+        q = s.query(User.name, Address.id).join(User.addresses)
+        self.assert_sql_execution(
+                testing.db,
+                q.count,
+                CompiledSQL(
+                    "SELECT count(*) AS count_1 FROM users "
+                    "JOIN addresses ON users.id = addresses.user_id",
+                    {}
+                )
+        )
+        eq_(q.count(), 5)
+
+    def test_group_by(self):
+        User, Address = self.classes.User, self.classes.Address
+        s = create_session()
+
+        q = s.query(User.id, func.count(Address.id)).\
+                    join(User.addresses).group_by(User.id).\
+                    order_by(User.id)
+        self.assert_sql_execution(
+                testing.db,
+                q.count,
+                CompiledSQL(
+                    "SELECT count(*) AS count_1 FROM (SELECT 1 "
+                    "FROM users JOIN addresses "
+                    "ON users.id = addresses.user_id "
+                    "GROUP BY users.id) AS anon_1",
+                    {}
+                )
+        )
+        eq_(q.count(), 3)
+        eq_(q.having(func.count(Address.id) > 2).count(), 1)
+
+    def test_subquery(self):
+        User = self.classes.User
+        s = create_session()
+
+        q = s.query(User.name).distinct().order_by(User.name)
+        self.assert_sql_execution(
+                testing.db,
+                q.count,
                 CompiledSQL(
                     "SELECT count(*) AS count_1 FROM "
-                    "(SELECT users.id AS users_id, users.name "
-                    "AS users_name FROM users) AS anon_1",
+                    "(SELECT DISTINCT users.name AS users_name "
+                    "FROM users) AS anon_1",
                     {}
                 )
         )
 
+        q = s.query(func.max(User.id))
+        self.assert_sql_execution(
+                testing.db,
+                q.count,
+                CompiledSQL(
+                    "SELECT count(*) AS count_1 FROM "
+                    "(SELECT max(users.id) AS max_1 "
+                    "FROM users) AS anon_1",
+                    {}
+                )
+        )
+        eq_(q.count(), 1)
+
     def test_multiple_entity(self):
         User, Address = self.classes.User, self.classes.Address
 
@@ -1800,7 +2155,7 @@ class CountTest(QueryTest):
         eq_(q.count(), 5)
 
     def test_cols(self):
-        """test that column-based queries always nest."""
+        """test counting of column-based queries."""
 
         User, Address = self.classes.User, self.classes.Address
 
@@ -17,6 +17,7 @@ from sqlalchemy.util import pypy
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy import event, ForeignKey
+from sqlalchemy.testing.mock import patch
 
 class BindTest(_fixtures.FixtureTest):
     run_inserts = None
@@ -451,6 +452,26 @@ class SessionStateTest(_fixtures.FixtureTest):
         assert u in sess.query(User).all()
         assert u not in sess.new
 
+    def test_flush_doesnt_scan_identity_map(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+        sess = Session()
+        sess.add_all([User(name='u%d' % i) for i in range(10)])
+        sess.flush()
+
+        u1 = sess.query(User).filter_by(name='u1').one()
+        with patch.object(sess.identity_map, "all_states") as all_states:
+            u1.name = 'u1modified'
+            eq_(list(sess.dirty), [u1])
+
+            # autoflush, then flush with no changes
+            eq_(sess.query(User).filter_by(name='u1modified').one(), u1)
+            eq_(list(sess.dirty), [])
+            sess.flush()
+        eq_(all_states.mock_calls, [])
+        sess.close()
+
 
     def test_deleted_flag(self):
         users, User = self.tables.users, self.classes.User
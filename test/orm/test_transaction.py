@@ -10,6 +10,7 @@ from sqlalchemy.testing.util import gc_collect
 from sqlalchemy import testing
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import engines
+from sqlalchemy.testing.mock import patch
 from test.orm._fixtures import FixtureTest
 
 
@@ -622,6 +623,32 @@ class CleanSavepointTest(FixtureTest):
                                     synchronize_session='fetch')
         self._run_test(update_fn)
 
+    @testing.requires.savepoints
+    def test_rollback_doesnt_scan_identity_map(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        s = Session(bind=testing.db)
+        u1, u2, u3 = User(name='u1'), User(name='u2'), User(name='u3')
+        s.add_all([u1, u2, u3])
+        s.commit()
+        u1.name
+        u2.name
+        u3.name
+        s.begin_nested()
+        u2.name = 'u2modified'
+        s.flush()
+        u3.name = 'u3modified'
+        with patch.object(s.identity_map, "all_states") as all_states:
+            s.rollback()
+        eq_(all_states.mock_calls, [])
+        eq_(u1.__dict__['name'], 'u1')
+        assert 'name' not in u2.__dict__
+        assert 'name' not in u3.__dict__
+        eq_(u2.name, 'u2')
+        eq_(u3.name, 'u3')
+
 class ContextManagerTest(FixtureTest):
     run_inserts = None
 
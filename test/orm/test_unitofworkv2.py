@@ -10,6 +10,8 @@ from sqlalchemy.orm import mapper, relationship, backref, \
                             Session, class_mapper, sync, exc as orm_exc
 
 from sqlalchemy.testing.assertsql import AllOf, CompiledSQL
+from sqlalchemy.testing.mock import patch
+from sqlalchemy.util import topological
 
 class AssertsUOW(object):
     def _get_test_uow(self, session):
@@ -1323,6 +1325,82 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
             ),
         )
 
+class FlushOrderCacheTest(UOWTest):
+    def _sort_counts(self, fn):
+        with patch.object(topological, "find_cycles",
+                        wraps=topological.find_cycles) as find_cycles, \
+            patch.object(topological, "sort",
+                        wraps=topological.sort) as sort_:
+            fn()
+        return find_cycles.call_count, sort_.call_count
+
+    def test_order_reused(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address),
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+
+        sess.add(User(name='u1', addresses=[Address(email_address='a1')]))
+        eq_(self._sort_counts(sess.flush)[0], 1)
+
+        u2 = User(name='u2', addresses=[Address(email_address='a2')])
+        sess.add(u2)
+        self.assert_sql_execution(
+                testing.db,
+                lambda: eq_(self._sort_counts(sess.flush), (0, 0)),
+                CompiledSQL(
+                    "INSERT INTO users (name) VALUES (:name)",
+                    {'name': 'u2'}
+                ),
+                CompiledSQL(
+                    "INSERT INTO addresses (user_id, email_address) "
+                    "VALUES (:user_id, :email_address)",
+                    lambda ctx: {'email_address': 'a2', 'user_id': u2.id}
+                ),
+            )
+
+        # a different set of actions is sorted separately
+        u1 = sess.query(User).filter_by(name='u1').one()
+        u1.name = 'u1modified'
+        eq_(self._sort_counts(sess.flush)[0], 1)
+
+    def test_cycles_reused(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node)
+        })
+        sess = create_session()
+
+        sess.add(Node(data='n1', children=[Node(data='n11')]))
+        eq_(self._sort_counts(sess.flush)[0], 1)
+
+        n2 = Node(data='n2', children=[Node(data='n21')])
+        sess.add(n2)
+        eq_(self._sort_counts(sess.flush), (0, 0))
+        eq_(n2.children[0].parent_id, n2.id)
+
+    def test_reset_on_configure(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        m = mapper(Node, nodes)
+        sess = create_session()
+        sess.add(Node(data='n1'))
+        sess.flush()
+        assert m._flush_order_cache
+
+        m.add_property('children', relationship(Node))
+        sess.add(Node(data='n2', children=[Node(data='n21')]))
+        sess.flush()
+        eq_(len(m._flush_order_cache), 1)
+
+
 class LoadersUsingCommittedTest(UOWTest):
         """Test that events which occur within a flush()
         get the same attribute loading behavior as on the outside
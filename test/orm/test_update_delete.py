@@ -3,7 +3,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy import Integer, String, ForeignKey, or_, and_, exc, \
     select, func, Boolean, case
 from sqlalchemy.orm import mapper, relationship, backref, Session, \
-    joinedload, aliased
+    joinedload, aliased, attributes
 from sqlalchemy import testing
 
 from sqlalchemy.testing.schema import Table, Column
@@ -450,6 +450,70 @@ class UpdateDeleteTest(fixtures.MappedTest):
                             synchronize_session='fetch')
         assert john not in sess
 
+    @testing.requires.full_returning
+    def test_fetch_uses_returning(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+
+        def go():
+            eq_(sess.query(User).filter(User.age > 29).
+                    update({'age': User.age - 10},
+                    synchronize_session='fetch'), 2)
+            eq_(sess.query(User).filter(User.age < 25).
+                    delete(synchronize_session='fetch'), 0)
+        self.assert_sql_count(testing.db, go, 2)
+
+        assert 'age' not in jack.__dict__
+        assert 'age' not in jane.__dict__
+        eq_(john.__dict__['age'], 25)
+
+        sess.query(User).filter(User.age < 27).\
+                    delete(synchronize_session='fetch')
+        assert john not in sess
+        assert jane in sess
+
+    def test_identity_map_class_index(self):
+        User = self.classes.User
+
+        sess = Session()
+        john, jack, jill, jane = sess.query(User).order_by(User.id).all()
+        eq_(
+            set(sess.identity_map._states_for_class(User)),
+            set(attributes.instance_state(u)
+                    for u in (john, jack, jill, jane))
+        )
+
+        sess.expunge(jack)
+        sess.query(User).filter_by(name='jill').\
+                            delete(synchronize_session='evaluate')
+        eq_(
+            set(sess.identity_map._states_for_class(User)),
+            set(attributes.instance_state(u) for u in (john, jane))
+        )
+
+    def test_identity_map_class_index_replace_gced(self):
+        User = self.classes.User
+
+        sess = Session()
+        john = sess.query(User).filter_by(name='john').one()
+        john_state = attributes.instance_state(john)
+
+        # simulate john having been garbage collected without its
+        # state having been discarded from the identity map yet
+        john_state.obj = lambda: None
+
+        new_john = User()
+        new_state = attributes.instance_state(new_john)
+        new_state.key = john_state.key
+        sess.identity_map.add(new_state)
+
+        assert sess.identity_map[john_state.key] is new_john
+        states = set(sess.identity_map._states_for_class(User))
+        assert new_state in states
+        assert john_state not in states
+
 class UpdateDeleteIgnoresLoadersTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -760,6 +824,21 @@ class InheritTest(fixtures.DeclarativeMappedTest):
             [('e5', ), ('e5', )]
         )
 
+    def test_update_subclass_evaluate(self):
+        Engineer, Manager = self.classes.Engineer, self.classes.Manager
+        s = Session(testing.db)
+        engineers = s.query(Engineer).order_by(Engineer.id).all()
+        managers = s.query(Manager).all()
+
+        s.query(Engineer).filter(Engineer.engineer_name == 'e2').\
+                    update({'engineer_name': 'e5'},
+                    synchronize_session='evaluate')
+
+        def go():
+            eq_([e.engineer_name for e in engineers], ['e1', 'e5'])
+            eq_([m.manager_name for m in managers], ['m1'])
+        self.assert_sql_count(testing.db, go, 0)
+
     @testing.requires.update_from
     def test_update_from(self):
         Engineer = self.classes.Engineer
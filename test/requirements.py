@@ -307,6 +307,28 @@ class DefaultRequirements(SuiteRequirements):
                     "postgresql", "mssql", "oracle"
                 ], "Backend does not support window functions")
 
+    @property
+    def window_function_syntax(self):
+        """Target database accepts window functions, whether or not
+        the dialect makes use of them."""
+
+        return only_if([
+                    "postgresql", "mssql", "oracle",
+                    lambda: against("sqlite") and
+                        self.db.dialect.dbapi.sqlite_version_info >=
+                                (3, 25)
+                ], "Backend does not support window functions")
+
+    @property
+    def full_returning(self):
+        """Target database must support RETURNING for UPDATE and
+        DELETE statements which affect multiple rows."""
+
+        return only_if(
+                lambda: self.config.db.dialect.full_returning and
+                        self.config.db.dialect.implicit_returning,
+                "Backend does not support RETURNING for UPDATE/DELETE")
+
     @property
     def two_phase_transactions(self):
         """Target database must support two-phase transactions."""
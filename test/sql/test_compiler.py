@@ -1337,6 +1337,41 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
                     checkparams={'y': 6, 'x': 5, 'z': 7}
                 )
 
+    def test_text_columns(self):
+        t = text("select id, name from user").columns(
+                    column('id', Integer), column('name'))
+        self.assert_compile(t, "select id, name from user")
+        eq_(t.c.keys(), ['id', 'name'])
+        assert t.c.id.type._type_affinity is Integer
+
+    def test_text_columns_keywords(self):
+        t = text("select id, name from user").columns(
+                    column('id'), name=String)
+        eq_(t.c.keys(), ['id', 'name'])
+        assert t.c.name.type._type_affinity is String
+
+    def test_text_columns_as_from(self):
+        t = text("select id, name from user").columns(
+                    column('id', Integer), column('name')).alias('t')
+        self.assert_compile(
+            select([table1.c.myid, t.c.name]).select_from(
+                table1.join(t, table1.c.myid == t.c.id)
+            ).where(t.c.id > 5),
+            "SELECT mytable.myid, t.name FROM mytable JOIN "
+            "(select id, name from user) AS t ON mytable.myid = t.id "
+            "WHERE t.id > :id_1"
+        )
+
+    def test_text_columns_binds(self):
+        t = text("select id, name from user where id=:id",
+                    bindparams=[bindparam('id', 5)]).columns(
+                    column('id', Integer), column('name'))
+        self.assert_compile(
+            t,
+            "select id, name from user where id=:id",
+            checkparams={'id': 5}
+        )
+
     @testing.emits_warning('.*empty sequence.*')
     def test_render_binds_as_literal(self):
         """test a compiler that renders binds inline into
@@ -3343,6 +3378,32 @@ class ResultMapTest(fixtures.TestBase):
              {'a': ('a', (t.c.a, 'a', 'a'), t.c.a.type)},
         )
 
+    def test_text_columns_populates(self):
+        t = Table('t', MetaData(), Column('a', Integer), Column('b', Integer))
+        stmt = text("select a, b from t").columns(t.c.a, b=String)
+        comp = stmt.compile()
+        b = stmt.column_args[1]
+        eq_(
+            comp.result_map,
+             {'a': ('a', (t.c.a, 'a', 'a'), t.c.a.type),
+             'b': ('b', (b, 'b', 'b'), b.type)}
+        )
+        eq_(
+            [(key, type_) for key, name, objects, type_
+                in comp._result_columns],
+            [('a', t.c.a.type), ('b', b.type)]
+        )
+
+    def test_text_columns_not_toplevel_doesnt_populate(self):
+        t = Table('t', MetaData(), Column('a', Integer), Column('b', Integer))
+        subq = text("select a, b from t").columns(t.c.a, t.c.b).alias()
+        stmt = select([t.c.a]).select_from(t.join(subq, t.c.a == subq.c.a))
+        comp = stmt.compile()
+        eq_(
+            comp.result_map,
+             {'a': ('a', (t.c.a, 'a', 'a'), t.c.a.type)}
+        )
+
     def test_label_plus_element(self):
         t = Table('t', MetaData(), Column('a', Integer))
         l1 = t.c.a.label('bar')
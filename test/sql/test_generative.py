@@ -682,6 +682,31 @@ class ClauseAdapterTest(fixtures.TestBase, AssertsCompiledSQL):
             column("col3"),
             )
 
+    def test_unchanged_elements_shared(self):
+        t1alias = t1.alias('t1alias')
+        vis = sql_util.ClauseAdapter(t1alias)
+
+        t2_crit = t2.c.col2 == 5
+        subq = select([t2.c.col1]).where(t2_crit)
+        crit = and_(t1.c.col1 == subq.as_scalar(), t2_crit)
+        s = select([t1.c.col2]).where(crit)
+
+        s2 = vis.traverse(s)
+        self.assert_compile(s2,
+            "SELECT t1alias.col2 FROM table1 AS t1alias, table2 "
+            "WHERE t1alias.col1 = (SELECT table2.col1 FROM table2 "
+            "WHERE table2.col2 = :col2_1) AND table2.col2 = :col2_1"
+        )
+        assert s2 is not s
+        assert s2._whereclause is not crit
+
+        # structures which contain nothing to be adapted aren't copied
+        assert s2._whereclause.clauses[1] is t2_crit
+        assert s2._whereclause.clauses[0].right.element is subq
+
+        # nothing adapted at all
+        assert vis.traverse(subq) is subq
+
     def test_correlation_on_clone(self):
         t1alias = t1.alias('t1alias')
         t2alias = t2.alias('t2alias')
@@ -697,8 +722,8 @@ class ClauseAdapterTest(fixtures.TestBase, AssertsCompiledSQL):
                             't1alias)')
         s = vis.traverse(s)
 
-        assert t2alias not in s._froms  # not present because it's been
-                                        # cloned
+        assert t2alias in s._froms  # present because nothing within
+                                    # it was adapted, so it isn't cloned
         assert t1alias in s._froms  # present because the adapter placed
                                     # it there
 
@@ -5,7 +5,7 @@ from sqlalchemy.sql import column, desc, asc, literal, collate, null, true, fals
 from sqlalchemy.sql.expression import BinaryExpression, \
                 ClauseList, Grouping, \
                 UnaryExpression, select, union, func, tuple_
-from sqlalchemy.sql import operators, table
+from sqlalchemy.sql import operators, table, bindparam
 import operator
 from sqlalchemy import String, Integer
 from sqlalchemy import exc
@@ -777,6 +777,42 @@ class InTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         self.assert_compile(~self.table1.c.myid.in_([]),
         "mytable.myid = mytable.myid")
 
+    def test_in_expanding(self):
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('q', expanding=True)),
+            "mytable.myid IN ([EXPANDING_q])"
+        )
+
+    def test_in_expanding_positional(self):
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('q', expanding=True)),
+            "mytable.myid IN ([EXPANDING_q])",
+            dialect=sqlite.dialect()
+        )
+
+    def test_in_expanding_literal(self):
+        expr = self.table1.c.myid.in_(bindparam('q', [1, 2], expanding=True))
+        eq_(
+            str(expr.compile(compile_kwargs={"literal_binds": True})),
+            "mytable.myid IN (1, 2)"
+        )
+
+    def test_in_expanding_literal_empty(self):
+        expr = self.table1.c.myid.notin_(bindparam('q', [], expanding=True))
+        eq_(
+            str(expr.compile(compile_kwargs={"literal_binds": True})),
+            "mytable.myid NOT IN (SELECT 1 WHERE 1!=1)"
+        )
+        eq_(
+            str(expr.compile(dialect=oracle.dialect(),
+                                compile_kwargs={"literal_binds": True})),
+            "mytable.myid NOT IN (SELECT 1 FROM DUAL WHERE 1!=1)"
+        )
+
+    def test_in_expanding_type(self):
+        expr = self.table1.c.myid.in_(bindparam('q', expanding=True))
+        is_(expr.right.type._type_affinity, Integer)
+
 
 class MathOperatorTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = 'default'
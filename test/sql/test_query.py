@@ -799,6 +799,136 @@ class QueryTest(fixtures.TestBase):
         eq_(r['query_users.user_name'], "john")
         eq_(list(r.keys()), ["user_id", "user_name"])
 
+    def test_column_accessor_by_position(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        stmt = select([users.c.user_id, users.c.user_name])
+        compiled = stmt.compile(testing.db)
+
+        # the positional records are used without consulting
+        # result_map, as the names in cursor.description match them
+        compiled.result_map = dict(
+            ("x_%s" % key, rec) for key, rec in compiled.result_map.items()
+        )
+        r = testing.db.execute(compiled).first()
+        eq_(r[users.c.user_id], 1)
+        eq_(r[users.c.user_name], "john")
+        eq_(r['user_name'], "john")
+
+    def test_column_accessor_by_position_name_mismatch(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        stmt = select([users.c.user_id, users.c.user_name])
+        compiled = stmt.compile(testing.db)
+
+        # positional records in a different order than the cursor's
+        # columns; names don't line up, so name-based targeting is used
+        compiled._result_columns.reverse()
+        r = testing.db.execute(compiled).first()
+        eq_(r[users.c.user_id], 1)
+        eq_(r[users.c.user_name], "john")
+        eq_(r['user_id'], 1)
+        eq_(r['user_name'], "john")
+
+    def test_column_accessor_by_position_dupe_names(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        ua = users.alias()
+        r = select([users.c.user_id, ua.c.user_id]).\
+                    where(users.c.user_id == ua.c.user_id).\
+                    execute().first()
+
+        # names are ambiguous, so name-based targeting is used
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Ambiguous column name",
+            lambda: r[users.c.user_id]
+        )
+        eq_(r[0], 1)
+
+    def test_column_position(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        r = select([users.c.user_name, users.c.user_id]).execute().first()
+
+        index, processor = r._parent._position(users.c.user_id)
+        eq_(index, 1)
+        eq_(r._row[index], 1)
+        eq_(r._parent._position(addresses.c.user_id), None)
+
+        ua = users.alias()
+        r = select([users.c.user_id, ua.c.user_id]).\
+                    where(users.c.user_id == ua.c.user_id).\
+                    execute().first()
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "Ambiguous column name",
+            r._parent._position, users.c.user_id
+        )
+
+    def test_text_columns_typed(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+
+        class MyType(TypeDecorator):
+            impl = String
+
+            def process_result_value(self, value, dialect):
+                return "BIND_IN" + value
+
+        stmt = text("select user_id, user_name from query_users").\
+                    columns(users.c.user_id, user_name=MyType)
+        with testing.db.connect() as conn:
+            r = conn.execute(stmt).first()
+            eq_(r[users.c.user_id], 1)
+            eq_(r['user_name'], "BIND_INjohn")
+            eq_(r[stmt.c.user_name], "BIND_INjohn")
+
+    def test_text_columns_by_keyword(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        # keyword columns have no order; they're matched by name
+        # regardless of the order in which they're given
+        for stmt in [
+            text("select user_id, user_name from query_users").\
+                    columns(user_id=Integer, user_name=String),
+            text("select user_name, user_id from query_users").\
+                    columns(user_id=Integer, user_name=String),
+            text("select user_name, user_id from query_users").\
+                    columns(sql.column('user_id'), user_name=String),
+        ]:
+            with testing.db.connect() as conn:
+                for i in range(2):
+                    row = conn.execute(stmt).first()
+                    eq_(row['user_id'], 1)
+                    eq_(row['user_name'], 'john')
+                    eq_(row[stmt.c.user_id], 1)
+                    eq_(row[stmt.c.user_name], 'john')
+
+    def test_text_columns_by_position(self):
+        users.insert().execute(
+            dict(user_id=1, user_name='john'),
+        )
+        # the names given don't match those in cursor.description;
+        # the columns are targeted by position
+        stmt = text("select user_id, user_name from query_users").\
+                    columns(sql.column('uid', Integer),
+                            sql.column('uname', String))
+        with testing.db.connect() as conn:
+            compiled = stmt.compile(conn)
+            r1 = conn.execute(compiled)
+            eq_(r1.first()['uname'], 'john')
+            r2 = conn.execute(compiled)
+            row = r2.first()
+            eq_(row[stmt.c.uid], 1)
+            assert r1._metadata is r2._metadata
+
     def test_column_accessor_labels_w_dots(self):
         users.insert().execute(
             dict(user_id=1, user_name='john'),
@@ -1231,6 +1361,72 @@ class QueryTest(fixtures.TestBase):
         r = s.execute().fetchall()
         assert len(r) == 1
 
+    def test_expanding_in(self):
+        testing.db.execute(users.insert(), [
+            dict(user_id=7, user_name='jack'),
+            dict(user_id=8, user_name='fred'),
+            dict(user_id=9, user_name=None)
+        ])
+
+        with testing.db.connect() as conn:
+            stmt = select([users]).where(
+                users.c.user_name.in_(bindparam('uname', expanding=True))
+            ).order_by(users.c.user_id)
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack']}).fetchall(),
+                [(7, 'jack')]
+            )
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack', 'fred']}).fetchall(),
+                [(7, 'jack'), (8, 'fred')]
+            )
+
+            eq_(
+                conn.execute(stmt, {"uname": []}).fetchall(),
+                []
+            )
+
+    def test_expanding_in_repeated(self):
+        testing.db.execute(users.insert(), [
+            dict(user_id=7, user_name='jack'),
+            dict(user_id=8, user_name='fred'),
+            dict(user_id=9, user_name=None)
+        ])
+
+        with testing.db.connect() as conn:
+            stmt = select([users]).where(
+                users.c.user_name.in_(bindparam('uname', expanding=True))
+            ).where(
+                users.c.user_id.notin_(bindparam('uid', expanding=True))
+            ).where(
+                users.c.user_name != bindparam('uname2')
+            ).order_by(users.c.user_id)
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack', 'fred'],
+                                    "uid": [9], "uname2": 'fred'}
+                ).fetchall(),
+                [(7, 'jack')]
+            )
+
+            eq_(
+                conn.execute(stmt, {"uname": ['jack', 'fred'],
+                                    "uid": [], "uname2": 'ed'}
+                ).fetchall(),
+                [(7, 'jack'), (8, 'fred')]
+            )
+
+    def test_expanding_in_executemany(self):
+        stmt = users.delete().where(
+                users.c.user_name.in_(bindparam('uname', expanding=True)))
+        assert_raises_message(
+            exc.StatementError,
+            "'expanding' parameters can't be used with executemany()",
+            testing.db.execute, stmt, [{"uname": ['jack']}, {"uname": []}]
+        )
+
 class RequiredBindTest(fixtures.TablesTest):
     run_create_tables = None
     run_deletes = None
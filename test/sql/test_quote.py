@@ -5,6 +5,7 @@ from sqlalchemy.testing import fixtures, AssertsCompiledSQL, eq_
 from sqlalchemy import testing
 from sqlalchemy.sql.elements import quoted_name, _truncated_label, _anonymous_label
 from sqlalchemy.testing.util import picklers
+from sqlalchemy.engine import default
 
 class QuoteTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = 'default'
@@ -627,6 +628,31 @@ class QuoteTest(fixtures.TestBase, AssertsCompiledSQL):
             'SELECT "t2".x AS "t2_x" FROM "t2"'
         )
 
+    def test_quote_flag_table_name_cache(self):
+        # the same dialect renders both tables; the rendered
+        # name of one must not be reused for the other
+        dialect = default.DefaultDialect()
+        m = MetaData()
+        t1 = Table('t', m, Column('x', Integer), schema='s')
+        t2 = Table('t', MetaData(), Column('x', Integer),
+                        schema=quoted_name('s', True), quote=True)
+
+        self.assert_compile(
+            select([t1.c.x]),
+            'SELECT s.t.x FROM s.t',
+            dialect=dialect
+        )
+        self.assert_compile(
+            select([t2.c.x]),
+            'SELECT "s"."t".x FROM "s"."t"',
+            dialect=dialect
+        )
+        self.assert_compile(
+            select([t1.c.x]),
+            'SELECT s.t.x FROM s.t',
+            dialect=dialect
+        )
+
 class PreparerTest(fixtures.TestBase):
     """Test the db-agnostic quoting services of IdentifierPreparer."""
 